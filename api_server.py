@@ -8,18 +8,55 @@ Run with: python api_server.py
 Server runs on: http://localhost:5000
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from risk_scorer import process_form_submission, RiskScorer, TEST_CASES
+from risk_scorer import process_form_submission, get_scorer, analysis_failed, TEST_CASES
+
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend requests
 
+# Compress JSON responses on the fly when Flask-Compress is installed
+if Compress is not None:
+    app.config.update(COMPRESS_MIMETYPES=['application/json'], COMPRESS_LEVEL=6, COMPRESS_MIN_SIZE=512)
+    Compress(app)
+
+# Encode responses with orjson when it is installed; jsonify() then goes
+# through it for every RiskReport payload.
+if orjson is not None:
+    class ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+
+# The health payload never changes; encode it once instead of on every probe
+_HEALTH_BODY = app.json.dumps({"status": "ok", "service": "Sherlock Homes API"}).encode('utf-8')
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "ok", "service": "Sherlock Homes API"})
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 @app.route('/api/score', methods=['POST'])
@@ -60,21 +97,34 @@ def score_application():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+def _cacheable(response, reports):
+    """
+    Let clients cache a scored test-case response.
+
+    Reports for the static test cases are cached per process, so the body
+    only changes with the scorer; browsers revalidate with the ETag. A
+    response with a failed AI analysis is left uncacheable so it is retried.
+    """
+    if any(analysis_failed(report) for report in reports):
+        return response
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
+
+
 @app.route('/api/test-cases', methods=['GET'])
 def get_test_cases():
     """Get all test cases with their scores."""
     try:
-        scorer = RiskScorer()
-        results = []
-
-        for case in TEST_CASES:
-            report = scorer.score_application(case)
-            results.append({
-                "case": case,
-                "report": report.to_dict()
-            })
+        scorer = get_scorer()
+        reports = scorer.score_all_test_cases()
+        results = [
+            {"case": case, "report": report}
+            for case, report in zip(TEST_CASES, reports)
+        ]
 
-        return jsonify({"status": "success", "results": results})
+        return _cacheable(jsonify({"status": "success", "results": results}), reports)
 
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -89,14 +139,14 @@ def get_test_case(case_id):
         if not case:
             return jsonify({"status": "error", "message": f"Case {case_id} not found"}), 404
 
-        scorer = RiskScorer()
-        report = scorer.score_application(case)
+        scorer = get_scorer()
+        report = scorer.score_test_case(case)
 
-        return jsonify({
+        return _cacheable(jsonify({
             "status": "success",
             "case": case,
-            "report": report.to_dict()
-        })
+            "report": report
+        }), [report])
 
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
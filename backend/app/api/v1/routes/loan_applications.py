@@ -50,7 +50,7 @@ async def create_loan_application(
     start_time = time.time()
     application_id = f"LN-{datetime.now().year}-{str(uuid.uuid4())[:8]}"
 
-    logger.info(f"Processing loan application {application_id} for {application.applicant.full_name}")
+    logger.info("Processing loan application %s for %s", application_id, application.applicant.full_name)
 
     try:
         # Initialize AI Agent Service
@@ -76,15 +76,18 @@ async def create_loan_application(
             ai_risk_score = ai_summary.get("ai_risk_score")
             if ai_risk_score is not None and isinstance(ai_risk_score, (int, float)):
                 risk_score = int(ai_risk_score)
-                logger.info(f"Using AI-determined risk score: {risk_score} (calculated was {risk_assessment.risk_score if risk_assessment else 'N/A'})")
+                logger.info(
+                    "Using AI-determined risk score: %s (calculated was %s)",
+                    risk_score, risk_assessment.risk_score if risk_assessment else 'N/A'
+                )
             else:
                 # Fallback to calculated score
                 risk_score = risk_assessment.risk_score if risk_assessment else 50
-                logger.info(f"Using calculated risk score: {risk_score} (AI score not available)")
+                logger.info("Using calculated risk score: %s (AI score not available)", risk_score)
         except Exception as e:
             # Fallback to calculated score on any error
             risk_score = risk_assessment.risk_score if risk_assessment else 50
-            logger.warning(f"Error extracting AI risk score: {str(e)}. Using calculated score: {risk_score}")
+            logger.warning("Error extracting AI risk score: %s. Using calculated score: %s", e, risk_score)
 
         # Determine status based on risk score
         if risk_score <= 35:
@@ -132,12 +135,12 @@ async def create_loan_application(
             "full_response": response.dict()
         })
 
-        logger.info(f"Successfully processed application {application_id} in {processing_time:.2f}s")
+        logger.info("Successfully processed application %s in %.2fs", application_id, processing_time)
 
         return response
 
     except Exception as e:
-        logger.error(f"Error processing application {application_id}: {str(e)}")
+        logger.error("Error processing application %s: %s", application_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing loan application: {str(e)}"
@@ -251,7 +254,7 @@ async def update_status(
             detail="Failed to update application status"
         )
 
-    logger.info(f"Application {application_id} status changed: {old_status} -> {request.status}")
+    logger.info("Application %s status changed: %s -> %s", application_id, old_status, request.status)
 
     return StatusUpdateResponse(
         application_id=application_id,
@@ -6,7 +6,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.api import api_router
 from app.config import settings
-from app.utils.logger import logger
+from app.utils.logger import logger, configure_logging
 
 app = FastAPI(
     title="Sherlocke Homes API",
@@ -32,8 +32,9 @@ app.include_router(api_router, prefix="/api/v1")
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup"""
+    configure_logging()
     logger.info("Starting Sherlocke Homes API...")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
+    logger.info("Environment: %s", settings.ENVIRONMENT)
 
 
 @app.on_event("shutdown")
@@ -17,6 +17,7 @@ from app.services.feature_extractor import FeatureExtractor
 from app.services.profile_analyzer import analyze_multiple_profiles
 from app.utils.logger import logger
 from typing import Dict, Any, List
+import asyncio
 import json
 
 
@@ -53,13 +54,14 @@ class AIAgentService:
         3. Calculate risk assessment based on Big 3 + Fourth Factor
         4. Check compliance with regulations
         """
-        logger.info(f"Starting analysis for application {application_id}")
+        logger.info("Starting analysis for application %s", application_id)
 
         # Step 1: Gather profile data using Joseph's profile_analyzer (Fourth Factor)
         gathered_data, ml_features = await self._gather_profile_data(application)
 
-        # Step 2: Calculate risk assessment (enhanced with ML features from Fourth Factor)
-        risk_assessment = await self.risk_calculator.calculate_risk(
+        # Step 2: Calculate risk assessment (enhanced with ML features from Fourth Factor).
+        # Pure, memoized arithmetic, so it runs inline rather than as a coroutine.
+        risk_assessment = self.risk_calculator.calculate_risk(
             application=application,
             gathered_data=gathered_data
         )
@@ -104,9 +106,9 @@ class AIAgentService:
 
         if profile_urls and settings.PERPLEXITY_API_KEY:
             try:
-                logger.info(f"Analyzing {len(profile_urls)} social media profiles")
-                # Use Joseph's profile analyzer
-                multi_analysis = analyze_multiple_profiles(profile_urls)
+                logger.info("Analyzing %d social media profiles", len(profile_urls))
+                # Use Joseph's profile analyzer (blocking HTTP, so keep it off the event loop)
+                multi_analysis = await asyncio.to_thread(analyze_multiple_profiles, profile_urls)
 
                 # Extract ML features using Joseph's feature_extractor
                 features = self.feature_extractor.extract_all_features(
@@ -126,10 +128,10 @@ class AIAgentService:
                 )
 
                 ml_features = features.to_model_input()
-                logger.info(f"Extracted {len(ml_features)} ML features from profiles")
+                logger.info("Extracted %d ML features from profiles", len(ml_features))
 
             except Exception as e:
-                logger.warning(f"Profile analysis failed: {str(e)}. Using web search fallback.")
+                logger.warning("Profile analysis failed: %s. Using web search fallback.", e)
                 gathered_data, ml_features = self._fallback_with_search(application, traditional_data)
         else:
             # No profiles provided or Perplexity key missing - try web search
@@ -167,7 +169,7 @@ class AIAgentService:
 
         # Check if search was successful
         if hasattr(features.professional, 'search_based') and features.professional.search_based:
-            logger.info(f"Web search successful for {application.applicant.full_name}")
+            logger.info("Web search successful for %s", application.applicant.full_name)
 
             # Build professional insights summary
             prof = features.professional
@@ -223,7 +225,7 @@ class AIAgentService:
                 additional_findings=f"Searched public web sources for {application.applicant.full_name}. Found professional information via web search."
             )
         else:
-            logger.info(f"No web search results for {application.applicant.full_name} - using traditional data only")
+            logger.info("No web search results for %s - using traditional data only", application.applicant.full_name)
             gathered_data = GatheredData(
                 sources=["Traditional underwriting data only"],
                 additional_findings="No social media profiles provided and web search did not return results. Risk assessment based on traditional factors only."
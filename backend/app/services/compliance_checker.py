@@ -34,7 +34,7 @@ class ComplianceCheckerService:
         Check compliance with Fannie Mae and Freddie Mac guidelines
         Returns: (ComplianceCheck, AI summary with score)
         """
-        logger.info(f"Checking compliance for {application.applicant.full_name}")
+        logger.info("Checking compliance for %s", application.applicant.full_name)
 
         try:
             # Use Claude to analyze compliance AND generate summary with risk score
@@ -45,7 +45,7 @@ class ComplianceCheckerService:
             return compliance_result, ai_summary
 
         except Exception as e:
-            logger.error(f"Error checking compliance: {str(e)}")
+            logger.error("Error checking compliance: %s", e)
             # Return basic compliance check as fallback with no AI score
             return self._basic_compliance_check(application, risk_assessment), {}
 
@@ -141,7 +141,7 @@ Return a JSON response with TWO sections:
                 raise ValueError("No JSON found in response")
 
         except Exception as e:
-            logger.error(f"Error in AI compliance analysis: {str(e)}")
+            logger.error("Error in AI compliance analysis: %s", e)
             return self._basic_compliance_check(application, risk_assessment), {}
 
     def _basic_compliance_check(
@@ -12,48 +12,173 @@ Usage:
 """
 
 import argparse
+import copy
 import json
+import logging
 import os
 import re
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file in project root
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(env_path)
 
+# Child of the API's "sherlocke_homes" logger so progress messages share its
+# handler; the CLI configures its own console output in main().
+logger = logging.getLogger("sherlocke_homes.profile_analyzer")
+
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
 PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
 
+# Token budgets for the combined-summary request. Perplexity bills and
+# rate-limits by tokens, so profile excerpts are trimmed by an estimated
+# token count (~4 characters per token for English text) rather than a
+# fixed character slice.
+CHARS_PER_TOKEN = 4
+PROFILE_EXCERPT_TOKENS = 400
+COMBINED_CONTEXT_TOKENS = 4000
+
+# Upper bound on simultaneous Perplexity requests from analyze_multiple_profiles
+MAX_CONCURRENT_PROFILE_REQUESTS = 5
+
+
+@lru_cache(maxsize=4)
+def _api_headers(api_key: str) -> Dict[str, str]:
+    """Request headers for a Perplexity API key, built once per key."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON response body, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Shared session so repeated Perplexity calls reuse keep-alive connections
+# instead of paying a TCP + TLS handshake per request. The pool is sized for
+# concurrent profile analyses from several applications at once.
+# Rate limits (429) and transient 5xx responses are retried with exponential
+# backoff, honoring Retry-After; the last response is returned as-is so
+# raise_for_status() still reports persistent failures.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
+
+
+# One pass over the URL identifies the platform and captures the username
+_PROFILE_URL_RE = re.compile(
+    r"linkedin\.com/in/(?P<linkedin>[^/?]+)"
+    r"|instagram\.com/(?P<instagram>[^/?]+)"
+    r"|(?:twitter|x)\.com/(?P<twitter>[^/?]+)"
+    r"|tiktok\.com/@(?P<tiktok>[^/?]+)"
+    r"|facebook\.com/(?P<facebook>[^/?]+)",
+    re.IGNORECASE
+)
+_TRAILING_DIGITS_RE = re.compile(r"\s*\d+$")
+
+# Domain -> platform in one pass; group names are Platform values
+_PLATFORM_RE = re.compile(
+    r"(?P<linkedin>linkedin\.com)"
+    r"|(?P<instagram>instagram\.com)"
+    r"|(?P<twitter>twitter\.com|x\.com)"
+    r"|(?P<facebook>facebook\.com|fb\.com)"
+    r"|(?P<tiktok>tiktok\.com)",
+    re.IGNORECASE
+)
+
+
+# Section and score patterns for parsing model output, compiled once
+_RED_FLAG_RES = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"red flags?[:\s]*\n(.*?)(?=\n\n|\npositive|\n\*\*|$)",
+    r"\*\*red flags?\*\*[:\s]*\n(.*?)(?=\n\n|\npositive|\n\*\*|$)",
+))
+_POSITIVE_RES = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"positive indicators?[:\s]*\n(.*?)(?=\n\n|\nred|\n\*\*|$)",
+    r"\*\*positive indicators?\*\*[:\s]*\n(.*?)(?=\n\n|\nred|\n\*\*|$)",
+))
+
+# Section summary field -> (paragraph keywords, trigger words that must
+# appear somewhere for the section to be reported)
+_SECTION_KEYWORDS = (
+    ("professional_summary", frozenset({"professional", "employment", "career", "work"}),
+     frozenset({"professional", "employment", "career"})),
+    ("lifestyle_summary", frozenset({"lifestyle", "spending", "living", "travel"}),
+     frozenset({"lifestyle", "spending", "living"})),
+    ("social_summary", frozenset({"social", "connect", "network", "community"}),
+     frozenset({"social", "connect", "network"})),
+)
+# Every distinct keyword, so each is searched for once per paragraph
+_ALL_SECTION_KEYWORDS = tuple(sorted(frozenset().union(*(keywords for _, keywords, _ in _SECTION_KEYWORDS))))
+
+# Score keywords and numbers, tokenized in one pass by _extract_scores
+_SCORE_TOKEN_RE = re.compile(
+    r"(?P<kind>professional|lifestyle|social|consistency)|(?P<number>\d+)",
+    re.IGNORECASE
+)
+_SCORE_FIELDS = {
+    "professional": "overall_professional_score",
+    "lifestyle": "overall_lifestyle_score",
+    "social": "overall_social_score",
+    "consistency": "consistency_score",
+}
+
 
 def extract_name_from_url(url: str) -> Optional[str]:
     """Extract a person's name from a social media URL."""
-    url_lower = url.lower()
+    match = _PROFILE_URL_RE.search(url)
+    if not match:
+        return None
 
-    # LinkedIn: /in/firstname-lastname/ or /in/firstnamelastname/
-    if "linkedin.com/in/" in url_lower:
-        match = re.search(r'linkedin\.com/in/([^/?]+)', url, re.IGNORECASE)
-        if match:
-            username = match.group(1).strip('/')
-            # Convert hyphens/underscores to spaces and title case
-            name = username.replace('-', ' ').replace('_', ' ')
-            # Remove numbers at the end (like "john-doe-123")
-            name = re.sub(r'\s*\d+$', '', name)
-            return name.title()
+    username = match.group(match.lastgroup)
 
-    # Instagram/Twitter/TikTok: /@username or /username
-    for platform in ['instagram.com/', 'twitter.com/', 'x.com/', 'tiktok.com/@', 'facebook.com/']:
-        if platform in url_lower:
-            match = re.search(rf'{re.escape(platform)}([^/?]+)', url, re.IGNORECASE)
-            if match:
-                return match.group(1).strip('/')
+    # LinkedIn: /in/firstname-lastname/ or /in/firstnamelastname/
+    if match.lastgroup == "linkedin":
+        # Convert hyphens/underscores to spaces and title case
+        name = username.replace('-', ' ').replace('_', ' ')
+        # Remove numbers at the end (like "john-doe-123")
+        name = _TRAILING_DIGITS_RE.sub('', name)
+        return name.title()
 
-    return None
+    # Instagram/Twitter/TikTok/Facebook: /@username or /username
+    return username
 
 
 def search_person_info(
@@ -106,11 +231,6 @@ Search query to use: {search_query}
 If information is not found, explicitly state "Not found" for that field.
 Distinguish between verified facts and inferences."""
 
-    headers = {
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
     # Use sonar-pro for better search results
     payload = {
         "model": "sonar",
@@ -126,15 +246,15 @@ Distinguish between verified facts and inferences."""
     }
 
     try:
-        response = requests.post(
+        response = _http.post(
             PERPLEXITY_API_URL,
-            headers=headers,
-            json=payload,
+            headers=_api_headers(PERPLEXITY_API_KEY),
+            data=_json_bytes(payload),
             timeout=90
         )
         response.raise_for_status()
 
-        result = response.json()
+        result = _json_loads(response.content)
         raw_analysis = result["choices"][0]["message"]["content"]
         citations = result.get("citations", [])
 
@@ -287,7 +407,11 @@ PLATFORM_FEATURES = {
 }
 
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ProfileAnalysis:
     """Structured analysis results for a single profile."""
     url: str
@@ -310,10 +434,21 @@ class ProfileAnalysis:
             self.citations = []
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "url": self.url,
+            "platform": self.platform,
+            "status": self.status,
+            "professional_summary": self.professional_summary,
+            "lifestyle_summary": self.lifestyle_summary,
+            "social_summary": self.social_summary,
+            "red_flags": self.red_flags,
+            "positive_indicators": self.positive_indicators,
+            "raw_analysis": self.raw_analysis,
+            "citations": self.citations,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MultiProfileAnalysis:
     """Combined analysis across multiple social media profiles."""
     profiles: List[ProfileAnalysis]
@@ -344,22 +479,11 @@ class MultiProfileAnalysis:
         }
 
 
+@lru_cache(maxsize=1024)
 def detect_platform(url: str) -> Platform:
     """Detect the social media platform from a URL."""
-    url_lower = url.lower()
-
-    if "linkedin.com" in url_lower:
-        return Platform.LINKEDIN
-    elif "instagram.com" in url_lower:
-        return Platform.INSTAGRAM
-    elif "twitter.com" in url_lower or "x.com" in url_lower:
-        return Platform.TWITTER
-    elif "facebook.com" in url_lower or "fb.com" in url_lower:
-        return Platform.FACEBOOK
-    elif "tiktok.com" in url_lower:
-        return Platform.TIKTOK
-    else:
-        return Platform.UNKNOWN
+    match = _PLATFORM_RE.search(url)
+    return Platform(match.lastgroup) if match else Platform.UNKNOWN
 
 
 def build_analysis_prompt(
@@ -368,7 +492,17 @@ def build_analysis_prompt(
     custom_features: List[str] = None
 ) -> str:
     """Build an analysis prompt based on platform and mode."""
+    if custom_features and mode != AnalysisMode.COMPREHENSIVE:
+        return _render_analysis_prompt(platform, mode, custom_features)
+    return _DEFAULT_PROMPTS[(platform, mode)]
 
+
+def _render_analysis_prompt(
+    platform: Platform,
+    mode: AnalysisMode,
+    custom_features: List[str] = None
+) -> str:
+    """Render the prompt text for a platform, mode and optional feature list."""
     if mode == AnalysisMode.COMPREHENSIVE:
         # Combine all modes for this platform
         all_features = []
@@ -414,12 +548,81 @@ Provide a structured analysis with clear sections. Note explicitly if informatio
     return prompt
 
 
+# Default prompts depend only on (platform, mode), so render every pair once
+_DEFAULT_PROMPTS: Dict[Tuple[Platform, AnalysisMode], str] = {
+    (platform, mode): _render_analysis_prompt(platform, mode)
+    for platform in Platform
+    for mode in AnalysisMode
+}
+
+
+# Successful analyses keyed by (url, platform, prompt). Profiles change
+# slowly, so repeat requests within the TTL are served without calling the
+# API; entries are evicted least-recently-used beyond the size cap.
+PROFILE_CACHE_TTL_SECONDS = 3600
+PROFILE_CACHE_MAX_ENTRIES = 256
+_profile_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, ProfileAnalysis]]" = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+
+def _get_cached_analysis(key: Tuple[str, str, str]) -> Optional[ProfileAnalysis]:
+    """Return a copy of a fresh cached analysis, or None."""
+    with _profile_cache_lock:
+        entry = _profile_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, analysis = entry
+        if time.monotonic() - stored_at > PROFILE_CACHE_TTL_SECONDS:
+            del _profile_cache[key]
+            return None
+        _profile_cache.move_to_end(key)
+    return copy.deepcopy(analysis)
+
+
+def _cache_analysis(key: Tuple[str, str, str], analysis: ProfileAnalysis) -> None:
+    """Store a copy of a successful analysis."""
+    with _profile_cache_lock:
+        _profile_cache[key] = (time.monotonic(), copy.deepcopy(analysis))
+        _profile_cache.move_to_end(key)
+        while len(_profile_cache) > PROFILE_CACHE_MAX_ENTRIES:
+            _profile_cache.popitem(last=False)
+
+
+def clear_profile_cache() -> None:
+    """Drop all cached profile analyses."""
+    with _profile_cache_lock:
+        _profile_cache.clear()
+
+
+def _read_stream(response: requests.Response, on_delta: Callable[[str], None]) -> Tuple[str, List[str]]:
+    """Collect a streamed (server-sent events) completion, reporting each text chunk."""
+    parts = []
+    citations = []
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            # Keep reading to the end of the body so the pooled connection is
+            # released for reuse instead of discarded
+            continue
+        chunk = _json_loads(data)
+        delta = chunk["choices"][0].get("delta", {}).get("content")
+        if delta:
+            parts.append(delta)
+            on_delta(delta)
+        # Perplexity repeats the citation list on each chunk
+        citations = chunk.get("citations") or citations
+    return "".join(parts), citations
+
+
 def analyze_profile(
     url: str,
     prompt: str = None,
     features: List[str] = None,
     mode: AnalysisMode = AnalysisMode.COMPREHENSIVE,
-    platform: Platform = None
+    platform: Platform = None,
+    on_delta: Optional[Callable[[str], None]] = None
 ) -> ProfileAnalysis:
     """
     Analyze a social media profile using Perplexity Sonar API.
@@ -430,6 +633,7 @@ def analyze_profile(
         features: List of specific features to look for (optional)
         mode: Analysis mode (professional, lifestyle, social, comprehensive)
         platform: Platform override (auto-detected if not provided)
+        on_delta: Called with each chunk of analysis text as it streams in (optional)
 
     Returns:
         ProfileAnalysis dataclass with structured results
@@ -454,12 +658,15 @@ def analyze_profile(
     else:
         analysis_prompt = build_analysis_prompt(detected_platform, mode)
 
-    # Prepare the API request
-    headers = {
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
-    }
+    # The prompt captures mode, features and any custom instructions
+    cache_key = (url, detected_platform.value, analysis_prompt)
+    cached = _get_cached_analysis(cache_key)
+    if cached is not None:
+        if on_delta is not None:
+            on_delta(cached.raw_analysis)
+        return cached
 
+    # Prepare the API request
     system_prompt = """You are an expert profile analyst for mortgage underwriting risk assessment.
 Your job is to extract factual, objective information from social media profiles.
 Focus on indicators of financial stability, employment consistency, lifestyle patterns, and social connectedness.
@@ -476,19 +683,27 @@ If a profile is private or information is unavailable, state that explicitly."""
         "temperature": 0.2,
         "max_tokens": 3000
     }
+    if on_delta is not None:
+        payload["stream"] = True
 
     try:
-        response = requests.post(
+        # Closing the response returns (or, after a failure mid-stream,
+        # discards) its pooled connection
+        with _http.post(
             PERPLEXITY_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=90
-        )
-        response.raise_for_status()
-
-        result = response.json()
-        raw_analysis = result["choices"][0]["message"]["content"]
-        citations = result.get("citations", [])
+            headers=_api_headers(PERPLEXITY_API_KEY),
+            data=_json_bytes(payload),
+            timeout=90,
+            stream=on_delta is not None
+        ) as response:
+            response.raise_for_status()
+
+            if on_delta is not None:
+                raw_analysis, citations = _read_stream(response, on_delta)
+            else:
+                result = _json_loads(response.content)
+                raw_analysis = result["choices"][0]["message"]["content"]
+                citations = result.get("citations", [])
 
         # Parse the analysis into structured sections
         analysis = ProfileAnalysis(
@@ -501,6 +716,7 @@ If a profile is private or information is unavailable, state that explicitly."""
 
         # Extract sections from the analysis
         analysis = _parse_analysis_sections(analysis, raw_analysis)
+        _cache_analysis(cache_key, analysis)
 
         return analysis
 
@@ -518,7 +734,7 @@ If a profile is private or information is unavailable, state that explicitly."""
             status="error",
             raw_analysis=f"Request failed: {str(e)}"
         )
-    except (KeyError, IndexError) as e:
+    except (KeyError, IndexError, ValueError) as e:
         return ProfileAnalysis(
             url=url,
             platform=detected_platform.value,
@@ -529,15 +745,9 @@ If a profile is private or information is unavailable, state that explicitly."""
 
 def _parse_analysis_sections(analysis: ProfileAnalysis, raw_text: str) -> ProfileAnalysis:
     """Parse raw analysis text into structured sections."""
-    text_lower = raw_text.lower()
-
     # Try to extract red flags
-    red_flag_patterns = [
-        r"red flags?[:\s]*\n(.*?)(?=\n\n|\npositive|\n\*\*|$)",
-        r"\*\*red flags?\*\*[:\s]*\n(.*?)(?=\n\n|\npositive|\n\*\*|$)",
-    ]
-    for pattern in red_flag_patterns:
-        match = re.search(pattern, raw_text, re.IGNORECASE | re.DOTALL)
+    for pattern in _RED_FLAG_RES:
+        match = pattern.search(raw_text)
         if match:
             flags_text = match.group(1)
             flags = [f.strip().lstrip("-•* ") for f in flags_text.split("\n") if f.strip() and f.strip() != "None"]
@@ -545,12 +755,8 @@ def _parse_analysis_sections(analysis: ProfileAnalysis, raw_text: str) -> Profil
             break
 
     # Try to extract positive indicators
-    positive_patterns = [
-        r"positive indicators?[:\s]*\n(.*?)(?=\n\n|\nred|\n\*\*|$)",
-        r"\*\*positive indicators?\*\*[:\s]*\n(.*?)(?=\n\n|\nred|\n\*\*|$)",
-    ]
-    for pattern in positive_patterns:
-        match = re.search(pattern, raw_text, re.IGNORECASE | re.DOTALL)
+    for pattern in _POSITIVE_RES:
+        match = pattern.search(raw_text)
         if match:
             pos_text = match.group(1)
             positives = [p.strip().lstrip("-•* ") for p in pos_text.split("\n") if p.strip() and p.strip() != "None"]
@@ -558,26 +764,35 @@ def _parse_analysis_sections(analysis: ProfileAnalysis, raw_text: str) -> Profil
             break
 
     # Extract section summaries based on content
-    if "professional" in text_lower or "employment" in text_lower or "career" in text_lower:
-        analysis.professional_summary = _extract_section(raw_text, ["professional", "employment", "career", "work"])
-
-    if "lifestyle" in text_lower or "spending" in text_lower or "living" in text_lower:
-        analysis.lifestyle_summary = _extract_section(raw_text, ["lifestyle", "spending", "living", "travel"])
-
-    if "social" in text_lower or "connect" in text_lower or "network" in text_lower:
-        analysis.social_summary = _extract_section(raw_text, ["social", "connect", "network", "community"])
+    for field, summary in _extract_sections(raw_text).items():
+        setattr(analysis, field, summary)
 
     return analysis
 
 
-def _extract_section(text: str, keywords: List[str]) -> Optional[str]:
-    """Extract a section containing any of the keywords."""
-    paragraphs = text.split("\n\n")
-    relevant = []
-    for para in paragraphs:
-        if any(kw in para.lower() for kw in keywords):
-            relevant.append(para.strip())
-    return "\n\n".join(relevant[:2]) if relevant else None
+def _extract_sections(text: str) -> Dict[str, Optional[str]]:
+    """Extract every section summary in one pass over the paragraphs.
+
+    A section takes up to two paragraphs containing any of its keywords, and
+    is only reported if some paragraph mentions one of its trigger words.
+    """
+    relevant: Dict[str, List[str]] = {field: [] for field, _, _ in _SECTION_KEYWORDS}
+    triggered = set()
+    for para in text.split("\n\n"):
+        para_lower = para.lower()
+        hits = {kw for kw in _ALL_SECTION_KEYWORDS if kw in para_lower}
+        if not hits:
+            continue
+        for field, keywords, triggers in _SECTION_KEYWORDS:
+            paras = relevant[field]
+            if len(paras) < 2 and not keywords.isdisjoint(hits):
+                paras.append(para.strip())
+            if field not in triggered and not triggers.isdisjoint(hits):
+                triggered.add(field)
+    return {
+        field: "\n\n".join(paras) if paras and field in triggered else None
+        for field, paras in relevant.items()
+    }
 
 
 def analyze_multiple_profiles(
@@ -594,12 +809,15 @@ def analyze_multiple_profiles(
     Returns:
         MultiProfileAnalysis with combined results
     """
-    profiles = []
+    def analyze(url: str) -> ProfileAnalysis:
+        logger.info("Analyzing: %s", url)
+        return analyze_profile(url, mode=mode)
 
-    for url in urls:
-        print(f"Analyzing: {url}")
-        analysis = analyze_profile(url, mode=mode)
-        profiles.append(analysis)
+    # Each analysis is one blocking Perplexity request, so issue them
+    # concurrently; map() keeps results in the order of the input URLs.
+    workers = max(1, min(len(urls), MAX_CONCURRENT_PROFILE_REQUESTS))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        profiles = list(executor.map(analyze, urls))
 
     # Combine results
     combined = MultiProfileAnalysis(profiles=profiles)
@@ -611,16 +829,55 @@ def analyze_multiple_profiles(
         if profile.positive_indicators:
             combined.combined_positive_indicators.extend(profile.positive_indicators)
 
-    # Remove duplicates
-    combined.combined_red_flags = list(set(combined.combined_red_flags))
-    combined.combined_positive_indicators = list(set(combined.combined_positive_indicators))
+    # Remove duplicates, keeping first-seen order so output is deterministic
+    combined.combined_red_flags = list(dict.fromkeys(combined.combined_red_flags))
+    combined.combined_positive_indicators = list(dict.fromkeys(combined.combined_positive_indicators))
 
-    # Generate combined summary using AI
-    combined = _generate_combined_summary(combined)
+    # Generate combined summary using AI, when there is anything to combine
+    if any(p.status == "success" for p in profiles):
+        combined = _generate_combined_summary(combined)
 
     return combined
 
 
+def _estimate_tokens(text: str) -> int:
+    """Cheaply estimate the number of tokens in a piece of text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Trim text to roughly max_tokens, cutting at a word boundary."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars)
+    return text[:cut if cut > 0 else max_chars]
+
+
+def _extract_scores(summary: str) -> Dict[str, float]:
+    """Read 0-1 scores from a summary in a single scan.
+
+    Each score is the first number after the first mention of its keyword,
+    so several keywords mentioned before one number all take that number.
+    """
+    scores: Dict[str, float] = {}
+    pending: List[str] = []
+    for match in _SCORE_TOKEN_RE.finditer(summary):
+        kind = match.group("kind")
+        if kind is not None:
+            kind = kind.lower()
+            if kind not in scores and kind not in pending:
+                pending.append(kind)
+        elif pending:
+            score = min(int(match.group("number")), 100) / 100
+            for kind in pending:
+                scores[kind] = score
+            pending.clear()
+            if len(scores) == len(_SCORE_FIELDS):
+                break
+    return scores
+
+
 def _generate_combined_summary(analysis: MultiProfileAnalysis) -> MultiProfileAnalysis:
     """Generate a combined summary and scores from multiple profiles."""
     if not PERPLEXITY_API_KEY:
@@ -628,9 +885,17 @@ def _generate_combined_summary(analysis: MultiProfileAnalysis) -> MultiProfileAn
 
     # Build context from all profiles
     profiles_context = []
+    remaining_tokens = COMBINED_CONTEXT_TOKENS
     for p in analysis.profiles:
-        if p.status == "success":
-            profiles_context.append(f"**{p.platform.upper()} ({p.url}):**\n{p.raw_analysis[:1500]}")
+        if p.status != "success" or not p.raw_analysis:
+            continue
+        header = f"**{p.platform.upper()} ({p.url}):**\n"
+        budget = min(PROFILE_EXCERPT_TOKENS, remaining_tokens - _estimate_tokens(header))
+        if budget <= 0:
+            break
+        excerpt = _truncate_to_tokens(p.raw_analysis, budget)
+        profiles_context.append(header + excerpt)
+        remaining_tokens -= _estimate_tokens(header) + _estimate_tokens(excerpt)
 
     if not profiles_context:
         return analysis
@@ -661,11 +926,6 @@ PROFILES:
 
 Return scores as numbers and provide brief justifications."""
 
-    headers = {
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "model": "sonar",
         "messages": [
@@ -680,37 +940,20 @@ Return scores as numbers and provide brief justifications."""
     }
 
     try:
-        response = requests.post(
+        response = _http.post(
             PERPLEXITY_API_URL,
-            headers=headers,
-            json=payload,
+            headers=_api_headers(PERPLEXITY_API_KEY),
+            data=_json_bytes(payload),
             timeout=90
         )
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         summary = result["choices"][0]["message"]["content"]
         analysis.summary = summary
 
         # Try to extract scores from summary
-        score_patterns = [
-            (r"professional[^\d]*(\d+)", "professional"),
-            (r"lifestyle[^\d]*(\d+)", "lifestyle"),
-            (r"social[^\d]*(\d+)", "social"),
-            (r"consistency[^\d]*(\d+)", "consistency"),
-        ]
-
-        for pattern, score_type in score_patterns:
-            match = re.search(pattern, summary, re.IGNORECASE)
-            if match:
-                score = min(int(match.group(1)), 100) / 100
-                if score_type == "professional":
-                    analysis.overall_professional_score = score
-                elif score_type == "lifestyle":
-                    analysis.overall_lifestyle_score = score
-                elif score_type == "social":
-                    analysis.overall_social_score = score
-                elif score_type == "consistency":
-                    analysis.consistency_score = score
+        for score_type, score in _extract_scores(summary).items():
+            setattr(analysis, _SCORE_FIELDS[score_type], score)
 
     except Exception as e:
         analysis.summary = f"Could not generate combined summary: {str(e)}"
@@ -718,6 +961,19 @@ Return scores as numbers and provide brief justifications."""
     return analysis
 
 
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """Write results as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        # orjson encodes in C, including with indentation, and returns bytes.
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    # json.dump encodes incrementally, so the full document is never held
+    # as one string; the 1 MiB buffer batches its many small chunk writes.
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        json.dump(data, f, indent=2)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze social media profiles for mortgage underwriting risk assessment",
@@ -802,6 +1058,8 @@ Examples:
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Determine mode
     mode = AnalysisMode(args.mode)
 
@@ -842,8 +1100,7 @@ Examples:
 
             # Save to file
             if args.output:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    json.dump(search_result, f, indent=2)
+                _write_json(args.output, search_result)
                 print(f"\nResults saved to: {args.output}")
         else:
             print(f"\nError: {search_result['raw_analysis']}")
@@ -879,8 +1136,7 @@ Examples:
 
         # Save to file
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                json.dump(result.to_dict(), f, indent=2)
+            _write_json(args.output, result.to_dict())
             print(f"\nResults saved to: {args.output}")
 
     # Single URL analysis
@@ -923,20 +1179,37 @@ Examples:
             print(f"Mode: {mode.value}")
             print("-" * 50)
 
+            # The banner goes out with the first streamed text, so a failed
+            # request is not shown as an empty analysis
+            streamed = False
+
+            def print_delta(text):
+                nonlocal streamed
+                if not streamed:
+                    streamed = True
+                    print("\n" + "=" * 50)
+                    print("ANALYSIS")
+                    print("=" * 50)
+                print(text, end="", flush=True)
+
             result = analyze_profile(
                 args.url,
                 prompt=args.prompt,
                 features=features,
                 mode=mode,
-                platform=platform
+                platform=platform,
+                on_delta=print_delta
             )
+            if streamed:
+                print()
 
         if result.status == "success":
             print(f"\nPlatform: {result.platform}")
-            print("\n" + "=" * 50)
-            print("ANALYSIS")
-            print("=" * 50)
-            print(result.raw_analysis)
+            if args.search:
+                print("\n" + "=" * 50)
+                print("ANALYSIS")
+                print("=" * 50)
+                print(result.raw_analysis)
 
             if result.red_flags:
                 print("\nRed Flags:")
@@ -955,8 +1228,7 @@ Examples:
 
             # Save to file
             if args.output:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    json.dump(result.to_dict(), f, indent=2)
+                _write_json(args.output, result.to_dict())
                 print(f"\nResults saved to: {args.output}")
         else:
             print(f"\nError: {result.raw_analysis}")
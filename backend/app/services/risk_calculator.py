@@ -7,10 +7,95 @@ from app.models.schemas import (
     RiskAssessment,
     RiskLevel,
     RiskFactors,
-    GatheredData
+    GatheredData,
+    PropertyType,
+    Occupancy,
+    LoanType,
 )
 from app.utils.logger import logger
+from typing import Dict, List, Mapping, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 import math
+import numpy as np
+
+
+# Integer codes used by the batch (column-oriented) scoring path
+PROPERTY_TYPES = tuple(PropertyType)
+OCCUPANCIES = tuple(Occupancy)
+LOAN_TYPES = tuple(LoanType)
+
+# Sub-score tables. Bins are ascending thresholds; rows are (score, level)
+# pairs indexed by the bin a value falls into. "Lower-bound" tables match
+# `value >= bin` (bisect_right), "upper-bound" tables match `value <= bin`
+# (bisect_left).
+CREDIT_BINS = (640, 680, 720, 760)  # lower-bound
+CREDIT_ROWS = ((35, "Poor"), (28, "Fair"), (20, "Good"), (10, "Very Good"), (0, "Excellent"))
+DTI_BINS = (28, 36, 43, 50)  # upper-bound
+DTI_ROWS = ((0, "Excellent"), (10, "Good"), (20, "Acceptable"), (28, "High"), (35, "Excessive"))
+LTV_BINS = (80, 90, 95)  # upper-bound
+LTV_ROWS = ((0, "Low"), (10, "Moderate"), (20, "Elevated"), (30, "High"))
+EMPLOYMENT_BINS = (1, 2, 5)  # lower-bound
+EMPLOYMENT_ROWS = ((10, "Insufficient"), (7, "Marginal"), (3, "Adequate"), (0, "Stable"))
+EMPLOYMENT_UNKNOWN = (10, "Unknown")
+INCOME_BINS = (50000, 75000, 100000)  # lower-bound
+INCOME_ROWS = ((10, "Limited"), (7, "Adequate"), (3, "Good"), (0, "Strong"))
+PROPERTY_LEVEL_BINS = (10, 15)  # upper-bound
+PROPERTY_LEVELS = ("Low", "Moderate", "Elevated")
+# Property risk is a base score plus per-enum-member deltas
+PROPERTY_BASE_RISK = 5
+OCCUPANCY_RISK_DELTA = {o: 10 if o == Occupancy.INVESTMENT else 0 for o in OCCUPANCIES}
+PROPERTY_TYPE_RISK_DELTA = {t: 5 if t in (PropertyType.CONDO, PropertyType.PUD) else 0 for t in PROPERTY_TYPES}
+RISK_LEVEL_BINS = (30, 60)  # upper-bound
+RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)
+
+# Score-only columns for the batch path
+CREDIT_SCORES = tuple(score for score, _ in CREDIT_ROWS)
+DTI_SCORES = tuple(score for score, _ in DTI_ROWS)
+LTV_SCORES = tuple(score for score, _ in LTV_ROWS)
+EMPLOYMENT_SCORES = tuple(score for score, _ in EMPLOYMENT_ROWS)
+INCOME_SCORES = tuple(score for score, _ in INCOME_ROWS)
+
+
+@lru_cache(maxsize=2048)
+def _annuity_factor(monthly_rate: float, months: int) -> float:
+    """Monthly payment per dollar borrowed for a fully amortizing loan"""
+    if monthly_rate == 0:
+        return 1 / months
+    growth = (1 + monthly_rate) ** months
+    return monthly_rate * growth / (growth - 1)
+
+
+def _annuity_payment(loan_amount: float, monthly_rate: float, months: int) -> float:
+    """Level monthly payment for a fully amortizing loan"""
+    # Rates come from an integer risk score and a handful of loan types, so
+    # the (rate, term) pairs repeat and the cached factor is reused exactly.
+    return loan_amount * _annuity_factor(monthly_rate, months)
+
+
+@lru_cache(maxsize=64)
+def _classify_loan_type(loan_type: str) -> Tuple[float, int]:
+    """(base-rate adjustment, term in months) inferred from a loan type label"""
+    if "15-Year" in loan_type:
+        return -0.5, 180
+    if "ARM" in loan_type:
+        return -0.75, 360
+    return 0.0, 360
+
+
+# Per-loan-type pricing terms, resolved once. LoanType is a str enum, so plain
+# string labels hit the same entries.
+LOAN_TYPE_TERMS: Dict[str, Tuple[float, int]] = {t: _classify_loan_type(t.value) for t in LOAN_TYPES}
+
+
+def _loan_type_terms(loan_type: str) -> Tuple[float, int]:
+    """Look up (rate adjustment, term months), classifying unknown labels"""
+    terms = LOAN_TYPE_TERMS.get(loan_type)
+    return terms if terms is not None else _classify_loan_type(loan_type)
+
+
+# Simplified DTI estimate: payment on a 30-year loan at ~7% per dollar borrowed
+DTI_PAYMENT_FACTOR = _annuity_payment(1.0, 0.00665, 360)
 
 
 class RiskCalculatorService:
@@ -21,7 +106,7 @@ class RiskCalculatorService:
     def __init__(self):
         pass
 
-    async def calculate_risk(
+    def calculate_risk(
         self,
         application: LoanApplicationRequest,
         gathered_data: GatheredData
@@ -37,30 +122,56 @@ class RiskCalculatorService:
         - Income verification
         - Property type and occupancy
         """
-        logger.info(f"Calculating risk for {application.applicant.full_name}")
+        logger.info("Calculating risk for %s", application.applicant.full_name)
+
+        applicant = application.applicant
+        loan = application.loan_details
+        prop = application.property_info
+        assessment = _calculate_risk_pure(
+            applicant.credit_score,
+            loan.loan_amount,
+            prop.estimated_value,
+            applicant.annual_income,
+            applicant.years_employed,
+            prop.property_type,
+            prop.occupancy,
+            loan.loan_type,
+        )
+        # Cached results are shared; callers may adjust fields (e.g. the AI
+        # risk score override), so each caller gets its own deep copy,
+        # nested risk_factors included.
+        return assessment.model_copy(deep=True)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all memoized risk assessments"""
+        _calculate_risk_pure.cache_clear()
 
+    def _score_application(
+        self,
+        credit_score: int,
+        loan_amount: float,
+        property_value: float,
+        annual_income: float,
+        years_employed: Optional[float],
+        property_type: PropertyType,
+        occupancy: Occupancy,
+        loan_type: LoanType
+    ) -> RiskAssessment:
+        """Compute the risk assessment from the scalar inputs it depends on"""
         # Calculate key ratios
-        ltv_ratio = self._calculate_ltv(
-            application.loan_details.loan_amount,
-            application.property_info.estimated_value
-        )
+        ltv_ratio = self._calculate_ltv(loan_amount, property_value)
 
         # Estimate DTI (in production, calculate from actual debt data)
-        dti_ratio = self._estimate_dti(
-            application.loan_details.loan_amount,
-            application.applicant.annual_income
-        )
+        dti_ratio = self._estimate_dti(loan_amount, annual_income)
 
         # Calculate individual risk scores
-        credit_risk = self._assess_credit_risk(application.applicant.credit_score)
+        credit_risk = self._assess_credit_risk(credit_score)
         dti_risk = self._assess_dti_risk(dti_ratio)
         ltv_risk = self._assess_ltv_risk(ltv_ratio)
-        employment_risk = self._assess_employment_risk(application.applicant.years_employed)
-        income_risk = self._assess_income_risk(application.applicant.annual_income)
-        property_risk = self._assess_property_risk(
-            application.property_info.property_type.value,
-            application.property_info.occupancy.value
-        )
+        employment_risk = self._assess_employment_risk(years_employed)
+        income_risk = self._assess_income_risk(annual_income)
+        property_risk = self._assess_property_risk(property_type, occupancy)
 
         # Calculate overall risk score (0-100)
         risk_score = self._calculate_overall_risk_score(
@@ -73,29 +184,26 @@ class RiskCalculatorService:
 
         # Generate recommendation
         recommendation = self._generate_recommendation(
-            risk_score, risk_level, ltv_ratio, dti_ratio,
-            application.applicant.credit_score
+            risk_score, risk_level, ltv_ratio, dti_ratio, credit_score
         )
 
         # Estimate interest rate and monthly payment
-        estimated_rate = self._estimate_interest_rate(risk_score, application.loan_details.loan_type.value)
-        estimated_payment = self._calculate_monthly_payment(
-            application.loan_details.loan_amount,
-            estimated_rate,
-            application.loan_details.loan_type.value
+        estimated_rate = self._estimate_interest_rate(risk_score, loan_type.value)
+        estimated_payment = self._calculate_monthly_payment(loan_amount, estimated_rate, loan_type.value)
+
+        # Create risk factors breakdown. Every field is produced by this
+        # calculator and already within the schema's bounds, so the models are
+        # built without re-running validation.
+        risk_factors = RiskFactors.model_construct(
+            credit_score_risk=credit_risk[1],
+            dti_ratio_risk=dti_risk[1],
+            ltv_ratio_risk=ltv_risk[1],
+            employment_stability_risk=employment_risk[1],
+            income_verification_risk=income_risk[1],
+            property_risk=property_risk[1]
         )
 
-        # Create risk factors breakdown
-        risk_factors = RiskFactors(
-            credit_score_risk=credit_risk["level"],
-            dti_ratio_risk=dti_risk["level"],
-            ltv_ratio_risk=ltv_risk["level"],
-            employment_stability_risk=employment_risk["level"],
-            income_verification_risk=income_risk["level"],
-            property_risk=property_risk["level"]
-        )
-
-        return RiskAssessment(
+        return RiskAssessment.model_construct(
             risk_score=risk_score,
             risk_level=risk_level,
             dti_ratio=round(dti_ratio, 2),
@@ -106,6 +214,95 @@ class RiskCalculatorService:
             estimated_monthly_payment=round(estimated_payment, 2)
         )
 
+    def calculate_risk_batch(self, columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Score many applications at once from column arrays
+
+        Expects equal-length arrays keyed by: credit_score, annual_income,
+        loan_amount, property_value, years_employed (NaN when unknown),
+        property_type_code, occupancy_code and loan_type_code (indexes into
+        PROPERTY_TYPES / OCCUPANCIES / LOAN_TYPES). Use `to_columns` to build
+        them from request models. Results match `calculate_risk` row by row.
+        """
+        credit_score = np.asarray(columns["credit_score"], dtype=np.float64)
+        annual_income = np.asarray(columns["annual_income"], dtype=np.float64)
+        loan_amount = np.asarray(columns["loan_amount"], dtype=np.float64)
+        property_value = np.asarray(columns["property_value"], dtype=np.float64)
+        years_employed = np.asarray(columns["years_employed"], dtype=np.float64)
+        property_type_code = np.asarray(columns["property_type_code"], dtype=np.intp)
+        occupancy_code = np.asarray(columns["occupancy_code"], dtype=np.intp)
+        loan_type_code = np.asarray(columns["loan_type_code"], dtype=np.intp)
+
+        ltv_ratio = loan_amount / property_value * 100
+        dti_ratio = loan_amount * DTI_PAYMENT_FACTOR / (annual_income / 12) * 100
+
+        credit_risk = np.take(CREDIT_SCORES, np.digitize(credit_score, CREDIT_BINS))
+        dti_risk = np.take(DTI_SCORES, np.digitize(dti_ratio, DTI_BINS, right=True))
+        ltv_risk = np.take(LTV_SCORES, np.digitize(ltv_ratio, LTV_BINS, right=True))
+        employment_risk = np.where(
+            np.isnan(years_employed) | (years_employed == 0),
+            EMPLOYMENT_UNKNOWN[0],
+            np.take(EMPLOYMENT_SCORES, np.digitize(np.nan_to_num(years_employed), EMPLOYMENT_BINS))
+        )
+        income_risk = np.take(INCOME_SCORES, np.digitize(annual_income, INCOME_BINS))
+
+        property_risk = (
+            PROPERTY_BASE_RISK
+            + np.take([OCCUPANCY_RISK_DELTA[o] for o in OCCUPANCIES], occupancy_code)
+            + np.take([PROPERTY_TYPE_RISK_DELTA[t] for t in PROPERTY_TYPES], property_type_code)
+        )
+
+        total = credit_risk + dti_risk + ltv_risk + employment_risk + income_risk
+        risk_score = np.clip(total, 0, 100)
+        risk_level = np.take(
+            np.array(RISK_LEVELS, dtype=object), np.digitize(risk_score, RISK_LEVEL_BINS, right=True)
+        )
+
+        rate_adjustment = np.take([LOAN_TYPE_TERMS[t][0] for t in LOAN_TYPES], loan_type_code)
+        months = np.take([LOAN_TYPE_TERMS[t][1] for t in LOAN_TYPES], loan_type_code)
+        estimated_rate = 6.5 + rate_adjustment + risk_score / 100 * 2.5
+
+        monthly_rate = estimated_rate / 100 / 12
+        growth = (1 + monthly_rate) ** months
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(monthly_rate == 0, 1 / months, monthly_rate * growth / (growth - 1))
+        estimated_payment = loan_amount * factor
+
+        return {
+            "risk_score": risk_score,
+            "risk_level": risk_level,
+            "dti_ratio": np.round(dti_ratio, 2),
+            "ltv_ratio": np.round(ltv_ratio, 2),
+            "credit_risk": credit_risk,
+            "dti_risk": dti_risk,
+            "ltv_risk": ltv_risk,
+            "employment_risk": employment_risk,
+            "income_risk": income_risk,
+            "property_risk": property_risk,
+            "estimated_interest_rate": np.round(estimated_rate, 3),
+            "estimated_monthly_payment": np.round(estimated_payment, 2),
+        }
+
+    @staticmethod
+    def to_columns(applications: List[LoanApplicationRequest]) -> Dict[str, np.ndarray]:
+        """Convert request models into the column arrays used by `calculate_risk_batch`"""
+        applicants = [application.applicant for application in applications]
+        properties = [application.property_info for application in applications]
+        loans = [application.loan_details for application in applications]
+        return {
+            "credit_score": np.array([applicant.credit_score for applicant in applicants], dtype=np.float64),
+            "annual_income": np.array([applicant.annual_income for applicant in applicants], dtype=np.float64),
+            "loan_amount": np.array([loan.loan_amount for loan in loans], dtype=np.float64),
+            "property_value": np.array([prop.estimated_value for prop in properties], dtype=np.float64),
+            "years_employed": np.array(
+                [np.nan if applicant.years_employed is None else applicant.years_employed for applicant in applicants],
+                dtype=np.float64
+            ),
+            "property_type_code": np.array([PROPERTY_TYPES.index(prop.property_type) for prop in properties]),
+            "occupancy_code": np.array([OCCUPANCIES.index(prop.occupancy) for prop in properties]),
+            "loan_type_code": np.array([LOAN_TYPES.index(loan.loan_type) for loan in loans]),
+        }
+
     def _calculate_ltv(self, loan_amount: float, property_value: float) -> float:
         """Calculate Loan-to-Value ratio"""
         return (loan_amount / property_value) * 100
@@ -113,87 +310,37 @@ class RiskCalculatorService:
     def _estimate_dti(self, loan_amount: float, annual_income: float) -> float:
         """Estimate Debt-to-Income ratio (simplified for hackathon)"""
         # Rough estimate: assume 30-year loan at 7% interest
-        monthly_payment = (loan_amount * 0.00665) / (1 - (1 + 0.00665) ** -360)
+        monthly_payment = loan_amount * DTI_PAYMENT_FACTOR
         monthly_income = annual_income / 12
         return (monthly_payment / monthly_income) * 100
 
-    def _assess_credit_risk(self, credit_score: int) -> dict:
+    def _assess_credit_risk(self, credit_score: int) -> Tuple[int, str]:
         """Assess risk based on credit score (0-35 points)"""
-        if credit_score >= 760:
-            return {"score": 0, "level": "Excellent"}
-        elif credit_score >= 720:
-            return {"score": 10, "level": "Very Good"}
-        elif credit_score >= 680:
-            return {"score": 20, "level": "Good"}
-        elif credit_score >= 640:
-            return {"score": 28, "level": "Fair"}
-        else:
-            return {"score": 35, "level": "Poor"}
+        return CREDIT_ROWS[bisect_right(CREDIT_BINS, credit_score)]
 
-    def _assess_dti_risk(self, dti_ratio: float) -> dict:
+    def _assess_dti_risk(self, dti_ratio: float) -> Tuple[int, str]:
         """Assess risk based on DTI ratio (0-35 points)"""
-        if dti_ratio <= 28:
-            return {"score": 0, "level": "Excellent"}
-        elif dti_ratio <= 36:
-            return {"score": 10, "level": "Good"}
-        elif dti_ratio <= 43:
-            return {"score": 20, "level": "Acceptable"}
-        elif dti_ratio <= 50:
-            return {"score": 28, "level": "High"}
-        else:
-            return {"score": 35, "level": "Excessive"}
+        return DTI_ROWS[bisect_left(DTI_BINS, dti_ratio)]
 
-    def _assess_ltv_risk(self, ltv_ratio: float) -> dict:
+    def _assess_ltv_risk(self, ltv_ratio: float) -> Tuple[int, str]:
         """Assess risk based on LTV ratio (0-30 points)"""
-        if ltv_ratio <= 80:
-            return {"score": 0, "level": "Low"}
-        elif ltv_ratio <= 90:
-            return {"score": 10, "level": "Moderate"}
-        elif ltv_ratio <= 95:
-            return {"score": 20, "level": "Elevated"}
-        else:
-            return {"score": 30, "level": "High"}
+        return LTV_ROWS[bisect_left(LTV_BINS, ltv_ratio)]
 
-    def _assess_employment_risk(self, years_employed: float) -> dict:
+    def _assess_employment_risk(self, years_employed: float) -> Tuple[int, str]:
         """Assess employment stability risk (0-10 points)"""
         if not years_employed:
-            return {"score": 10, "level": "Unknown"}
-        if years_employed >= 5:
-            return {"score": 0, "level": "Stable"}
-        elif years_employed >= 2:
-            return {"score": 3, "level": "Adequate"}
-        elif years_employed >= 1:
-            return {"score": 7, "level": "Marginal"}
-        else:
-            return {"score": 10, "level": "Insufficient"}
+            return EMPLOYMENT_UNKNOWN
+        return EMPLOYMENT_ROWS[bisect_right(EMPLOYMENT_BINS, years_employed)]
 
-    def _assess_income_risk(self, annual_income: float) -> dict:
+    def _assess_income_risk(self, annual_income: float) -> Tuple[int, str]:
         """Assess income level risk (0-10 points)"""
-        if annual_income >= 100000:
-            return {"score": 0, "level": "Strong"}
-        elif annual_income >= 75000:
-            return {"score": 3, "level": "Good"}
-        elif annual_income >= 50000:
-            return {"score": 7, "level": "Adequate"}
-        else:
-            return {"score": 10, "level": "Limited"}
+        return INCOME_ROWS[bisect_right(INCOME_BINS, annual_income)]
 
-    def _assess_property_risk(self, property_type: str, occupancy: str) -> dict:
+    def _assess_property_risk(self, property_type: PropertyType, occupancy: Occupancy) -> Tuple[int, str]:
         """Assess property and occupancy risk"""
-        risk_score = 5
-        if "Investment" in occupancy:
-            risk_score += 10
-        if "Condo" in property_type or "PUD" in property_type:
-            risk_score += 5
-
-        if risk_score <= 10:
-            level = "Low"
-        elif risk_score <= 15:
-            level = "Moderate"
-        else:
-            level = "Elevated"
+        risk_score = PROPERTY_BASE_RISK + OCCUPANCY_RISK_DELTA[occupancy] + PROPERTY_TYPE_RISK_DELTA[property_type]
 
-        return {"score": risk_score, "level": level}
+        return risk_score, PROPERTY_LEVELS[bisect_left(PROPERTY_LEVEL_BINS, risk_score)]
 
     def _calculate_overall_risk_score(
         self, credit_risk, dti_risk, ltv_risk,
@@ -212,24 +359,21 @@ class RiskCalculatorService:
         Total: 0-120 points (clamped to 0-100)
         """
         total_score = (
-            credit_risk["score"] +      # 0-35 range
-            dti_risk["score"] +          # 0-35 range
-            ltv_risk["score"] +          # 0-30 range
-            employment_risk["score"] +   # 0-10 range
-            income_risk["score"]         # 0-10 range
+            credit_risk[0] +      # 0-35 range
+            dti_risk[0] +          # 0-35 range
+            ltv_risk[0] +          # 0-30 range
+            employment_risk[0] +   # 0-10 range
+            income_risk[0]         # 0-10 range
             # property_risk removed from sum (was only 5% anyway)
         )
 
-        return min(100, max(0, int(total_score)))
+        # Every component is a non-negative int from the score tables, so
+        # only the upper bound needs clamping.
+        return 100 if total_score > 100 else total_score
 
     def _determine_risk_level(self, risk_score: int) -> RiskLevel:
         """Determine risk level from score"""
-        if risk_score <= 30:
-            return RiskLevel.LOW
-        elif risk_score <= 60:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.HIGH
+        return RISK_LEVELS[bisect_left(RISK_LEVEL_BINS, risk_score)]
 
     def _generate_recommendation(
         self, risk_score: int, risk_level: RiskLevel,
@@ -257,10 +401,8 @@ class RiskCalculatorService:
         base_rate = 6.5  # Base rate for 30-year fixed
 
         # Adjust for loan type
-        if "15-Year" in loan_type:
-            base_rate -= 0.5
-        elif "ARM" in loan_type:
-            base_rate -= 0.75
+        rate_adjustment, _ = _loan_type_terms(loan_type)
+        base_rate += rate_adjustment
 
         # Add risk premium
         risk_premium = (risk_score / 100) * 2.5  # Up to 2.5% premium for high risk
@@ -271,21 +413,32 @@ class RiskCalculatorService:
         self, loan_amount: float, annual_rate: float, loan_type: str
     ) -> float:
         """Calculate estimated monthly payment"""
-        # Determine loan term in months
-        if "15-Year" in loan_type:
-            months = 180
-        else:
-            months = 360  # Default to 30 years
+        # Determine loan term in months (default 30 years)
+        _, months = _loan_type_terms(loan_type)
 
         # Monthly interest rate
         monthly_rate = annual_rate / 100 / 12
 
         # Calculate payment using mortgage formula
-        if monthly_rate == 0:
-            return loan_amount / months
-
-        payment = loan_amount * (
-            monthly_rate * (1 + monthly_rate) ** months
-        ) / ((1 + monthly_rate) ** months - 1)
-
-        return payment
+        return _annuity_payment(loan_amount, monthly_rate, months)
+
+
+_calculator = RiskCalculatorService()
+
+
+@lru_cache(maxsize=4096)
+def _calculate_risk_pure(
+    credit_score: int,
+    loan_amount: float,
+    property_value: float,
+    annual_income: float,
+    years_employed: Optional[float],
+    property_type: PropertyType,
+    occupancy: Occupancy,
+    loan_type: LoanType
+) -> RiskAssessment:
+    """Memoized risk assessment; the calculation is a pure function of its inputs"""
+    return _calculator._score_application(
+        credit_score, loan_amount, property_value, annual_income,
+        years_employed, property_type, occupancy, loan_type
+    )
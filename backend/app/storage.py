@@ -4,13 +4,30 @@ In-Memory Storage for Loan Applications
 For hackathon purposes - in production, replace with a database.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left, insort
+from collections import defaultdict
 from datetime import datetime
+import threading
 from app.models.schemas import LoanApplicationResponse
 
 # In-memory storage
 _applications: Dict[str, dict] = {}
 
+# Listing indexes kept sorted by (submitted_at, application_id), overall and
+# per status, so a page is a slice instead of a filter + sort per request.
+# _indexed remembers each application's key, status and risk score as
+# indexed. Per-status counts come from the index lengths and the risk score
+# total is kept as a running sum, so dashboard stats never scan storage.
+_by_time: List[Tuple[str, str]] = []
+_by_status: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+_indexed: Dict[str, Tuple[Tuple[str, str], Optional[str], Optional[float]]] = {}
+_risk_sum = 0.0
+_risk_count = 0
+
+# Guards storage and indexes against concurrent handlers
+_lock = threading.RLock()
+
 # Sample data for demo
 SAMPLE_APPLICATIONS = [
     {
@@ -75,14 +92,49 @@ SAMPLE_APPLICATIONS = [
     },
 ]
 
-# Initialize with sample data
-for app in SAMPLE_APPLICATIONS:
-    _applications[app["application_id"]] = app
+
+def _remove_sorted(keys: List[Tuple[str, str]], key: Tuple[str, str]) -> None:
+    """Remove a key from a sorted index list"""
+    del keys[bisect_left(keys, key)]
+
+
+def _index_application(application_id: str, data: dict) -> None:
+    """Add an application to the listing indexes and running totals"""
+    global _risk_sum, _risk_count
+    key = (data.get("submitted_at") or "", application_id)
+    status = data.get("status")
+    risk_score = data.get("risk_score")
+    insort(_by_time, key)
+    insort(_by_status[status], key)
+    if risk_score:
+        _risk_sum += risk_score
+        _risk_count += 1
+    _indexed[application_id] = (key, status, risk_score)
+
+
+def _unindex_application(application_id: str) -> None:
+    """Remove an application from the listing indexes and running totals"""
+    global _risk_sum, _risk_count
+    key, status, risk_score = _indexed.pop(application_id)
+    _remove_sorted(_by_time, key)
+    _remove_sorted(_by_status[status], key)
+    if risk_score:
+        _risk_sum -= risk_score
+        _risk_count -= 1
 
 
 def save_application(application_id: str, data: dict) -> None:
     """Save an application to storage"""
-    _applications[application_id] = data
+    with _lock:
+        if application_id in _indexed:
+            _unindex_application(application_id)
+        _applications[application_id] = data
+        _index_application(application_id, data)
+
+
+# Initialize with sample data
+for app in SAMPLE_APPLICATIONS:
+    save_application(app["application_id"], app)
 
 
 def get_application(application_id: str) -> Optional[dict]:
@@ -96,36 +148,43 @@ def list_applications(
     status: Optional[str] = None
 ) -> tuple[List[dict], int]:
     """List applications with optional filtering"""
-    apps = list(_applications.values())
-
-    # Filter by status if provided
-    if status:
-        apps = [a for a in apps if a.get("status") == status]
+    with _lock:
+        # Filter by status if provided
+        keys = _by_status.get(status, []) if status else _by_time
+        total = len(keys)
 
-    total = len(apps)
+        # Paginate newest first: the index is ascending, so count from the end
+        end = total - skip
+        if end <= 0:
+            return [], total
+        page = keys[max(end - limit, 0):end]
 
-    # Sort by submitted_at descending (newest first)
-    apps.sort(key=lambda x: x.get("submitted_at", ""), reverse=True)
-
-    # Paginate
-    apps = apps[skip:skip + limit]
+        apps = [_applications[application_id] for _, application_id in reversed(page)]
 
     return apps, total
 
 
 def update_application_status(application_id: str, new_status: str) -> Optional[dict]:
     """Update an application's status"""
-    if application_id in _applications:
-        _applications[application_id]["status"] = new_status
-        _applications[application_id]["updated_at"] = datetime.utcnow().isoformat()
-        return _applications[application_id]
+    with _lock:
+        if application_id in _applications:
+            app = _applications[application_id]
+            _unindex_application(application_id)
+            app["status"] = new_status
+            app["updated_at"] = datetime.utcnow().isoformat()
+            _index_application(application_id, app)
+            return app
     return None
 
 
 def get_dashboard_stats() -> dict:
     """Calculate dashboard statistics"""
-    apps = list(_applications.values())
-    total = len(apps)
+    with _lock:
+        total = len(_applications)
+        approved, pending, declined, review = (
+            len(_by_status.get(s, ())) for s in ("approved", "pending", "declined", "review")
+        )
+        risk_sum, risk_count = _risk_sum, _risk_count
 
     if total == 0:
         return {
@@ -139,14 +198,8 @@ def get_dashboard_stats() -> dict:
             "average_processing_time": 0.0,
         }
 
-    approved = sum(1 for a in apps if a.get("status") == "approved")
-    pending = sum(1 for a in apps if a.get("status") == "pending")
-    declined = sum(1 for a in apps if a.get("status") == "declined")
-    review = sum(1 for a in apps if a.get("status") == "review")
-
     # Calculate averages
-    risk_scores = [a.get("risk_score", 0) for a in apps if a.get("risk_score")]
-    avg_risk = sum(risk_scores) / len(risk_scores) if risk_scores else 0
+    avg_risk = risk_sum / risk_count if risk_count else 0
 
     # Approval rate (approved / (approved + declined))
     decided = approved + declined
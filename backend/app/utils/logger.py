@@ -4,22 +4,31 @@ Logging Configuration
 
 import logging
 import sys
-from app.config import settings
 
-# Create logger
+# Create logger; handlers and level are attached by configure_logging()
 logger = logging.getLogger("sherlocke_homes")
-logger.setLevel(getattr(logging, settings.LOG_LEVEL))
 
-# Create console handler
-handler = logging.StreamHandler(sys.stdout)
-handler.setLevel(getattr(logging, settings.LOG_LEVEL))
 
-# Create formatter
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-handler.setFormatter(formatter)
+def configure_logging() -> None:
+    """Attach the console handler and configured level (safe to call repeatedly)"""
+    if logger.handlers:
+        return
 
-# Add handler to logger
-logger.addHandler(handler)
+    from app.config import settings
+
+    level = getattr(logging, settings.LOG_LEVEL)
+    logger.setLevel(level)
+
+    # Create console handler
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(level)
+
+    # Create formatter
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    handler.setFormatter(formatter)
+
+    # Add handler to logger
+    logger.addHandler(handler)
@@ -5,30 +5,52 @@ Custom Validators
 import re
 from typing import Optional
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Compiled once at import instead of on every call
+_SSN_RE = re.compile(r'^\d{3}-\d{2}-\d{4}$')
+# Email is matched against untrusted payloads, so use the linear-time re2
+# engine when it is installed
+_EMAIL_RE = (re2 or re).compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# RFC 5321 limit on a forward-path address; longer input is rejected unmatched
+_MAX_EMAIL_LENGTH = 254
+
+# Translation tables that delete characters in a single C-level pass
+_LATIN1_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdecimal()))
+_CURRENCY_SYMBOLS = str.maketrans('', '', '$, ')
+
 
 def validate_ssn(ssn: str) -> bool:
     """Validate Social Security Number format"""
-    pattern = r'^\d{3}-\d{2}-\d{4}$'
-    return bool(re.match(pattern, ssn))
+    return bool(_SSN_RE.match(ssn))
 
 
 def validate_phone(phone: str) -> bool:
     """Validate phone number format"""
-    # Remove all non-numeric characters
-    digits = re.sub(r'\D', '', phone)
+    # Remove all non-numeric characters; the regex is only needed when
+    # characters outside Latin-1 survive the translate pass
+    digits = phone.translate(_LATIN1_NON_DIGITS)
+    if not digits.isdecimal():
+        digits = _NON_DIGIT_RE.sub('', phone)
     return len(digits) == 10 or len(digits) == 11
 
 
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    if len(email) > _MAX_EMAIL_LENGTH:
+        return False
+    return bool(_EMAIL_RE.match(email))
 
 
 def sanitize_currency(value: str) -> float:
     """Convert currency string to float"""
     # Remove $ , and spaces
-    cleaned = value.replace('$', '').replace(',', '').replace(' ', '')
+    cleaned = value.translate(_CURRENCY_SYMBOLS)
     try:
         return float(cleaned)
     except ValueError:
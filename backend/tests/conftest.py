@@ -0,0 +1,68 @@
+"""
+Shared test fixtures
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+MOCK_COMPLETION = """**Professional Background:**
+Senior engineer with stable employment history.
+
+Red Flags:
+- Frequent luxury travel posts
+
+Positive Indicators:
+- Long-term employment at the same company
+
+Professional score: 80, Lifestyle score: 65, Social score: 70, Consistency score: 90"""
+
+
+class _MockResponse:
+    """Minimal stand-in for a successful chat-completions HTTP response"""
+
+    status_code = 200
+
+    def __init__(self, content: str = MOCK_COMPLETION):
+        self._body = {"choices": [{"message": {"content": content}}], "citations": []}
+        self.content = json.dumps(self._body).encode("utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def mock_llm_http(monkeypatch):
+    """Answer Perplexity and Keywords AI requests locally instead of over the network"""
+    from app.services import keywords_client, profile_analyzer
+
+    calls = []
+
+    def post(url, *args, **kwargs):
+        calls.append(url)
+        return _MockResponse()
+
+    monkeypatch.setattr(profile_analyzer._http, "post", post)
+    monkeypatch.setattr(keywords_client.requests, "post", post)
+    profile_analyzer.clear_profile_cache()
+    yield calls
+    profile_analyzer.clear_profile_cache()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """API test client shared across the session, with startup/shutdown events"""
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
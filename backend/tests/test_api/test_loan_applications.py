@@ -3,13 +3,9 @@ Test Loan Application Endpoints
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint"""
     response = client.get("/api/v1/health")
     assert response.status_code == 200
@@ -18,7 +14,7 @@ def test_health_check():
     assert "version" in data
 
 
-def test_create_loan_application():
+def test_create_loan_application(client):
     """Test creating a loan application"""
     application_data = {
         "applicant": {
@@ -52,4 +48,21 @@ def test_create_loan_application():
     # assert data["status"] == "processed"
 
 
+def test_list_loan_applications(client):
+    """Test listing applications newest first with status filtering"""
+    response = client.get("/api/v1/loan-applications", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    submitted = [a["submitted_at"] for a in data["applications"]]
+    assert len(submitted) == 2
+    assert submitted == sorted(submitted, reverse=True)
+    assert data["total"] >= 2
+
+    response = client.get("/api/v1/loan-applications", params={"status": "declined"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == len(data["applications"])
+    assert all(a["status"] == "declined" for a in data["applications"])
+
+
 # Add more tests as needed
@@ -0,0 +1,45 @@
+"""
+Test Profile Analyzer
+"""
+
+from app.services import profile_analyzer
+from app.services.profile_analyzer import analyze_profile, analyze_multiple_profiles
+
+
+def test_analyze_profile_parses_sections(monkeypatch, mock_llm_http):
+    """Test a profile analysis is parsed into sections"""
+    monkeypatch.setattr(profile_analyzer, "PERPLEXITY_API_KEY", "test-key")
+
+    analysis = analyze_profile("https://linkedin.com/in/test-user")
+
+    assert analysis.status == "success"
+    assert analysis.platform == "linkedin"
+    assert analysis.red_flags == ["Frequent luxury travel posts"]
+    assert analysis.positive_indicators == ["Long-term employment at the same company"]
+    assert analysis.professional_summary is not None
+    assert mock_llm_http == [profile_analyzer.PERPLEXITY_API_URL]
+
+
+def test_analyze_profile_uses_cache(monkeypatch, mock_llm_http):
+    """Repeat analyses of the same profile are served from the cache"""
+    monkeypatch.setattr(profile_analyzer, "PERPLEXITY_API_KEY", "test-key")
+
+    first = analyze_profile("https://instagram.com/test-user")
+    second = analyze_profile("https://instagram.com/test-user")
+
+    assert second.raw_analysis == first.raw_analysis
+    assert second is not first
+    assert len(mock_llm_http) == 1
+
+
+def test_analyze_multiple_profiles_combines_results(monkeypatch, mock_llm_http):
+    """Test combining several profiles keeps order and extracts scores"""
+    monkeypatch.setattr(profile_analyzer, "PERPLEXITY_API_KEY", "test-key")
+    urls = ["https://linkedin.com/in/test-user", "https://twitter.com/test-user"]
+
+    result = analyze_multiple_profiles(urls)
+
+    assert [p.url for p in result.profiles] == urls
+    assert result.combined_red_flags == ["Frequent luxury travel posts"]
+    assert result.overall_professional_score == 0.8
+    assert result.consistency_score == 0.9
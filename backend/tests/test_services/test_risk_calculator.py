@@ -17,38 +17,50 @@ from app.models.schemas import (
 )
 
 
-@pytest.mark.asyncio
-async def test_risk_calculation():
+def _make_application(**overrides) -> LoanApplicationRequest:
+    """Build a baseline test application, overriding fields by name"""
+    fields = {
+        ApplicantInfo: {
+            "full_name": "Test User",
+            "email": "test@example.com",
+            "phone": "555-1234",
+            "credit_score": 720,
+            "annual_income": 85000,
+            "years_employed": 5,
+        },
+        PropertyInfo: {
+            "address": "123 Test St",
+            "estimated_value": 425000,
+            "property_type": PropertyType.SINGLE_FAMILY,
+            "occupancy": Occupancy.PRIMARY,
+        },
+        LoanDetails: {
+            "loan_amount": 350000,
+            "loan_type": LoanType.CONVENTIONAL_30,
+            "loan_purpose": LoanPurpose.PURCHASE,
+        },
+    }
+    for name, value in overrides.items():
+        model = next(model for model in fields if name in model.model_fields)
+        fields[model][name] = value
+    return LoanApplicationRequest(
+        applicant=ApplicantInfo(**fields[ApplicantInfo]),
+        property_info=PropertyInfo(**fields[PropertyInfo]),
+        loan_details=LoanDetails(**fields[LoanDetails])
+    )
+
+
+def test_risk_calculation():
     """Test basic risk calculation"""
     service = RiskCalculatorService()
 
     # Create test application
-    application = LoanApplicationRequest(
-        applicant=ApplicantInfo(
-            full_name="Test User",
-            email="test@example.com",
-            phone="555-1234",
-            credit_score=720,
-            annual_income=85000,
-            years_employed=5
-        ),
-        property_info=PropertyInfo(
-            address="123 Test St",
-            estimated_value=425000,
-            property_type=PropertyType.SINGLE_FAMILY,
-            occupancy=Occupancy.PRIMARY
-        ),
-        loan_details=LoanDetails(
-            loan_amount=350000,
-            loan_type=LoanType.CONVENTIONAL_30,
-            loan_purpose=LoanPurpose.PURCHASE
-        )
-    )
+    application = _make_application()
 
     gathered_data = GatheredData(sources=[])
 
     # Calculate risk
-    risk = await service.calculate_risk(application, gathered_data)
+    risk = service.calculate_risk(application, gathered_data)
 
     # Assertions
     assert risk.risk_score >= 0
@@ -59,4 +71,74 @@ async def test_risk_calculation():
     assert risk.estimated_monthly_payment is not None
 
 
+def test_cached_risk_results_are_not_shared():
+    """Repeated inputs hit the cache but each caller gets an independent result"""
+    service = RiskCalculatorService()
+    service.invalidate_cache()
+
+    application = _make_application(
+        credit_score=700, annual_income=90000, years_employed=3,
+        estimated_value=400000, loan_amount=320000
+    )
+
+    first = service.calculate_risk(application, GatheredData(sources=[]))
+    original_score = first.risk_score
+    original_credit_risk = first.risk_factors.credit_score_risk
+    first.risk_score = 99
+    first.risk_factors.credit_score_risk = "Tampered"
+
+    second = service.calculate_risk(application, GatheredData(sources=[]))
+    assert second.risk_score == original_score
+    assert second.risk_factors is not first.risk_factors
+    assert second.risk_factors.credit_score_risk == original_credit_risk
+
+
+def test_risk_calculation_batch_matches_scalar():
+    """Batch scoring returns the same results as scoring one application at a time"""
+    service = RiskCalculatorService()
+
+    applications = [
+        _make_application(
+            credit_score=credit_score,
+            annual_income=annual_income,
+            years_employed=years_employed,
+            loan_amount=loan_amount,
+            property_type=property_type,
+            occupancy=occupancy,
+            loan_type=loan_type
+        )
+        for credit_score, annual_income, years_employed, loan_amount, property_type, occupancy, loan_type in [
+            (780, 150000, 8, 300000, PropertyType.SINGLE_FAMILY, Occupancy.PRIMARY, LoanType.CONVENTIONAL_30),
+            (720, 85000, None, 350000, PropertyType.CONDO, Occupancy.SECOND_HOME, LoanType.CONVENTIONAL_15),
+            (640, 50000, 1.5, 410000, PropertyType.PUD, Occupancy.INVESTMENT, LoanType.ARM_7_1),
+            (580, 40000, 0, 420000, PropertyType.TOWNHOUSE, Occupancy.PRIMARY, LoanType.FHA_30),
+        ]
+    ]
+
+    batch = service.calculate_risk_batch(service.to_columns(applications))
+
+    for i, application in enumerate(applications):
+        risk = service.calculate_risk(application, GatheredData(sources=[]))
+        assert batch["risk_score"][i] == risk.risk_score
+        assert batch["risk_level"][i] == risk.risk_level
+        assert batch["dti_ratio"][i] == risk.dti_ratio
+        assert batch["ltv_ratio"][i] == risk.ltv_ratio
+        assert batch["estimated_interest_rate"][i] == risk.estimated_interest_rate
+        assert batch["estimated_monthly_payment"][i] == pytest.approx(risk.estimated_monthly_payment, abs=0.01)
+
+
+def test_risk_score_clamped_to_100():
+    """Worst-case component scores sum past 100 and are clamped to an int score"""
+    service = RiskCalculatorService()
+
+    application = _make_application(
+        credit_score=560, annual_income=30000, years_employed=0, loan_amount=420000
+    )
+
+    risk = service.calculate_risk(application, GatheredData(sources=[]))
+
+    assert type(risk.risk_score) is int
+    assert risk.risk_score == 100
+
+
 # Add more tests as needed
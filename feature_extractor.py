@@ -9,15 +9,27 @@ Extracts and normalizes features from:
 These features feed into the ML risk scoring model.
 """
 
+import hashlib
 import re
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict, field
+import sys
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
 
 from keywords_client import KeywordsAIClient
 
 
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class EducationLevel(Enum):
     """Education level enumeration for scoring."""
     UNKNOWN = 0
@@ -55,7 +67,7 @@ class RelationshipStatus(Enum):
     MARRIED_WITH_CHILDREN = 4
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TraditionalFeatures:
     """Standard underwriting features."""
     # Credit
@@ -88,7 +100,7 @@ class TraditionalFeatures:
     reserves_months: int = 0  # Months of payments in reserves
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProfessionalFeatures:
     """Features extracted from LinkedIn/professional profiles."""
     # Employment Stability
@@ -118,7 +130,7 @@ class ProfessionalFeatures:
     professional_credibility_score: float = 0.5  # 0-1
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LifestyleFeatures:
     """Features extracted from Instagram/Facebook/TikTok - lifestyle indicators."""
     # Spending Indicators
@@ -148,7 +160,7 @@ class LifestyleFeatures:
     income_lifestyle_alignment: float = 0.5  # 0-1 (higher = lifestyle matches income)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SocialConnectednessFeatures:
     """Features measuring social network and support system."""
     # Network Size & Quality
@@ -184,7 +196,33 @@ class SocialConnectednessFeatures:
     relationship_stability_score: float = 0.5  # 0-1
 
 
-@dataclass
+# Field names and a matching getter per feature group, resolved once. Every
+# field is an immutable primitive, so copying values by reference is a safe
+# replacement for dataclasses.asdict's recursive deep copy.
+def _field_reader(cls: type, numeric_only: bool = False):
+    names = tuple(f.name for f in fields(cls) if not (numeric_only and f.type is str))
+    return names, attrgetter(*names)
+
+
+_FIELD_READERS = {
+    cls: _field_reader(cls)
+    for cls in (TraditionalFeatures, ProfessionalFeatures, LifestyleFeatures, SocialConnectednessFeatures)
+}
+
+# Same, restricted to the numeric fields that feed batch score calculations
+_NUMERIC_FIELD_READERS = {
+    cls: _field_reader(cls, numeric_only=True)
+    for cls in (ProfessionalFeatures, LifestyleFeatures, SocialConnectednessFeatures)
+}
+
+
+def _shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """Flat field dict for a feature group dataclass."""
+    names, values = _FIELD_READERS[type(obj)]
+    return dict(zip(names, values(obj)))
+
+
+@dataclass(**_SLOTS)
 class CombinedFeatures:
     """All features combined for ML model input."""
     traditional: TraditionalFeatures
@@ -194,87 +232,382 @@ class CombinedFeatures:
 
     def to_model_input(self) -> Dict[str, float]:
         """Convert to flat dict of normalized features for ML model."""
-        features = {}
-
-        # ============ TRADITIONAL FEATURES ============
-        features["credit_score_normalized"] = max(0, (self.traditional.credit_score - 300) / 550)
-        features["credit_history_years"] = min(self.traditional.credit_history_years / 30, 1.0)
-        features["annual_income_log"] = min(self.traditional.annual_income / 500000, 1.0)
-        features["employment_length_normalized"] = min(self.traditional.employment_length_months / 120, 1.0)
-        features["is_self_employed"] = 1.0 if self.traditional.is_self_employed else 0.0
-        features["income_verified"] = 1.0 if self.traditional.income_verified else 0.0
-        features["dti_ratio"] = min(self.traditional.debt_to_income_ratio, 1.0)
-        features["ltv_ratio"] = min(self.traditional.loan_to_value_ratio, 1.0)
-        features["is_primary_residence"] = 1.0 if self.traditional.is_primary_residence else 0.0
-        features["reserves_months_normalized"] = min(self.traditional.reserves_months / 12, 1.0)
-
-        # ============ PROFESSIONAL FEATURES ============
-        features["current_job_months_normalized"] = min(self.professional.current_job_months / 120, 1.0)
-        features["total_experience_years_normalized"] = min(self.professional.total_experience_years / 30, 1.0)
-        features["jobs_last_5_years_normalized"] = min(self.professional.jobs_last_5_years / 5, 1.0)
-        features["career_trajectory_normalized"] = self.professional.career_trajectory / 5
-        features["education_level_normalized"] = self.professional.education_level / 5
-        features["has_advanced_degree"] = 1.0 if self.professional.has_advanced_degree else 0.0
-        features["industry_stability"] = self.professional.industry_stability
-        features["profile_completeness"] = self.professional.profile_completeness
-        features["has_recommendations"] = 1.0 if self.professional.has_recommendations else 0.0
-        features["connection_count_normalized"] = self.professional.connection_count_tier / 3
-        features["employment_gaps_normalized"] = min(self.professional.employment_gaps / 3, 1.0)
-        features["frequent_job_changes"] = 1.0 if self.professional.frequent_job_changes else 0.0
-        features["profile_inconsistencies_normalized"] = min(self.professional.profile_inconsistencies / 3, 1.0)
-        features["job_stability_score"] = self.professional.job_stability_score
-        features["professional_credibility_score"] = self.professional.professional_credibility_score
-
-        # ============ LIFESTYLE FEATURES ============
-        features["lifestyle_level_normalized"] = self.lifestyle.lifestyle_level / 5
-        features["spending_vs_income"] = self.lifestyle.apparent_spending_vs_income
-        features["luxury_items_visible"] = 1.0 if self.lifestyle.luxury_items_visible else 0.0
-        features["frequent_expensive_travel"] = 1.0 if self.lifestyle.frequent_expensive_travel else 0.0
-        features["vehicle_tier_normalized"] = self.lifestyle.vehicle_tier / 3
-        features["housing_quality_normalized"] = self.lifestyle.housing_quality_apparent / 3
-        features["appears_homeowner"] = 1.0 if self.lifestyle.appears_homeowner else 0.0
-        features["location_cost_of_living"] = self.lifestyle.location_cost_of_living
-        features["travel_frequency_normalized"] = self.lifestyle.travel_frequency / 3
-        features["expensive_hobbies"] = 1.0 if self.lifestyle.expensive_hobbies else 0.0
-        features["gambling_indicators"] = 1.0 if self.lifestyle.gambling_indicators else 0.0
-        features["substance_use_indicators"] = 1.0 if self.lifestyle.substance_use_indicators else 0.0
-        features["financial_responsibility_signals"] = min(self.lifestyle.financial_responsibility_signals / 5, 1.0)
-        features["financial_irresponsibility_signals"] = min(self.lifestyle.financial_irresponsibility_signals / 5, 1.0)
-        features["lifestyle_stability_score"] = self.lifestyle.lifestyle_stability_score
-        features["income_lifestyle_alignment"] = self.lifestyle.income_lifestyle_alignment
-
-        # ============ SOCIAL CONNECTEDNESS FEATURES ============
-        features["followers_tier_normalized"] = self.social.total_followers_tier / 3
-        features["engagement_rate"] = self.social.engagement_rate
-        features["authentic_connections"] = self.social.authentic_connections
-        features["relationship_status_normalized"] = self.social.relationship_status / 4
-        features["family_presence"] = self.social.family_presence_in_content
-        features["stable_relationship"] = 1.0 if self.social.appears_stable_relationship else 0.0
-        features["has_children"] = 1.0 if self.social.has_children else 0.0
-        features["community_involvement"] = self.social.community_involvement
-        features["group_memberships_normalized"] = min(self.social.group_memberships / 10, 1.0)
-        features["volunteer_charity"] = 1.0 if self.social.volunteer_charity_involvement else 0.0
-        features["religious_community"] = 1.0 if self.social.religious_community_ties else 0.0
-        features["long_term_friendships"] = 1.0 if self.social.long_term_friendships_visible else 0.0
-        features["local_community_ties"] = self.social.local_community_ties
-        features["geographic_stability"] = self.social.geographic_stability
-        features["social_isolation"] = 1.0 if self.social.social_isolation_indicators else 0.0
-        features["conflict_drama_normalized"] = min(self.social.conflict_drama_indicators / 5, 1.0)
-        features["relationship_instability_normalized"] = min(self.social.relationship_instability_signals / 5, 1.0)
-        features["social_support_score"] = self.social.social_support_score
-        features["community_rootedness_score"] = self.social.community_rootedness_score
-        features["relationship_stability_score"] = self.social.relationship_stability_score
+        return _model_input_dict(self)
 
-        return features
+    def to_model_vector(self) -> np.ndarray:
+        """Normalized features as a vector ordered like MODEL_FEATURE_NAMES."""
+        return model_input_matrix([self])[0]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to nested dict for serialization."""
         return {
-            "traditional": asdict(self.traditional),
-            "professional": asdict(self.professional),
-            "lifestyle": asdict(self.lifestyle),
-            "social": asdict(self.social)
+            "traditional": _shallow_asdict(self.traditional),
+            "professional": _shallow_asdict(self.professional),
+            "lifestyle": _shallow_asdict(self.lifestyle),
+            "social": _shallow_asdict(self.social)
+        }
+
+
+# =============================================================================
+# MODEL INPUT NORMALIZATION
+# =============================================================================
+# One row per model feature: (name, feature group, source field, offset,
+# scale, lower bound, upper bound). Each value is normalized as
+# (field - offset) / scale and then clamped; None means unbounded. Booleans
+# become 1.0 / 0.0.
+MODEL_FEATURE_SPEC = (
+    # ============ TRADITIONAL FEATURES ============
+    ("credit_score_normalized", "traditional", "credit_score", 300, 550, 0.0, None),
+    ("credit_history_years", "traditional", "credit_history_years", 0, 30, None, 1.0),
+    ("annual_income_log", "traditional", "annual_income", 0, 500000, None, 1.0),
+    ("employment_length_normalized", "traditional", "employment_length_months", 0, 120, None, 1.0),
+    ("is_self_employed", "traditional", "is_self_employed", 0, 1, None, None),
+    ("income_verified", "traditional", "income_verified", 0, 1, None, None),
+    ("dti_ratio", "traditional", "debt_to_income_ratio", 0, 1, None, 1.0),
+    ("ltv_ratio", "traditional", "loan_to_value_ratio", 0, 1, None, 1.0),
+    ("is_primary_residence", "traditional", "is_primary_residence", 0, 1, None, None),
+    ("reserves_months_normalized", "traditional", "reserves_months", 0, 12, None, 1.0),
+
+    # ============ PROFESSIONAL FEATURES ============
+    ("current_job_months_normalized", "professional", "current_job_months", 0, 120, None, 1.0),
+    ("total_experience_years_normalized", "professional", "total_experience_years", 0, 30, None, 1.0),
+    ("jobs_last_5_years_normalized", "professional", "jobs_last_5_years", 0, 5, None, 1.0),
+    ("career_trajectory_normalized", "professional", "career_trajectory", 0, 5, None, None),
+    ("education_level_normalized", "professional", "education_level", 0, 5, None, None),
+    ("has_advanced_degree", "professional", "has_advanced_degree", 0, 1, None, None),
+    ("industry_stability", "professional", "industry_stability", 0, 1, None, None),
+    ("profile_completeness", "professional", "profile_completeness", 0, 1, None, None),
+    ("has_recommendations", "professional", "has_recommendations", 0, 1, None, None),
+    ("connection_count_normalized", "professional", "connection_count_tier", 0, 3, None, None),
+    ("employment_gaps_normalized", "professional", "employment_gaps", 0, 3, None, 1.0),
+    ("frequent_job_changes", "professional", "frequent_job_changes", 0, 1, None, None),
+    ("profile_inconsistencies_normalized", "professional", "profile_inconsistencies", 0, 3, None, 1.0),
+    ("job_stability_score", "professional", "job_stability_score", 0, 1, None, None),
+    ("professional_credibility_score", "professional", "professional_credibility_score", 0, 1, None, None),
+
+    # ============ LIFESTYLE FEATURES ============
+    ("lifestyle_level_normalized", "lifestyle", "lifestyle_level", 0, 5, None, None),
+    ("spending_vs_income", "lifestyle", "apparent_spending_vs_income", 0, 1, None, None),
+    ("luxury_items_visible", "lifestyle", "luxury_items_visible", 0, 1, None, None),
+    ("frequent_expensive_travel", "lifestyle", "frequent_expensive_travel", 0, 1, None, None),
+    ("vehicle_tier_normalized", "lifestyle", "vehicle_tier", 0, 3, None, None),
+    ("housing_quality_normalized", "lifestyle", "housing_quality_apparent", 0, 3, None, None),
+    ("appears_homeowner", "lifestyle", "appears_homeowner", 0, 1, None, None),
+    ("location_cost_of_living", "lifestyle", "location_cost_of_living", 0, 1, None, None),
+    ("travel_frequency_normalized", "lifestyle", "travel_frequency", 0, 3, None, None),
+    ("expensive_hobbies", "lifestyle", "expensive_hobbies", 0, 1, None, None),
+    ("gambling_indicators", "lifestyle", "gambling_indicators", 0, 1, None, None),
+    ("substance_use_indicators", "lifestyle", "substance_use_indicators", 0, 1, None, None),
+    ("financial_responsibility_signals", "lifestyle", "financial_responsibility_signals", 0, 5, None, 1.0),
+    ("financial_irresponsibility_signals", "lifestyle", "financial_irresponsibility_signals", 0, 5, None, 1.0),
+    ("lifestyle_stability_score", "lifestyle", "lifestyle_stability_score", 0, 1, None, None),
+    ("income_lifestyle_alignment", "lifestyle", "income_lifestyle_alignment", 0, 1, None, None),
+
+    # ============ SOCIAL CONNECTEDNESS FEATURES ============
+    ("followers_tier_normalized", "social", "total_followers_tier", 0, 3, None, None),
+    ("engagement_rate", "social", "engagement_rate", 0, 1, None, None),
+    ("authentic_connections", "social", "authentic_connections", 0, 1, None, None),
+    ("relationship_status_normalized", "social", "relationship_status", 0, 4, None, None),
+    ("family_presence", "social", "family_presence_in_content", 0, 1, None, None),
+    ("stable_relationship", "social", "appears_stable_relationship", 0, 1, None, None),
+    ("has_children", "social", "has_children", 0, 1, None, None),
+    ("community_involvement", "social", "community_involvement", 0, 1, None, None),
+    ("group_memberships_normalized", "social", "group_memberships", 0, 10, None, 1.0),
+    ("volunteer_charity", "social", "volunteer_charity_involvement", 0, 1, None, None),
+    ("religious_community", "social", "religious_community_ties", 0, 1, None, None),
+    ("long_term_friendships", "social", "long_term_friendships_visible", 0, 1, None, None),
+    ("local_community_ties", "social", "local_community_ties", 0, 1, None, None),
+    ("geographic_stability", "social", "geographic_stability", 0, 1, None, None),
+    ("social_isolation", "social", "social_isolation_indicators", 0, 1, None, None),
+    ("conflict_drama_normalized", "social", "conflict_drama_indicators", 0, 5, None, 1.0),
+    ("relationship_instability_normalized", "social", "relationship_instability_signals", 0, 5, None, 1.0),
+    ("social_support_score", "social", "social_support_score", 0, 1, None, None),
+    ("community_rootedness_score", "social", "community_rootedness_score", 0, 1, None, None),
+    ("relationship_stability_score", "social", "relationship_stability_score", 0, 1, None, None),
+)
+
+MODEL_FEATURE_NAMES = tuple(row[0] for row in MODEL_FEATURE_SPEC)
+# Column of each feature in to_model_vector / model_input_matrix output
+MODEL_FEATURE_INDEX = MappingProxyType({name: i for i, name in enumerate(MODEL_FEATURE_NAMES)})
+# Reads every source field of a CombinedFeatures in one C-level call
+_model_feature_values = attrgetter(*(f"{row[1]}.{row[2]}" for row in MODEL_FEATURE_SPEC))
+_MODEL_OFFSETS = np.array([row[3] for row in MODEL_FEATURE_SPEC], dtype=np.float64)
+_MODEL_SCALES = np.array([row[4] for row in MODEL_FEATURE_SPEC], dtype=np.float64)
+_MODEL_LOWER = np.array([-np.inf if row[5] is None else row[5] for row in MODEL_FEATURE_SPEC])
+_MODEL_UPPER = np.array([np.inf if row[6] is None else row[6] for row in MODEL_FEATURE_SPEC])
+
+
+def _compile_model_input():
+    """
+    Generate a straight-line to_model_input body from MODEL_FEATURE_SPEC.
+
+    Each group is bound to a local once and every feature becomes a single
+    inline expression, avoiding the numpy round trip for one bundle. The
+    arithmetic mirrors model_input_matrix (subtract, divide, clamp upper then
+    lower), so both paths produce identical values.
+    """
+    lines = [
+        "def _model_input_dict(self):",
+        "    traditional = self.traditional",
+        "    professional = self.professional",
+        "    lifestyle = self.lifestyle",
+        "    social = self.social",
+        "    return {",
+    ]
+    for name, group, attr, offset, scale, lower, upper in MODEL_FEATURE_SPEC:
+        expr = f"({group}.{attr} - {float(offset)!r}) / {float(scale)!r}"
+        if upper is not None:
+            expr = f"_min({expr}, {float(upper)!r})"
+        if lower is not None:
+            expr = f"_max({expr}, {float(lower)!r})"
+        lines.append(f"        {name!r}: {expr},")
+    lines.append("    }")
+    namespace = {"_min": min, "_max": max}
+    exec(compile("\n".join(lines), "<model_input>", "exec"), namespace)
+    return namespace["_model_input_dict"]
+
+
+_model_input_dict = _compile_model_input()
+
+
+def model_input_matrix(features: Sequence[CombinedFeatures]) -> np.ndarray:
+    """
+    Normalize many feature bundles at once.
+
+    Returns a (len(features), len(MODEL_FEATURE_NAMES)) float64 array whose
+    rows match CombinedFeatures.to_model_input() for each bundle.
+    """
+    width = len(MODEL_FEATURE_NAMES)
+    raw = np.fromiter(
+        (value for bundle in features for value in _model_feature_values(bundle)),
+        dtype=np.float64,
+        count=len(features) * width
+    ).reshape(len(features), width)
+    out = np.subtract(raw, _MODEL_OFFSETS, out=raw)
+    np.divide(out, _MODEL_SCALES, out=out)
+    np.minimum(out, _MODEL_UPPER, out=out)
+    np.maximum(out, _MODEL_LOWER, out=out)
+    return out
+
+
+def pack_model_inputs(matrix: np.ndarray) -> Tuple[Dict[str, Any], memoryview]:
+    """
+    Split a model input matrix into a small header and its raw buffer.
+
+    The buffer is a view of the array's memory (no per-float encoding), so
+    it can be handed straight to a socket or shared-memory writer when the
+    scorer runs in another process. Rebuild it with unpack_model_inputs.
+    """
+    matrix = np.ascontiguousarray(matrix)
+    header = {
+        "dtype": matrix.dtype.str,
+        "shape": matrix.shape,
+        "features": MODEL_FEATURE_NAMES,
+    }
+    return header, memoryview(matrix).cast("B")
+
+
+def unpack_model_inputs(header: Dict[str, Any], buffer) -> np.ndarray:
+    """Rebuild a model input matrix from pack_model_inputs output without copying."""
+    if tuple(header["features"]) != MODEL_FEATURE_NAMES:
+        raise ValueError("Model input features do not match MODEL_FEATURE_NAMES")
+    return np.frombuffer(buffer, dtype=np.dtype(header["dtype"])).reshape(header["shape"])
+
+
+# Industry stability ratings (higher = more stable)
+_INDUSTRY_STABILITY = MappingProxyType({
+    "healthcare": 0.9,
+    "government": 0.95,
+    "education": 0.85,
+    "finance": 0.8,
+    "technology": 0.7,
+    "consulting": 0.6,
+    "retail": 0.5,
+    "hospitality": 0.4,
+    "entertainment": 0.45,
+    "construction": 0.55,
+    "manufacturing": 0.65,
+    "real estate": 0.6,
+    "energy": 0.7,
+    "agriculture": 0.6,
+    "transportation": 0.65,
+    "legal": 0.85,
+    "nonprofit": 0.7,
+    "default": 0.5
+})
+
+
+@lru_cache(maxsize=256)
+def _industry_stability(industry: str) -> Tuple[str, float]:
+    """Normalized industry name and its stability rating."""
+    industry = industry.lower()
+    return industry, _INDUSTRY_STABILITY.get(industry, _INDUSTRY_STABILITY["default"])
+
+
+def _clamp01(x: float) -> float:
+    """Clamp a score to [0, 1] (cheaper than max(0.0, min(1.0, x)))."""
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+# (field, default, dtype) for the numeric columns of
+# FeatureExtractor.extract_traditional_features_batch; the DTI and LTV
+# ratios are filled in afterwards since they may be derived
+_TRADITIONAL_BATCH_COLUMNS = (
+    ("credit_score", 0, np.float64),
+    ("credit_history_years", 0, np.float64),
+    ("annual_income", 0, np.float64),
+    ("employment_length_months", 0, np.int64),
+    ("is_self_employed", False, np.bool_),
+    ("income_verified", False, np.bool_),
+    ("monthly_debt_payments", 0, np.float64),
+    ("loan_amount", 0, np.float64),
+    ("property_value", 0, np.float64),
+    ("is_primary_residence", True, np.bool_),
+    ("total_assets", 0, np.float64),
+    ("liquid_assets", 0, np.float64),
+    ("reserves_months", 0, np.int64),
+)
+
+# LLM label -> feature value tables used by the _build_*_features methods
+# Professional profile labels
+_TRAJECTORY_MAP = {"declining": 1, "unstable": 2, "stable": 3, "growing": 4, "rapidly_growing": 5}
+_EDUCATION_MAP = {"unknown": 0, "high_school": 1, "associate": 2, "bachelor": 3, "master": 4, "phd": 5}
+_CONNECTION_MAP = {"low": 1, "medium": 2, "high": 3}
+# Lifestyle labels
+_LIFESTYLE_MAP = {"frugal": 1, "modest": 2, "comfortable": 3, "affluent": 4, "lavish": 5}
+_SPENDING_MAP = {"underspending": 0.2, "balanced": 0.5, "overspending": 0.8}
+_VEHICLE_MAP = {"economy": 1, "standard": 2, "luxury": 3}
+_HOUSING_MAP = {"modest": 1, "average": 2, "upscale": 3}
+_TRAVEL_MAP = {"rarely": 1, "occasionally": 2, "frequently": 3}
+# Social connectedness labels
+_TIER_MAP = {"low": 1, "medium": 2, "high": 3}
+_ENGAGEMENT_MAP = {"low": 0.2, "medium": 0.5, "high": 0.8}
+_RELATIONSHIP_MAP = {"unknown": 0, "single": 1, "in_relationship": 2, "married": 3, "married_with_children": 4}
+_FAMILY_MAP = {"none": 0.1, "occasional": 0.5, "frequent": 0.9}
+_COMMUNITY_MAP = {"none": 0.0, "low": 0.3, "medium": 0.6, "high": 0.9}
+_TIES_MAP = {"weak": 0.2, "moderate": 0.5, "strong": 0.8}
+
+
+# JSON schemas for the LLM structured extraction of each profile feature group
+_PROFESSIONAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "current_job_months": {"type": "integer", "description": "Months at current job"},
+        "total_experience_years": {"type": "number", "description": "Total years of experience"},
+        "jobs_last_5_years": {"type": "integer", "description": "Number of jobs in last 5 years"},
+        "career_trajectory": {
+            "type": "string",
+            "enum": ["declining", "unstable", "stable", "growing", "rapidly_growing"]
+        },
+        "education_level": {
+            "type": "string",
+            "enum": ["unknown", "high_school", "associate", "bachelor", "master", "phd"]
+        },
+        "industry": {"type": "string", "description": "Primary industry/sector"},
+        "profile_completeness": {"type": "number", "description": "0-1 scale"},
+        "has_recommendations": {"type": "boolean"},
+        "connection_count": {"type": "string", "enum": ["low", "medium", "high"]},
+        "employment_gaps": {"type": "integer"},
+        "red_flags": {"type": "array", "items": {"type": "string"}}
+    }
+}
+
+_LIFESTYLE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "lifestyle_level": {
+            "type": "string",
+            "enum": ["frugal", "modest", "comfortable", "affluent", "lavish"],
+            "description": "Apparent lifestyle/spending level"
+        },
+        "spending_vs_income": {
+            "type": "string",
+            "enum": ["underspending", "balanced", "overspending"],
+            "description": "Does spending appear to match typical income for their profession?"
+        },
+        "luxury_items_visible": {"type": "boolean", "description": "Designer goods, expensive watches, etc."},
+        "frequent_expensive_travel": {"type": "boolean", "description": "Multiple luxury vacations per year"},
+        "vehicle_type": {
+            "type": "string",
+            "enum": ["economy", "standard", "luxury"],
+            "description": "Type of vehicle if visible"
+        },
+        "housing_quality": {
+            "type": "string",
+            "enum": ["modest", "average", "upscale"],
+            "description": "Apparent housing quality"
+        },
+        "appears_homeowner": {"type": "boolean"},
+        "travel_frequency": {
+            "type": "string",
+            "enum": ["rarely", "occasionally", "frequently"]
+        },
+        "expensive_hobbies": {"type": "boolean", "description": "Golf, yachting, etc."},
+        "gambling_indicators": {"type": "boolean", "description": "Casino visits, betting posts"},
+        "substance_use_indicators": {"type": "boolean", "description": "Excessive alcohol, drug references"},
+        "financial_responsibility_signals": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Positive financial indicators (investing posts, budgeting, etc.)"
+        },
+        "financial_irresponsibility_signals": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Concerning financial indicators"
         }
+    }
+}
+
+_SOCIAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "follower_tier": {
+            "type": "string",
+            "enum": ["low", "medium", "high"],
+            "description": "low=<500, medium=500-5000, high=>5000"
+        },
+        "engagement_quality": {
+            "type": "string",
+            "enum": ["low", "medium", "high"],
+            "description": "Quality of engagement on posts"
+        },
+        "authentic_connections": {"type": "boolean", "description": "Appear to be real connections vs bought"},
+        "relationship_status": {
+            "type": "string",
+            "enum": ["unknown", "single", "in_relationship", "married", "married_with_children"]
+        },
+        "family_presence": {
+            "type": "string",
+            "enum": ["none", "occasional", "frequent"],
+            "description": "How often family appears in content"
+        },
+        "appears_stable_relationship": {"type": "boolean"},
+        "has_children": {"type": "boolean"},
+        "community_involvement": {
+            "type": "string",
+            "enum": ["none", "low", "medium", "high"]
+        },
+        "group_memberships": {"type": "integer"},
+        "volunteer_charity": {"type": "boolean"},
+        "religious_community": {"type": "boolean"},
+        "long_term_friendships": {"type": "boolean", "description": "Evidence of long-term friendships"},
+        "local_ties": {
+            "type": "string",
+            "enum": ["weak", "moderate", "strong"],
+            "description": "Ties to local community"
+        },
+        "geographic_stability": {"type": "boolean", "description": "Appears settled vs frequent moves"},
+        "social_isolation_indicators": {"type": "boolean"},
+        "conflict_indicators": {"type": "integer", "description": "Count of drama/conflict posts"},
+        "relationship_instability": {"type": "integer", "description": "Count of relationship issues"}
+    }
+}
+
+_EXTRACTION_SCHEMAS = {
+    "professional": _PROFESSIONAL_SCHEMA,
+    "lifestyle": _LIFESTYLE_SCHEMA,
+    "social": _SOCIAL_SCHEMA,
+}
 
 
 class FeatureExtractor:
@@ -283,35 +616,114 @@ class FeatureExtractor:
     """
 
     # Industry stability ratings (higher = more stable)
-    INDUSTRY_STABILITY = {
-        "healthcare": 0.9,
-        "government": 0.95,
-        "education": 0.85,
-        "finance": 0.8,
-        "technology": 0.7,
-        "consulting": 0.6,
-        "retail": 0.5,
-        "hospitality": 0.4,
-        "entertainment": 0.45,
-        "construction": 0.55,
-        "manufacturing": 0.65,
-        "real estate": 0.6,
-        "energy": 0.7,
-        "agriculture": 0.6,
-        "transportation": 0.65,
-        "legal": 0.85,
-        "nonprofit": 0.7,
-        "default": 0.5
-    }
+    INDUSTRY_STABILITY = _INDUSTRY_STABILITY
+
+    # Maximum number of LLM extractions remembered per extractor
+    EXTRACTION_CACHE_SIZE = 4096
 
-    def __init__(self, keywords_client: KeywordsAIClient = None):
+    def __init__(self, keywords_client: KeywordsAIClient = None, use_cache: bool = True):
         """
         Initialize the feature extractor.
 
         Args:
             keywords_client: Keywords AI client for profile analysis
+            use_cache: Reuse LLM extractions for identical analysis text
+                (disable to force fresh extractions, e.g. when retraining)
         """
         self.keywords_client = keywords_client
+        self.use_cache = use_cache
+        self._extraction_cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+
+    def _extract_structured(self, kind: str, analysis_text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the LLM structured extraction for one feature group.
+
+        Results are memoized on (feature group, digest of the analysis text)
+        since the remote call dominates feature extraction time. Failures are
+        not cached.
+        """
+        cached = self._cached_extraction(kind, analysis_text)
+        if cached is not None:
+            return cached
+
+        extracted = self.keywords_client.extract_structured_data(text=analysis_text, schema=schema)
+        self._cache_extraction(kind, analysis_text, extracted)
+        return extracted
+
+    def _extract_structured_many(self, analyses: Dict[str, str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Run the structured extraction for several feature groups in one LLM call.
+
+        Args:
+            analyses: Analysis text per feature group ("professional",
+                "lifestyle", "social")
+
+        Returns:
+            Extracted data per feature group, or None for a group whose
+            extraction failed
+        """
+        results = {kind: self._cached_extraction(kind, text) for kind, text in analyses.items()}
+        pending = [kind for kind, extracted in results.items() if extracted is None]
+        if len(pending) == 1:
+            kind = pending[0]
+            try:
+                results[kind] = self._extract_structured(kind, analyses[kind], _EXTRACTION_SCHEMAS[kind])
+            except Exception as e:
+                print(f"Warning: Could not extract {kind} features: {e}")
+            return results
+        if not pending:
+            return results
+
+        # Groups sharing the same text (e.g. lifestyle and social) share a section
+        sections: Dict[str, List[str]] = {}
+        for kind in pending:
+            sections.setdefault(analyses[kind], []).append(kind)
+        text = "\n\n".join(
+            f"### {' and '.join(kinds)} analysis\n{section}"
+            for section, kinds in sections.items()
+        )
+        schema = {
+            "type": "object",
+            "properties": {kind: _EXTRACTION_SCHEMAS[kind] for kind in pending}
+        }
+
+        try:
+            extracted = self.keywords_client.extract_structured_data(text=text, schema=schema)
+        except Exception as e:
+            print(f"Warning: Could not extract {', '.join(pending)} features: {e}")
+            return results
+
+        for kind in pending:
+            part = extracted.get(kind)
+            if isinstance(part, dict):
+                results[kind] = part
+                self._cache_extraction(kind, analyses[kind], part)
+            else:
+                print(f"Warning: Could not extract {kind} features: missing from response")
+        return results
+
+    def _cached_extraction(self, kind: str, analysis_text: str) -> Optional[Dict[str, Any]]:
+        """Previously extracted data for a feature group and text, if cached."""
+        if not self.use_cache:
+            return None
+        key = (kind, hashlib.blake2b(analysis_text.encode("utf-8"), digest_size=16).digest())
+        cached = self._extraction_cache.get(key)
+        if cached is not None:
+            self._extraction_cache.move_to_end(key)
+        return cached
+
+    def _cache_extraction(self, kind: str, analysis_text: str, extracted: Dict[str, Any]) -> None:
+        """Remember extracted data for a feature group and text."""
+        if not self.use_cache:
+            return
+        key = (kind, hashlib.blake2b(analysis_text.encode("utf-8"), digest_size=16).digest())
+        self._extraction_cache[key] = extracted
+        if len(self._extraction_cache) > self.EXTRACTION_CACHE_SIZE:
+            self._extraction_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget all memoized LLM extractions."""
+        self._extraction_cache.clear()
 
     def extract_traditional_features(self, data: Dict[str, Any]) -> TraditionalFeatures:
         """
@@ -362,6 +774,41 @@ class FeatureExtractor:
 
         return features
 
+    def extract_traditional_features_batch(self, records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Columnar version of extract_traditional_features for many applicants.
+
+        Returns one array per numeric TraditionalFeatures field, each of
+        length len(records), with the same defaults and derived DTI/LTV
+        ratios as the single-record path.
+        """
+        n = len(records)
+        columns = {
+            name: np.fromiter(
+                (r.get(name, default) for r in records), dtype=dtype, count=n
+            )
+            for name, default, dtype in _TRADITIONAL_BATCH_COLUMNS
+        }
+
+        # Ratios: an explicit value wins, otherwise derive it (0 when undefined)
+        income = columns["annual_income"]
+        monthly_debt = columns["monthly_debt_payments"]
+        derived_dti = np.divide(
+            monthly_debt, income / 12, out=np.zeros(n), where=income > 0
+        )
+        loan_amount = columns["loan_amount"]
+        property_value = columns["property_value"]
+        derived_ltv = np.divide(
+            loan_amount, property_value, out=np.zeros(n), where=property_value > 0
+        )
+        for name, derived in (("debt_to_income_ratio", derived_dti), ("loan_to_value_ratio", derived_ltv)):
+            given = np.fromiter(
+                (r.get(name, np.nan) for r in records), dtype=np.float64, count=n
+            )
+            columns[name] = np.where(np.isnan(given), derived, given)
+
+        return columns
+
     def extract_professional_features(self, analysis_text: str) -> ProfessionalFeatures:
         """
         Extract professional features from LinkedIn/professional profile analysis.
@@ -369,31 +816,8 @@ class FeatureExtractor:
         if not self.keywords_client:
             raise ValueError("Keywords AI client required for feature extraction")
 
-        schema = {
-            "type": "object",
-            "properties": {
-                "current_job_months": {"type": "integer", "description": "Months at current job"},
-                "total_experience_years": {"type": "number", "description": "Total years of experience"},
-                "jobs_last_5_years": {"type": "integer", "description": "Number of jobs in last 5 years"},
-                "career_trajectory": {
-                    "type": "string",
-                    "enum": ["declining", "unstable", "stable", "growing", "rapidly_growing"]
-                },
-                "education_level": {
-                    "type": "string",
-                    "enum": ["unknown", "high_school", "associate", "bachelor", "master", "phd"]
-                },
-                "industry": {"type": "string", "description": "Primary industry/sector"},
-                "profile_completeness": {"type": "number", "description": "0-1 scale"},
-                "has_recommendations": {"type": "boolean"},
-                "connection_count": {"type": "string", "enum": ["low", "medium", "high"]},
-                "employment_gaps": {"type": "integer"},
-                "red_flags": {"type": "array", "items": {"type": "string"}}
-            }
-        }
-
         try:
-            extracted = self.keywords_client.extract_structured_data(text=analysis_text, schema=schema)
+            extracted = self._extract_structured("professional", analysis_text, _PROFESSIONAL_SCHEMA)
         except Exception as e:
             print(f"Warning: Could not extract professional features: {e}")
             return ProfessionalFeatures()
@@ -408,31 +832,23 @@ class FeatureExtractor:
         features.total_experience_years = float(extracted.get("total_experience_years", 0))
         features.jobs_last_5_years = int(extracted.get("jobs_last_5_years", 1))
 
-        trajectory_map = {
-            "declining": 1, "unstable": 2, "stable": 3, "growing": 4, "rapidly_growing": 5
-        }
-        features.career_trajectory = trajectory_map.get(
+        features.career_trajectory = _TRAJECTORY_MAP.get(
             extracted.get("career_trajectory", "stable"), 3
         )
 
-        education_map = {
-            "unknown": 0, "high_school": 1, "associate": 2, "bachelor": 3, "master": 4, "phd": 5
-        }
-        features.education_level = education_map.get(
+        features.education_level = _EDUCATION_MAP.get(
             extracted.get("education_level", "unknown"), 0
         )
         features.has_advanced_degree = features.education_level >= 4
 
-        features.industry = extracted.get("industry", "").lower()
-        features.industry_stability = self.INDUSTRY_STABILITY.get(
-            features.industry, self.INDUSTRY_STABILITY["default"]
+        features.industry, features.industry_stability = _industry_stability(
+            extracted.get("industry", "")
         )
 
         features.profile_completeness = float(extracted.get("profile_completeness", 0.5))
         features.has_recommendations = bool(extracted.get("has_recommendations", False))
 
-        connection_map = {"low": 1, "medium": 2, "high": 3}
-        features.connection_count_tier = connection_map.get(
+        features.connection_count_tier = _CONNECTION_MAP.get(
             extracted.get("connection_count", "medium"), 2
         )
 
@@ -453,54 +869,8 @@ class FeatureExtractor:
         if not self.keywords_client:
             raise ValueError("Keywords AI client required for feature extraction")
 
-        schema = {
-            "type": "object",
-            "properties": {
-                "lifestyle_level": {
-                    "type": "string",
-                    "enum": ["frugal", "modest", "comfortable", "affluent", "lavish"],
-                    "description": "Apparent lifestyle/spending level"
-                },
-                "spending_vs_income": {
-                    "type": "string",
-                    "enum": ["underspending", "balanced", "overspending"],
-                    "description": "Does spending appear to match typical income for their profession?"
-                },
-                "luxury_items_visible": {"type": "boolean", "description": "Designer goods, expensive watches, etc."},
-                "frequent_expensive_travel": {"type": "boolean", "description": "Multiple luxury vacations per year"},
-                "vehicle_type": {
-                    "type": "string",
-                    "enum": ["economy", "standard", "luxury"],
-                    "description": "Type of vehicle if visible"
-                },
-                "housing_quality": {
-                    "type": "string",
-                    "enum": ["modest", "average", "upscale"],
-                    "description": "Apparent housing quality"
-                },
-                "appears_homeowner": {"type": "boolean"},
-                "travel_frequency": {
-                    "type": "string",
-                    "enum": ["rarely", "occasionally", "frequently"]
-                },
-                "expensive_hobbies": {"type": "boolean", "description": "Golf, yachting, etc."},
-                "gambling_indicators": {"type": "boolean", "description": "Casino visits, betting posts"},
-                "substance_use_indicators": {"type": "boolean", "description": "Excessive alcohol, drug references"},
-                "financial_responsibility_signals": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Positive financial indicators (investing posts, budgeting, etc.)"
-                },
-                "financial_irresponsibility_signals": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Concerning financial indicators"
-                }
-            }
-        }
-
         try:
-            extracted = self.keywords_client.extract_structured_data(text=analysis_text, schema=schema)
+            extracted = self._extract_structured("lifestyle", analysis_text, _LIFESTYLE_SCHEMA)
         except Exception as e:
             print(f"Warning: Could not extract lifestyle features: {e}")
             return LifestyleFeatures()
@@ -511,31 +881,26 @@ class FeatureExtractor:
         """Build LifestyleFeatures from extracted data."""
         features = LifestyleFeatures()
 
-        lifestyle_map = {"frugal": 1, "modest": 2, "comfortable": 3, "affluent": 4, "lavish": 5}
-        features.lifestyle_level = lifestyle_map.get(
+        features.lifestyle_level = _LIFESTYLE_MAP.get(
             extracted.get("lifestyle_level", "comfortable"), 3
         )
 
-        spending_map = {"underspending": 0.2, "balanced": 0.5, "overspending": 0.8}
-        features.apparent_spending_vs_income = spending_map.get(
+        features.apparent_spending_vs_income = _SPENDING_MAP.get(
             extracted.get("spending_vs_income", "balanced"), 0.5
         )
 
         features.luxury_items_visible = bool(extracted.get("luxury_items_visible", False))
         features.frequent_expensive_travel = bool(extracted.get("frequent_expensive_travel", False))
 
-        vehicle_map = {"economy": 1, "standard": 2, "luxury": 3}
-        features.vehicle_tier = vehicle_map.get(extracted.get("vehicle_type", "standard"), 2)
+        features.vehicle_tier = _VEHICLE_MAP.get(extracted.get("vehicle_type", "standard"), 2)
 
-        housing_map = {"modest": 1, "average": 2, "upscale": 3}
-        features.housing_quality_apparent = housing_map.get(
+        features.housing_quality_apparent = _HOUSING_MAP.get(
             extracted.get("housing_quality", "average"), 2
         )
 
         features.appears_homeowner = bool(extracted.get("appears_homeowner", False))
 
-        travel_map = {"rarely": 1, "occasionally": 2, "frequently": 3}
-        features.travel_frequency = travel_map.get(
+        features.travel_frequency = _TRAVEL_MAP.get(
             extracted.get("travel_frequency", "occasionally"), 2
         )
 
@@ -563,53 +928,8 @@ class FeatureExtractor:
         if not self.keywords_client:
             raise ValueError("Keywords AI client required for feature extraction")
 
-        schema = {
-            "type": "object",
-            "properties": {
-                "follower_tier": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"],
-                    "description": "low=<500, medium=500-5000, high=>5000"
-                },
-                "engagement_quality": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"],
-                    "description": "Quality of engagement on posts"
-                },
-                "authentic_connections": {"type": "boolean", "description": "Appear to be real connections vs bought"},
-                "relationship_status": {
-                    "type": "string",
-                    "enum": ["unknown", "single", "in_relationship", "married", "married_with_children"]
-                },
-                "family_presence": {
-                    "type": "string",
-                    "enum": ["none", "occasional", "frequent"],
-                    "description": "How often family appears in content"
-                },
-                "appears_stable_relationship": {"type": "boolean"},
-                "has_children": {"type": "boolean"},
-                "community_involvement": {
-                    "type": "string",
-                    "enum": ["none", "low", "medium", "high"]
-                },
-                "group_memberships": {"type": "integer"},
-                "volunteer_charity": {"type": "boolean"},
-                "religious_community": {"type": "boolean"},
-                "long_term_friendships": {"type": "boolean", "description": "Evidence of long-term friendships"},
-                "local_ties": {
-                    "type": "string",
-                    "enum": ["weak", "moderate", "strong"],
-                    "description": "Ties to local community"
-                },
-                "geographic_stability": {"type": "boolean", "description": "Appears settled vs frequent moves"},
-                "social_isolation_indicators": {"type": "boolean"},
-                "conflict_indicators": {"type": "integer", "description": "Count of drama/conflict posts"},
-                "relationship_instability": {"type": "integer", "description": "Count of relationship issues"}
-            }
-        }
-
         try:
-            extracted = self.keywords_client.extract_structured_data(text=analysis_text, schema=schema)
+            extracted = self._extract_structured("social", analysis_text, _SOCIAL_SCHEMA)
         except Exception as e:
             print(f"Warning: Could not extract social features: {e}")
             return SocialConnectednessFeatures()
@@ -620,33 +940,26 @@ class FeatureExtractor:
         """Build SocialConnectednessFeatures from extracted data."""
         features = SocialConnectednessFeatures()
 
-        tier_map = {"low": 1, "medium": 2, "high": 3}
-        features.total_followers_tier = tier_map.get(extracted.get("follower_tier", "medium"), 2)
+        features.total_followers_tier = _TIER_MAP.get(extracted.get("follower_tier", "medium"), 2)
 
-        engagement_map = {"low": 0.2, "medium": 0.5, "high": 0.8}
-        features.engagement_rate = engagement_map.get(
+        features.engagement_rate = _ENGAGEMENT_MAP.get(
             extracted.get("engagement_quality", "medium"), 0.5
         )
 
         features.authentic_connections = 0.8 if extracted.get("authentic_connections", True) else 0.3
 
-        relationship_map = {
-            "unknown": 0, "single": 1, "in_relationship": 2, "married": 3, "married_with_children": 4
-        }
-        features.relationship_status = relationship_map.get(
+        features.relationship_status = _RELATIONSHIP_MAP.get(
             extracted.get("relationship_status", "unknown"), 0
         )
 
-        family_map = {"none": 0.1, "occasional": 0.5, "frequent": 0.9}
-        features.family_presence_in_content = family_map.get(
+        features.family_presence_in_content = _FAMILY_MAP.get(
             extracted.get("family_presence", "occasional"), 0.5
         )
 
         features.appears_stable_relationship = bool(extracted.get("appears_stable_relationship", False))
         features.has_children = bool(extracted.get("has_children", False))
 
-        community_map = {"none": 0.0, "low": 0.3, "medium": 0.6, "high": 0.9}
-        features.community_involvement = community_map.get(
+        features.community_involvement = _COMMUNITY_MAP.get(
             extracted.get("community_involvement", "low"), 0.3
         )
 
@@ -655,8 +968,7 @@ class FeatureExtractor:
         features.religious_community_ties = bool(extracted.get("religious_community", False))
         features.long_term_friendships_visible = bool(extracted.get("long_term_friendships", False))
 
-        ties_map = {"weak": 0.2, "moderate": 0.5, "strong": 0.8}
-        features.local_community_ties = ties_map.get(extracted.get("local_ties", "moderate"), 0.5)
+        features.local_community_ties = _TIES_MAP.get(extracted.get("local_ties", "moderate"), 0.5)
 
         features.geographic_stability = 0.8 if extracted.get("geographic_stability", True) else 0.3
         features.social_isolation_indicators = bool(extracted.get("social_isolation_indicators", False))
@@ -693,7 +1005,7 @@ class FeatureExtractor:
         trajectory_adjustment = (features.career_trajectory - 3) * 0.05
         score += trajectory_adjustment
 
-        return max(0.0, min(1.0, score))
+        return _clamp01(score)
 
     def _calculate_professional_credibility_score(self, features: ProfessionalFeatures) -> float:
         """Calculate professional credibility score (0-1)."""
@@ -707,7 +1019,7 @@ class FeatureExtractor:
             score += 0.1
         score += features.industry_stability * 0.05
 
-        return max(0.0, min(1.0, score))
+        return _clamp01(score)
 
     def _calculate_lifestyle_stability_score(self, features: LifestyleFeatures) -> float:
         """Calculate lifestyle stability score (0-1, higher = more stable/responsible)."""
@@ -731,7 +1043,7 @@ class FeatureExtractor:
         if features.appears_homeowner:
             score += 0.1
 
-        return max(0.0, min(1.0, score))
+        return _clamp01(score)
 
     def _calculate_income_lifestyle_alignment(self, features: LifestyleFeatures) -> float:
         """Calculate how well lifestyle aligns with apparent income (0-1)."""
@@ -744,7 +1056,7 @@ class FeatureExtractor:
         if features.frequent_expensive_travel and features.apparent_spending_vs_income > 0.6:
             alignment -= 0.15
 
-        return max(0.0, min(1.0, alignment))
+        return _clamp01(alignment)
 
     def _calculate_social_support_score(self, features: SocialConnectednessFeatures) -> float:
         """Calculate strength of social support network (0-1)."""
@@ -765,7 +1077,7 @@ class FeatureExtractor:
             score -= 0.2
         score -= min(features.conflict_drama_indicators * 0.05, 0.15)
 
-        return max(0.0, min(1.0, score))
+        return _clamp01(score)
 
     def _calculate_community_rootedness_score(self, features: SocialConnectednessFeatures) -> float:
         """Calculate ties to local community (0-1)."""
@@ -778,7 +1090,7 @@ class FeatureExtractor:
         if features.religious_community_ties:
             score += 0.1
 
-        return max(0.0, min(1.0, score))
+        return _clamp01(score)
 
     def _calculate_relationship_stability_score(self, features: SocialConnectednessFeatures) -> float:
         """Calculate relationship stability (0-1)."""
@@ -796,7 +1108,113 @@ class FeatureExtractor:
         if features.social_isolation_indicators:
             score -= 0.1
 
-        return max(0.0, min(1.0, score))
+        return _clamp01(score)
+
+    def calculate_scores_batch(self, features: Sequence[CombinedFeatures]) -> Dict[str, np.ndarray]:
+        """
+        Derived profile scores for many feature bundles at once.
+
+        Returns one array per derived score field (job_stability_score,
+        lifestyle_stability_score, ...) matching the per-profile
+        _calculate_*_score results for each bundle.
+        """
+        columns = {}
+        for group, cls in (
+            ("professional", ProfessionalFeatures),
+            ("lifestyle", LifestyleFeatures),
+            ("social", SocialConnectednessFeatures),
+        ):
+            names, values = _NUMERIC_FIELD_READERS[cls]
+            read = attrgetter(group)
+            matrix = np.array(
+                [values(read(bundle)) for bundle in features], dtype=np.float64
+            ).reshape(len(features), len(names))
+            columns.update(zip(names, matrix.T))
+        return self._calculate_scores_batch(columns)
+
+    @staticmethod
+    def _calculate_scores_batch(c: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Column-wise versions of the _calculate_*_score methods.
+
+        Args:
+            c: Float arrays keyed by profile feature field name
+
+        Conditional adjustments become mask multiplies (adding 0.0 is exact),
+        applied in the same order as the scalar methods so results match.
+        """
+        # Job stability
+        jobs = c["jobs_last_5_years"]
+        score = 0.5 + np.minimum(c["current_job_months"] / 60, 1.0) * 0.3
+        score -= np.where(jobs > 3, np.minimum((jobs - 3) * 0.1, 0.3), 0.0)
+        score -= np.minimum(c["employment_gaps"] * 0.1, 0.2)
+        score += (c["career_trajectory"] - 3) * 0.05
+        job_stability = np.clip(score, 0.0, 1.0, out=score)
+
+        # Professional credibility
+        score = 0.0 + (c["education_level"] / 5) * 0.25
+        score += np.minimum(c["total_experience_years"] / 20, 1.0) * 0.25
+        score += c["profile_completeness"] * 0.2
+        score += (c["connection_count_tier"] / 3) * 0.15
+        score += c["has_recommendations"] * 0.1
+        score += c["industry_stability"] * 0.05
+        credibility = np.clip(score, 0.0, 1.0, out=score)
+
+        # Lifestyle stability
+        spending = c["apparent_spending_vs_income"]
+        overspending = spending > 0.6
+        score = 0.5 - c["gambling_indicators"] * 0.2
+        score -= c["substance_use_indicators"] * 0.15
+        score -= np.where(overspending, (spending - 0.6) * 0.5, 0.0)
+        score += np.minimum(c["financial_responsibility_signals"] * 0.05, 0.2)
+        score -= np.minimum(c["financial_irresponsibility_signals"] * 0.05, 0.2)
+        score += c["appears_homeowner"] * 0.1
+        lifestyle_stability = np.clip(score, 0.0, 1.0, out=score)
+
+        # Income / lifestyle alignment
+        score = 1.0 - np.abs(spending - 0.5) * 2
+        score -= (c["luxury_items_visible"] * overspending) * 0.2
+        score -= (c["frequent_expensive_travel"] * overspending) * 0.15
+        alignment = np.clip(score, 0.0, 1.0, out=score)
+
+        # Social support
+        isolated = c["social_isolation_indicators"]
+        stable_relationship = c["appears_stable_relationship"]
+        score = 0.0 + c["family_presence_in_content"] * 0.2
+        score += c["community_involvement"] * 0.2
+        score += stable_relationship * 0.15
+        score += c["long_term_friendships_visible"] * 0.15
+        score += c["volunteer_charity_involvement"] * 0.1
+        score += c["authentic_connections"] * 0.1
+        score -= isolated * 0.2
+        score -= np.minimum(c["conflict_drama_indicators"] * 0.05, 0.15)
+        social_support = np.clip(score, 0.0, 1.0, out=score)
+
+        # Community rootedness
+        score = 0.0 + c["local_community_ties"] * 0.3
+        score += c["geographic_stability"] * 0.25
+        score += c["community_involvement"] * 0.2
+        score += np.minimum(c["group_memberships"] / 10, 1.0) * 0.15
+        score += c["religious_community_ties"] * 0.1
+        rootedness = np.clip(score, 0.0, 1.0, out=score)
+
+        # Relationship stability
+        score = 0.5 + stable_relationship * 0.2
+        score += (c["relationship_status"] >= 3) * 0.1
+        score += c["has_children"] * 0.05
+        score -= np.minimum(c["relationship_instability_signals"] * 0.1, 0.3)
+        score -= isolated * 0.1
+        relationship_stability = np.clip(score, 0.0, 1.0, out=score)
+
+        return {
+            "job_stability_score": job_stability,
+            "professional_credibility_score": credibility,
+            "lifestyle_stability_score": lifestyle_stability,
+            "income_lifestyle_alignment": alignment,
+            "social_support_score": social_support,
+            "community_rootedness_score": rootedness,
+            "relationship_stability_score": relationship_stability,
+        }
 
     # ============ MAIN EXTRACTION METHOD ============
 
@@ -822,26 +1240,33 @@ class FeatureExtractor:
         # Extract traditional features
         traditional = self.extract_traditional_features(traditional_data)
 
-        # Extract professional features
-        if professional_analysis and self.keywords_client:
-            professional = self.extract_professional_features(professional_analysis)
-        else:
-            professional = ProfessionalFeatures()
-
-        # Extract lifestyle features
-        if lifestyle_analysis and self.keywords_client:
-            lifestyle = self.extract_lifestyle_features(lifestyle_analysis)
-        else:
-            lifestyle = LifestyleFeatures()
-
-        # Extract social features
-        if social_analysis and self.keywords_client:
-            social = self.extract_social_features(social_analysis)
-        elif lifestyle_analysis and self.keywords_client:
+        # Profile features: one combined LLM extraction for every group with text
+        analyses = {}
+        if self.keywords_client:
+            if professional_analysis:
+                analyses["professional"] = professional_analysis
+            if lifestyle_analysis:
+                analyses["lifestyle"] = lifestyle_analysis
             # Use lifestyle analysis if no separate social analysis
-            social = self.extract_social_features(lifestyle_analysis)
-        else:
-            social = SocialConnectednessFeatures()
+            if social_analysis or lifestyle_analysis:
+                analyses["social"] = social_analysis or lifestyle_analysis
+        extracted = self._extract_structured_many(analyses)
+
+        professional = extracted.get("professional")
+        professional = (
+            self._build_professional_features(professional) if professional is not None
+            else ProfessionalFeatures()
+        )
+        lifestyle = extracted.get("lifestyle")
+        lifestyle = (
+            self._build_lifestyle_features(lifestyle) if lifestyle is not None
+            else LifestyleFeatures()
+        )
+        social = extracted.get("social")
+        social = (
+            self._build_social_features(social) if social is not None
+            else SocialConnectednessFeatures()
+        )
 
         return CombinedFeatures(
             traditional=traditional,
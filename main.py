@@ -13,9 +13,12 @@ Usage:
     python main.py --score <application_id> # Score a specific test case
     python main.py --analyze <profile_url>  # Analyze a social profile
     python main.py --test                   # Run all test cases
+    python main.py --daemon                 # Score JSON lines from stdin
 """
 
+import contextlib
 import json
+import sys
 import argparse
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -36,6 +39,29 @@ from feature_extractor import (
 )
 from risk_scorer import RiskScorer, TEST_CASES
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, indent: bool = True) -> str:
+    """Encode CLI output as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, indent=2 if indent else None)
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write results as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
 
 # =============================================================================
 # SHERLOCK HOMES MAIN APPLICATION
@@ -230,9 +256,45 @@ class SherlockHomes:
 # CLI INTERFACE
 # =============================================================================
 
+_APP: Optional[SherlockHomes] = None
+
+
+def get_app() -> SherlockHomes:
+    """Return the process-wide SherlockHomes instance, creating it on first use."""
+    global _APP
+    if _APP is None:
+        _APP = SherlockHomes()
+    return _APP
+
+
+def run_daemon():
+    """
+    Score applications from stdin, one JSON object per line.
+
+    Each input line is an application dict; each output line is the JSON
+    risk report (or an error object). Progress messages go to stderr so
+    stdout carries only responses.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        app = get_app()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            application = json.loads(line)
+            with contextlib.redirect_stdout(sys.stderr):
+                response = app.score_application(application).to_dict()
+        except Exception as e:
+            response = {"status": "error", "message": str(e)}
+        sys.stdout.write(_dumps(response, indent=False) + "\n")
+        sys.stdout.flush()
+
+
 def run_interactive():
     """Run interactive mode."""
-    app = SherlockHomes()
+    app = get_app()
 
     print("=" * 60)
     print("SHERLOCK HOMES - Interactive Mode")
@@ -284,12 +346,12 @@ def run_interactive():
                 }
 
                 result = app.score_application(application)
-                print(f"\nResult: {json.dumps(result, indent=2)}")
+                print(f"\nResult: {_dumps(result)}")
 
             elif cmd == "analyze":
                 url = input("Enter profile URL: ")
                 result = app.analyze_social_profiles(linkedin_url=url)
-                print(f"\nAnalysis: {json.dumps(result, indent=2)}")
+                print(f"\nAnalysis: {_dumps(result)}")
 
             elif cmd == "help":
                 print("\nCommands: test, score, analyze, quit")
@@ -335,6 +397,12 @@ def main():
         help="Run in interactive mode"
     )
 
+    parser.add_argument(
+        "--daemon", "-d",
+        action="store_true",
+        help="Score JSON applications read line by line from stdin"
+    )
+
     parser.add_argument(
         "--output", "-o",
         type=str,
@@ -343,21 +411,28 @@ def main():
 
     args = parser.parse_args()
 
+    if args.daemon:
+        run_daemon()
+        return
+
     # Initialize application
-    app = SherlockHomes()
+    app = get_app()
 
     if args.test:
         print("\n" + "=" * 60)
         print("SCORING ALL TEST CASES")
         print("=" * 60)
 
+        # Cases are independent, so score them together (AI analyses run concurrently)
+        reports = app.risk_scorer.score_applications(TEST_CASES)
+
         results = []
-        for case in TEST_CASES:
+        for case, report in zip(TEST_CASES, reports):
+            result = report.to_dict()
             print(f"\n{case['id']}: {case['borrower']}")
             print(f"  Loan: ${case['loan_amount']:,} | LTV: {case['ltv']}%")
             print(f"  Dashboard Risk Score: {case['current_risk_score']}")
 
-            result = app.score_application(case)
             result["dashboard_score"] = case["current_risk_score"]
             results.append(result)
 
@@ -367,8 +442,7 @@ def main():
                 print("  AI Score: Prompt not configured")
 
         if args.output:
-            with open(args.output, "w") as f:
-                json.dump(results, f, indent=2)
+            _write_json(args.output, results)
             print(f"\nResults saved to: {args.output}")
 
     elif args.score:
@@ -376,7 +450,7 @@ def main():
         if case:
             print(f"\nScoring {case['id']}: {case['borrower']}")
             result = app.score_application(case)
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
         else:
             print(f"Test case not found: {args.score}")
             print("Available cases:", [c["id"] for c in TEST_CASES])
@@ -384,11 +458,10 @@ def main():
     elif args.analyze:
         print(f"\nAnalyzing profile: {args.analyze}")
         result = app.analyze_social_profiles(linkedin_url=args.analyze)
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
 
         if args.output:
-            with open(args.output, "w") as f:
-                json.dump(result, f, indent=2)
+            _write_json(args.output, result)
             print(f"\nResults saved to: {args.output}")
 
     elif args.interactive:
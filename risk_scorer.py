@@ -8,9 +8,19 @@ features from feature_extractor.py as small modifiers.
 Risk Score = Approximate probability of default (0 = lowest risk, 100 = highest risk)
 """
 
+import copy
+import hashlib
 import json
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+import sys
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from operator import attrgetter
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
 from keywords_client import KeywordsAIClient
 from feature_extractor import (
     FeatureExtractor,
@@ -22,6 +32,10 @@ from feature_extractor import (
 )
 
 
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # =============================================================================
 # TEST CASES - Current applications from the dashboard
 # =============================================================================
@@ -122,15 +136,147 @@ MODIFIER_WEIGHTS = {
     "relationship_stability": 1.0       # +/- 1 point
 }
 
+
+def _modifier_factor(key: str) -> str:
+    """Factor line reported for a modifier, precomputed per modifier key."""
+    return f"Social indicator: {key.replace('_', ' ')}"
+
+
+# Derived feature score behind each weighted modifier, with the weight
+# pre-doubled: modifier = (0.5 - score) * weight * 2
+_MODIFIER_SCORES = tuple(
+    (key, attrgetter(path), MODIFIER_WEIGHTS[key] * 2, _modifier_factor(key))
+    for key, path in (
+        ("professional_credibility", "professional.professional_credibility_score"),
+        ("job_stability", "professional.job_stability_score"),
+        ("lifestyle_stability", "lifestyle.lifestyle_stability_score"),
+        ("income_lifestyle_alignment", "lifestyle.income_lifestyle_alignment"),
+        ("social_support", "social.social_support_score"),
+        ("community_rootedness", "social.community_rootedness_score"),
+        ("relationship_stability", "social.relationship_stability_score"),
+    )
+)
+
+# Red flag modifiers: (key, reader for the flag, fixed risk points, factor line)
+_RED_FLAG_MODIFIERS = tuple(
+    (key, attrgetter(path), points, _modifier_factor(key))
+    for key, path, points in (
+        ("gambling_flag", "lifestyle.gambling_indicators", 3.0),
+        ("substance_flag", "lifestyle.substance_use_indicators", 2.0),
+        ("job_hopping_flag", "professional.frequent_job_changes", 1.5),
+        ("isolation_flag", "social.social_isolation_indicators", 1.0),
+    )
+)
+
 # Maximum total modifier adjustment
 MAX_MODIFIER_ADJUSTMENT = 10  # +/- 10 points max from all modifiers combined
 
+# Risk category bands: upper bound (inclusive) of each band but the last
+RISK_CATEGORY_BINS = (25, 45, 65, 80)
+RISK_CATEGORIES = (
+    ("Low", "Approve"),
+    ("Moderate", "Approve with Conditions"),
+    ("Elevated", "Manual Review Required"),
+    ("High", "Decline Recommended"),
+    ("Very High", "Decline"),
+)
+
+# Monthly payment per dollar borrowed used to estimate DTI from form input
+# (6.5% rate, 30-year term), computed once instead of per submission
+ESTIMATE_RATE = 0.065 / 12
+ESTIMATE_TERM_MONTHS = 360
+ESTIMATE_PAYMENT_FACTOR = (
+    ESTIMATE_RATE * (1 + ESTIMATE_RATE) ** ESTIMATE_TERM_MONTHS
+    / ((1 + ESTIMATE_RATE) ** ESTIMATE_TERM_MONTHS - 1)
+)
+
+# AI analysis narratives are generated in the background so scores return
+# without waiting on the LLM; this bounds in-flight analysis requests
+MAX_CONCURRENT_ANALYSES = 8
+# Longest a report waits on its analysis when serialized, so a stuck LLM call
+# cannot hold an HTTP worker or the daemon loop
+ANALYSIS_TIMEOUT_SECONDS = 30.0
+_analysis_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_ANALYSES, thread_name_prefix="ai-analysis"
+)
+
+# Prompt for the AI analysis narrative, bound once; filled per report
+_ANALYSIS_PROMPT = """You are an expert mortgage underwriter for Sherlock Homes, an AI-powered underwriting platform.
+
+Analyze this loan application and provide a professional underwriting assessment.
+
+APPLICATION DATA:
+- Borrower: {borrower}
+- Loan Amount: ${loan_amount:,}
+- Property Value: ${property_value:,}
+- Loan Type: {loan_type}
+- Property Address: {property_address}
+
+KEY METRICS:
+- Credit Score: {credit_score}
+- DTI Ratio: {dti}%
+- LTV Ratio: {ltv}%
+- Employment: {employment_years} years
+- Reserves: {reserves_months} months
+
+CALCULATED RISK:
+- Risk Score: {risk_score}/100
+- Risk Category: {risk_category}
+
+IDENTIFIED RISK FACTORS:
+{risk_factors}
+
+POSITIVE FACTORS:
+{positive_factors}
+
+Provide a 2-3 paragraph professional assessment that:
+1. Summarizes the overall risk profile
+2. Explains the key factors driving the risk score
+3. Provides a clear recommendation with any conditions
+
+Keep the tone professional and suitable for an underwriting report.""".format
+
+
+def _bullet_list(items: Sequence[str]) -> str:
+    """Render prompt factors as '- ' bullet lines."""
+    return "- " + "\n- ".join(items) if items else "- None identified"
+
+
+# Scoring is deterministic for a given input, so test-case reports are cached
+# by a digest of the canonical case JSON. Bump SCORING_VERSION whenever
+# weights or thresholds change so stale reports are not served.
+SCORING_VERSION = 1
+_SCORE_CACHE: Dict[bytes, Dict[str, Any]] = {}
+
+
+def _score_cache_key(case: Dict[str, Any], model: str, with_ai: bool) -> bytes:
+    """Digest identifying a scored case for _SCORE_CACHE."""
+    payload = json.dumps([SCORING_VERSION, model, with_ai, case], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+# Prefix of the narrative returned when the AI call fails. Such reports are
+# transient, so they are never cached and are re-scored on the next request
+AI_ANALYSIS_ERROR_PREFIX = "AI analysis error: "
+
+
+def analysis_failed(report: Dict[str, Any]) -> bool:
+    """True if a serialized report carries a failed AI analysis."""
+    return report.get("ai_analysis", "").startswith(AI_ANALYSIS_ERROR_PREFIX)
+
+
+def _cache_report(key: bytes, report: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a serialized report in _SCORE_CACHE unless its AI analysis failed."""
+    if not analysis_failed(report):
+        _SCORE_CACHE[key] = report
+    return report
+
 
 # =============================================================================
 # RISK REPORT DATA CLASS
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class RiskReport:
     """Complete risk assessment report."""
     application_id: str
@@ -163,7 +309,26 @@ class RiskReport:
     positive_factors: list
     ai_analysis: str
 
+    # Pending background AI analysis; resolved into ai_analysis on first use
+    ai_analysis_future: Optional[Future] = field(default=None, repr=False, compare=False)
+
+    def wait_for_analysis(self, timeout: Optional[float] = None) -> str:
+        """
+        Block until the AI analysis is available and return it.
+
+        If it is not ready within `timeout` seconds, the analysis is recorded
+        as failed, which also keeps the report out of _SCORE_CACHE.
+        """
+        if self.ai_analysis_future is not None:
+            try:
+                self.ai_analysis = self.ai_analysis_future.result(timeout=timeout)
+            except FutureTimeoutError:
+                self.ai_analysis = f"{AI_ANALYSIS_ERROR_PREFIX}timed out after {timeout:g}s"
+            self.ai_analysis_future = None
+        return self.ai_analysis
+
     def to_dict(self) -> Dict[str, Any]:
+        self.wait_for_analysis(ANALYSIS_TIMEOUT_SECONDS)
         return {
             "application_id": self.application_id,
             "borrower_name": self.borrower_name,
@@ -204,6 +369,51 @@ class RiskReport:
         }
 
 
+# Fixed-point (x100) score columns for compact portfolio storage. Components,
+# base score and modifiers stay within +/-100, so int16 holds them exactly to
+# the two decimals to_dict() reports; DTI/LTV ratios are unbounded, so int32.
+COMPACT_SCORE_FIELDS = (
+    "base_score",
+    "credit_component",
+    "dti_component",
+    "ltv_component",
+    "employment_component",
+    "reserves_component",
+    "total_modifier_adjustment",
+)
+COMPACT_RATIO_FIELDS = ("dti_ratio", "ltv_ratio")
+COMPACT_REPORT_DTYPE = np.dtype(
+    [("risk_score", np.uint8), ("credit_score", np.int16)]
+    + [(name, np.int16) for name in COMPACT_SCORE_FIELDS]
+    + [(name, np.int32) for name in COMPACT_RATIO_FIELDS]
+)
+
+
+def compact_reports(reports: Sequence[RiskReport]) -> np.ndarray:
+    """
+    Pack the numeric part of many reports into one structured array.
+
+    Rows follow the order of reports, so the caller keeps the ids alongside
+    (e.g. for a dashboard listing); sorting or filtering on risk_score then
+    works on a small contiguous array. Expand a row with expand_compact_report.
+    """
+    compact = np.zeros(len(reports), dtype=COMPACT_REPORT_DTYPE)
+    compact["risk_score"] = [report.risk_score for report in reports]
+    compact["credit_score"] = [report.credit_score for report in reports]
+    for name in COMPACT_SCORE_FIELDS + COMPACT_RATIO_FIELDS:
+        # round(x, 2) first so stored values match to_dict() exactly
+        compact[name] = [round(round(getattr(report, name), 2) * 100) for report in reports]
+    return compact
+
+
+def expand_compact_report(row: np.void) -> Dict[str, float]:
+    """Numeric report fields from one compact_reports row, as Python numbers."""
+    values = {"risk_score": int(row["risk_score"]), "credit_score": int(row["credit_score"])}
+    for name in COMPACT_SCORE_FIELDS + COMPACT_RATIO_FIELDS:
+        values[name] = int(row[name]) / 100
+    return values
+
+
 # =============================================================================
 # RISK SCORER CLASS
 # =============================================================================
@@ -349,54 +559,42 @@ class RiskScorer:
     # MODIFIER CALCULATIONS FROM FEATURE EXTRACTOR
     # =========================================================================
 
-    def _calculate_modifiers(self, features: CombinedFeatures) -> Dict[str, float]:
+    def _calculate_modifiers(
+        self, features: CombinedFeatures
+    ) -> Tuple[Dict[str, float], float, List[str], List[str]]:
         """
         Calculate risk modifiers from social/lifestyle features.
         Each modifier ranges from -weight to +weight.
         Positive values increase risk, negative values decrease risk.
+
+        Returns the per-modifier breakdown, its (uncapped) total summed in
+        breakdown order, and the risk/positive factor lines for modifiers
+        strong enough to report, all gathered in one pass.
         """
         modifiers = {}
+        total = 0.0
+        risk_factors = []
+        positive_factors = []
 
-        # Professional credibility (higher = lower risk)
-        # Score is 0-1, convert to modifier: 0.5 baseline, so (0.5 - score) * weight
-        prof_score = features.professional.professional_credibility_score
-        modifiers["professional_credibility"] = (0.5 - prof_score) * MODIFIER_WEIGHTS["professional_credibility"] * 2
-
-        # Job stability (higher = lower risk)
-        job_score = features.professional.job_stability_score
-        modifiers["job_stability"] = (0.5 - job_score) * MODIFIER_WEIGHTS["job_stability"] * 2
-
-        # Lifestyle stability (higher = lower risk)
-        lifestyle_score = features.lifestyle.lifestyle_stability_score
-        modifiers["lifestyle_stability"] = (0.5 - lifestyle_score) * MODIFIER_WEIGHTS["lifestyle_stability"] * 2
-
-        # Income-lifestyle alignment (higher = lower risk)
-        alignment_score = features.lifestyle.income_lifestyle_alignment
-        modifiers["income_lifestyle_alignment"] = (0.5 - alignment_score) * MODIFIER_WEIGHTS["income_lifestyle_alignment"] * 2
-
-        # Social support (higher = lower risk)
-        social_score = features.social.social_support_score
-        modifiers["social_support"] = (0.5 - social_score) * MODIFIER_WEIGHTS["social_support"] * 2
-
-        # Community rootedness (higher = lower risk)
-        community_score = features.social.community_rootedness_score
-        modifiers["community_rootedness"] = (0.5 - community_score) * MODIFIER_WEIGHTS["community_rootedness"] * 2
-
-        # Relationship stability (higher = lower risk)
-        relationship_score = features.social.relationship_stability_score
-        modifiers["relationship_stability"] = (0.5 - relationship_score) * MODIFIER_WEIGHTS["relationship_stability"] * 2
+        # Each score is 0-1 with a 0.5 baseline; higher scores lower the risk
+        for key, read, scale, factor in _MODIFIER_SCORES:
+            value = (0.5 - read(features)) * scale
+            modifiers[key] = value
+            total += value
+            if value > 1:
+                risk_factors.append(factor)
+            elif value < -1:
+                positive_factors.append(factor)
 
         # Red flag adjustments
-        if features.lifestyle.gambling_indicators:
-            modifiers["gambling_flag"] = 3.0  # +3 points risk
-        if features.lifestyle.substance_use_indicators:
-            modifiers["substance_flag"] = 2.0  # +2 points risk
-        if features.professional.frequent_job_changes:
-            modifiers["job_hopping_flag"] = 1.5  # +1.5 points risk
-        if features.social.social_isolation_indicators:
-            modifiers["isolation_flag"] = 1.0  # +1 point risk
+        for key, flagged, value, factor in _RED_FLAG_MODIFIERS:
+            if flagged(features):
+                modifiers[key] = value
+                total += value
+                if value > 1:
+                    risk_factors.append(factor)
 
-        return modifiers
+        return modifiers, total, risk_factors, positive_factors
 
     # =========================================================================
     # MAIN SCORING METHOD
@@ -407,7 +605,9 @@ class RiskScorer:
         application: Dict[str, Any],
         professional_features: ProfessionalFeatures = None,
         lifestyle_features: LifestyleFeatures = None,
-        social_features: SocialConnectednessFeatures = None
+        social_features: SocialConnectednessFeatures = None,
+        include_factors: bool = True,
+        include_ai: bool = True
     ) -> RiskReport:
         """
         Calculate comprehensive risk score for a loan application.
@@ -417,25 +617,20 @@ class RiskScorer:
             professional_features: Optional professional profile features
             lifestyle_features: Optional lifestyle features
             social_features: Optional social connectedness features
+            include_factors: Build the risk/positive factor lists (always
+                built when include_ai is set, since the prompt uses them)
+            include_ai: Request the AI analysis narrative; pass False (with
+                include_factors=False) when only the numeric score is needed
 
         Returns:
             RiskReport with complete analysis
         """
-        # Extract basic data
-        app_id = application.get("id", "NEW")
-        borrower = application.get("borrower", "Unknown")
-        credit_score = application.get("credit_score", 680)
-        dti = application.get("dti", 36)
-        ltv = application.get("ltv", 80)
-        employment_years = application.get("employment_years", 2)
-        reserves_months = application.get("reserves_months", 3)
-
         # Calculate component scores
-        credit_risk = self._calculate_credit_risk(credit_score)
-        dti_risk = self._calculate_dti_risk(dti)
-        ltv_risk = self._calculate_ltv_risk(ltv)
-        employment_risk = self._calculate_employment_risk(employment_years)
-        reserves_risk = self._calculate_reserves_risk(reserves_months)
+        credit_risk = self._calculate_credit_risk(application.get("credit_score", 680))
+        dti_risk = self._calculate_dti_risk(application.get("dti", 36))
+        ltv_risk = self._calculate_ltv_risk(application.get("ltv", 80))
+        employment_risk = self._calculate_employment_risk(application.get("employment_years", 2))
+        reserves_risk = self._calculate_reserves_risk(application.get("reserves_months", 3))
 
         # Calculate weighted base score
         base_score = (
@@ -446,9 +641,149 @@ class RiskScorer:
             reserves_risk * TRADITIONAL_WEIGHTS["reserves"]
         )
 
+        return self._build_report(
+            application,
+            (credit_risk, dti_risk, ltv_risk, employment_risk, reserves_risk),
+            base_score,
+            professional_features,
+            lifestyle_features,
+            social_features,
+            include_factors=include_factors,
+            include_ai=include_ai
+        )
+
+    def score_applications(
+        self,
+        applications: List[Dict[str, Any]],
+        include_factors: bool = True,
+        include_ai: bool = True
+    ) -> List[RiskReport]:
+        """
+        Score many loan applications, computing the traditional components in one
+        vectorized pass. Their AI analyses are all requested up front and run
+        concurrently in the background.
+
+        Returns the same reports, in order, as calling score_application on each
+        one with the same include_factors/include_ai flags.
+        """
+        components, base_scores = self._component_risks_batch(applications)
+        return [
+            self._build_report(
+                application, row, base_score,
+                include_factors=include_factors, include_ai=include_ai
+            )
+            for application, row, base_score in zip(applications, components.tolist(), base_scores.tolist())
+        ]
+
+    def _component_risks_batch(self, applications: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized _calculate_*_risk for many applications.
+
+        Returns an (N, 5) array of credit, DTI, LTV, employment and reserves
+        risk plus the N weighted base scores. Each piecewise rule evaluates
+        the same expressions as its scalar method, so values match exactly.
+        """
+        def column(key: str, default: float) -> np.ndarray:
+            return np.fromiter(
+                (application.get(key, default) for application in applications),
+                dtype=np.float64,
+                count=len(applications)
+            )
+
+        credit = column("credit_score", 680)
+        dti = column("dti", 36)
+        ltv = column("ltv", 80)
+        years = column("employment_years", 2)
+        months = column("reserves_months", 3)
+
+        credit_risk = np.select(
+            [credit >= 800, credit >= 740, credit >= 670, credit >= 580],
+            [
+                5 + (850 - credit) * 0.1,
+                10 + (799 - credit) * 0.17,
+                20 + (739 - credit) * 0.22,
+                35 + (669 - credit) * 0.22,
+            ],
+            55 + (579 - credit) * 0.09
+        )
+        dti_risk = np.select(
+            [dti <= 20, dti <= 36, dti <= 43, dti <= 50],
+            [
+                5 + dti * 0.5,
+                15 + (dti - 20) * 0.94,
+                30 + (dti - 36) * 2.86,
+                50 + (dti - 43) * 2.86,
+            ],
+            np.minimum(70 + (dti - 50) * 2, 90)
+        )
+        ltv_risk = np.select(
+            [ltv <= 60, ltv <= 80, ltv <= 90, ltv <= 95],
+            [
+                5 + ltv * 0.17,
+                15 + (ltv - 60) * 0.5,
+                25 + (ltv - 80) * 2,
+                45 + (ltv - 90) * 4,
+            ],
+            np.minimum(65 + (ltv - 95) * 4, 85)
+        )
+        employment_risk = np.select(
+            [years >= 5, years >= 2, years >= 1],
+            [
+                10 + np.maximum(0, 10 - years) * 1,
+                20 + (5 - years) * 6.67,
+                40 + (2 - years) * 15,
+            ],
+            55 + (1 - years) * 15
+        )
+        reserves_risk = np.select(
+            [months >= 12, months >= 6, months >= 3, months >= 1],
+            [
+                5 + np.maximum(0, 24 - months) * 0.83,
+                15 + (12 - months) * 2.5,
+                30 + (6 - months) * 5,
+                45 + (3 - months) * 7.5,
+            ],
+            60 + (1 - months) * 15
+        )
+
+        # Same left-to-right sum as score_application (no BLAS reordering)
+        base_scores = (
+            credit_risk * TRADITIONAL_WEIGHTS["credit_score"] +
+            dti_risk * TRADITIONAL_WEIGHTS["dti"] +
+            ltv_risk * TRADITIONAL_WEIGHTS["ltv"] +
+            employment_risk * TRADITIONAL_WEIGHTS["employment"] +
+            reserves_risk * TRADITIONAL_WEIGHTS["reserves"]
+        )
+        components = np.column_stack((credit_risk, dti_risk, ltv_risk, employment_risk, reserves_risk))
+        return components, base_scores
+
+    def _build_report(
+        self,
+        application: Dict[str, Any],
+        components: Sequence[float],
+        base_score: float,
+        professional_features: ProfessionalFeatures = None,
+        lifestyle_features: LifestyleFeatures = None,
+        social_features: SocialConnectednessFeatures = None,
+        include_factors: bool = True,
+        include_ai: bool = True
+    ) -> RiskReport:
+        """Apply feature modifiers and assemble the RiskReport for scored components."""
+        # Extract basic data
+        app_id = application.get("id", "NEW")
+        borrower = application.get("borrower", "Unknown")
+        credit_score = application.get("credit_score", 680)
+        dti = application.get("dti", 36)
+        ltv = application.get("ltv", 80)
+        employment_years = application.get("employment_years", 2)
+        reserves_months = application.get("reserves_months", 3)
+        credit_risk, dti_risk, ltv_risk, employment_risk, reserves_risk = components
+
         # Calculate modifiers from social/lifestyle features
         modifier_breakdown = {}
         total_modifier = 0.0
+        modifier_risk_factors = []
+        modifier_positive_factors = []
 
         if professional_features or lifestyle_features or social_features:
             # Create combined features
@@ -460,8 +795,9 @@ class RiskScorer:
                 social=social_features or SocialConnectednessFeatures()
             )
 
-            modifier_breakdown = self._calculate_modifiers(combined)
-            total_modifier = sum(modifier_breakdown.values())
+            (
+                modifier_breakdown, total_modifier, modifier_risk_factors, modifier_positive_factors
+            ) = self._calculate_modifiers(combined)
 
             # Cap total modifier adjustment
             total_modifier = max(-MAX_MODIFIER_ADJUSTMENT, min(MAX_MODIFIER_ADJUSTMENT, total_modifier))
@@ -472,23 +808,70 @@ class RiskScorer:
         risk_score = round(final_score)
 
         # Determine risk category and recommendation
-        if risk_score <= 25:
-            risk_category = "Low"
-            recommendation = "Approve"
-        elif risk_score <= 45:
-            risk_category = "Moderate"
-            recommendation = "Approve with Conditions"
-        elif risk_score <= 65:
-            risk_category = "Elevated"
-            recommendation = "Manual Review Required"
-        elif risk_score <= 80:
-            risk_category = "High"
-            recommendation = "Decline Recommended"
+        risk_category, recommendation = RISK_CATEGORIES[bisect_left(RISK_CATEGORY_BINS, risk_score)]
+
+        # Identify risk factors and positive factors (the AI prompt uses them too)
+        if include_factors or include_ai:
+            risk_factors, positive_factors = self._identify_factors(
+                credit_score, dti, ltv, employment_years, reserves_months,
+                modifier_risk_factors, modifier_positive_factors
+            )
         else:
-            risk_category = "Very High"
-            recommendation = "Decline"
+            risk_factors, positive_factors = [], []
+
+        # Generate AI analysis in the background (it needs a network round trip);
+        # the report resolves it when serialized or via wait_for_analysis()
+        if not include_ai:
+            ai_analysis = ""
+            ai_analysis_future = None
+        elif self.client:
+            ai_analysis = ""
+            ai_analysis_future = _analysis_executor.submit(
+                self._generate_ai_analysis,
+                application, risk_score, risk_category,
+                risk_factors, positive_factors
+            )
+        else:
+            ai_analysis = self._generate_ai_analysis(
+                application, risk_score, risk_category,
+                risk_factors, positive_factors
+            )
+            ai_analysis_future = None
 
-        # Identify risk factors and positive factors
+        return RiskReport(
+            application_id=app_id,
+            borrower_name=borrower,
+            risk_score=risk_score,
+            risk_category=risk_category,
+            recommendation=recommendation,
+            base_score=base_score,
+            credit_component=credit_risk,
+            dti_component=dti_risk,
+            ltv_component=ltv_risk,
+            employment_component=employment_risk,
+            reserves_component=reserves_risk,
+            total_modifier_adjustment=total_modifier,
+            modifier_breakdown=modifier_breakdown,
+            credit_score=credit_score,
+            dti_ratio=dti,
+            ltv_ratio=ltv,
+            risk_factors=risk_factors,
+            positive_factors=positive_factors,
+            ai_analysis=ai_analysis,
+            ai_analysis_future=ai_analysis_future
+        )
+
+    def _identify_factors(
+        self,
+        credit_score: int,
+        dti: float,
+        ltv: float,
+        employment_years: float,
+        reserves_months: int,
+        modifier_risk_factors: List[str],
+        modifier_positive_factors: List[str]
+    ) -> Tuple[list, list]:
+        """Human-readable risk factors and positive factors for a report."""
         risk_factors = []
         positive_factors = []
 
@@ -517,40 +900,11 @@ class RiskScorer:
         elif reserves_months >= 6:
             positive_factors.append(f"Strong reserves ({reserves_months} months)")
 
-        # Add modifier-based factors
-        for key, value in modifier_breakdown.items():
-            if value > 1:
-                risk_factors.append(f"Social indicator: {key.replace('_', ' ')}")
-            elif value < -1:
-                positive_factors.append(f"Social indicator: {key.replace('_', ' ')}")
-
-        # Generate AI analysis
-        ai_analysis = self._generate_ai_analysis(
-            application, risk_score, risk_category,
-            risk_factors, positive_factors
-        )
+        # Add modifier-based factors (collected by _calculate_modifiers)
+        risk_factors.extend(modifier_risk_factors)
+        positive_factors.extend(modifier_positive_factors)
 
-        return RiskReport(
-            application_id=app_id,
-            borrower_name=borrower,
-            risk_score=risk_score,
-            risk_category=risk_category,
-            recommendation=recommendation,
-            base_score=base_score,
-            credit_component=credit_risk,
-            dti_component=dti_risk,
-            ltv_component=ltv_risk,
-            employment_component=employment_risk,
-            reserves_component=reserves_risk,
-            total_modifier_adjustment=total_modifier,
-            modifier_breakdown=modifier_breakdown,
-            credit_score=credit_score,
-            dti_ratio=dti,
-            ltv_ratio=ltv,
-            risk_factors=risk_factors,
-            positive_factors=positive_factors,
-            ai_analysis=ai_analysis
-        )
+        return risk_factors, positive_factors
 
     def _generate_ai_analysis(
         self,
@@ -564,40 +918,22 @@ class RiskScorer:
         if not self.client:
             return "AI analysis unavailable - Keywords AI client not configured."
 
-        prompt = f"""You are an expert mortgage underwriter for Sherlock Homes, an AI-powered underwriting platform.
-
-Analyze this loan application and provide a professional underwriting assessment.
-
-APPLICATION DATA:
-- Borrower: {application.get('borrower', 'Unknown')}
-- Loan Amount: ${application.get('loan_amount', 0):,}
-- Property Value: ${application.get('property_value', 0):,}
-- Loan Type: {application.get('loan_type', 'Conventional')}
-- Property Address: {application.get('property_address', 'N/A')}
-
-KEY METRICS:
-- Credit Score: {application.get('credit_score', 'N/A')}
-- DTI Ratio: {application.get('dti', 'N/A')}%
-- LTV Ratio: {application.get('ltv', 'N/A')}%
-- Employment: {application.get('employment_years', 'N/A')} years
-- Reserves: {application.get('reserves_months', 'N/A')} months
-
-CALCULATED RISK:
-- Risk Score: {risk_score}/100
-- Risk Category: {risk_category}
-
-IDENTIFIED RISK FACTORS:
-{chr(10).join('- ' + f for f in risk_factors) if risk_factors else '- None identified'}
-
-POSITIVE FACTORS:
-{chr(10).join('- ' + f for f in positive_factors) if positive_factors else '- None identified'}
-
-Provide a 2-3 paragraph professional assessment that:
-1. Summarizes the overall risk profile
-2. Explains the key factors driving the risk score
-3. Provides a clear recommendation with any conditions
-
-Keep the tone professional and suitable for an underwriting report."""
+        prompt = _ANALYSIS_PROMPT(
+            borrower=application.get('borrower', 'Unknown'),
+            loan_amount=application.get('loan_amount', 0),
+            property_value=application.get('property_value', 0),
+            loan_type=application.get('loan_type', 'Conventional'),
+            property_address=application.get('property_address', 'N/A'),
+            credit_score=application.get('credit_score', 'N/A'),
+            dti=application.get('dti', 'N/A'),
+            ltv=application.get('ltv', 'N/A'),
+            employment_years=application.get('employment_years', 'N/A'),
+            reserves_months=application.get('reserves_months', 'N/A'),
+            risk_score=risk_score,
+            risk_category=risk_category,
+            risk_factors=_bullet_list(risk_factors),
+            positive_factors=_bullet_list(positive_factors),
+        )
 
         try:
             response = self.client.complete(
@@ -613,7 +949,7 @@ Keep the tone professional and suitable for an underwriting report."""
             )
             return response
         except Exception as e:
-            return f"AI analysis error: {str(e)}"
+            return f"{AI_ANALYSIS_ERROR_PREFIX}{str(e)}"
 
     # =========================================================================
     # CONVENIENCE METHODS
@@ -645,10 +981,7 @@ Keep the tone professional and suitable for an underwriting report."""
         monthly_income = annual_income / 12
 
         # Estimate monthly payment (rough calculation for DTI)
-        # Using 6.5% rate, 30-year term
-        rate = 0.065 / 12
-        term = 360
-        monthly_payment = loan_amount * (rate * (1 + rate)**term) / ((1 + rate)**term - 1)
+        monthly_payment = loan_amount * ESTIMATE_PAYMENT_FACTOR
 
         total_monthly_debt = monthly_debts + monthly_payment
         dti = (total_monthly_debt / monthly_income) * 100 if monthly_income > 0 else 50
@@ -687,19 +1020,46 @@ Keep the tone professional and suitable for an underwriting report."""
         return self.score_application(application)
 
     def score_all_test_cases(self) -> list:
-        """Score all test cases from the dashboard."""
-        results = []
-        for case in TEST_CASES:
-            print(f"Scoring {case['id']}...")
-            report = self.score_application(case)
-            results.append(report.to_dict())
-        return results
+        """Score all test cases from the dashboard, reusing cached reports."""
+        keys = [_score_cache_key(case, self.model, self.client is not None) for case in TEST_CASES]
+        results = [_SCORE_CACHE.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            for i in missing:
+                print(f"Scoring {TEST_CASES[i]['id']}...")
+            reports = self.score_applications([TEST_CASES[i] for i in missing])
+            for i, report in zip(missing, reports):
+                results[i] = _cache_report(keys[i], report.to_dict())
+        # Nested breakdowns and factor lists are shared with _SCORE_CACHE
+        return copy.deepcopy(results)
+
+    def score_test_case(self, case: Dict[str, Any]) -> Dict[str, Any]:
+        """Score a single test case, reusing its cached report."""
+        key = _score_cache_key(case, self.model, self.client is not None)
+        result = _SCORE_CACHE.get(key)
+        if result is None:
+            result = _cache_report(key, self.score_application(case).to_dict())
+        return copy.deepcopy(result)
 
 
 # =============================================================================
 # API ENDPOINT HELPER
 # =============================================================================
 
+_SCORER: Optional[RiskScorer] = None
+_SCORER_LOCK = threading.Lock()
+
+
+def get_scorer() -> RiskScorer:
+    """Return the process-wide RiskScorer, creating it on first use."""
+    global _SCORER
+    if _SCORER is None:
+        with _SCORER_LOCK:
+            if _SCORER is None:
+                _SCORER = RiskScorer()
+    return _SCORER
+
+
 def process_form_submission(form_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process a form submission from the frontend.
@@ -718,7 +1078,7 @@ def process_form_submission(form_data: Dict[str, Any]) -> Dict[str, Any]:
     - linkedin_url: str (optional)
     - instagram_url: str (optional)
     """
-    scorer = RiskScorer()
+    scorer = get_scorer()
 
     try:
         report = scorer.score_from_form(
@@ -8,14 +8,21 @@ Opens in your browser automatically.
 Usage: python run.py
 """
 
+import gzip
+import hashlib
+import os
+import re
 import sys
 import webbrowser
 import threading
 import time
+from datetime import datetime, timezone
 
 # Check for required packages
 try:
     from flask import Flask, request, jsonify, send_from_directory, Response
+    from jinja2 import Environment
+    from werkzeug.http import http_date
     from flask_cors import CORS
 except ImportError as e:
     print("\n" + "=" * 50)
@@ -30,15 +37,66 @@ except ImportError as e:
 
 # Import risk scorer components
 try:
-    from risk_scorer import process_form_submission, RiskScorer, TEST_CASES
+    from risk_scorer import process_form_submission, get_scorer, analysis_failed, TEST_CASES
     SCORER_AVAILABLE = True
 except ImportError:
     SCORER_AVAILABLE = False
     TEST_CASES = []
 
-app = Flask(__name__)
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from rcssmin import cssmin
+except ImportError:
+    cssmin = None
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Assets are served from memory by static_asset(), not from a static folder
+app = Flask(__name__, static_folder=None)
 CORS(app)
 
+# Compress JSON API responses on the fly when Flask-Compress is installed; the
+# page and static assets are precompressed at import and already carry a
+# Content-Encoding, so they are passed through untouched
+if Compress is not None:
+    app.config.update(COMPRESS_MIMETYPES=['application/json'], COMPRESS_LEVEL=6, COMPRESS_MIN_SIZE=512)
+    Compress(app)
+
+# Encode responses with orjson when it is installed; jsonify() then goes
+# through it for every RiskReport payload.
+if orjson is not None:
+    class ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # =============================================================================
 # EMBEDDED FRONTEND HTML
 # =============================================================================
@@ -49,6 +107,8 @@ FRONTEND_HTML = '''<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Sherlock Homes - Single Family Home Loan Underwriting</title>
+    <link rel="preconnect" href="https://images.unsplash.com">
+    <link rel="dns-prefetch" href="https://images.unsplash.com">
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
         :root {
@@ -229,15 +289,6 @@ FRONTEND_HTML = '''<!DOCTYPE html>
         .analysis-value { font-weight: 600; }
         .analysis-value.positive { color: var(--accent); }
         .analysis-value.warning { color: var(--warning); }
-        .features { background: white; padding: 4rem 2rem; }
-        .features-container { max-width: 1200px; margin: 0 auto; }
-        .features-title { text-align: center; font-size: 2rem; margin-bottom: 3rem; }
-        .features-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 2rem; }
-        .feature-card { padding: 2rem; border-radius: 12px; background: var(--bg-light); text-align: center; }
-        .feature-icon { width: 60px; height: 60px; background: var(--primary); border-radius: 12px; display: flex; align-items: center; justify-content: center; margin: 0 auto 1rem; }
-        .feature-icon svg { width: 30px; height: 30px; color: white; stroke: white; }
-        .feature-card h3 { margin-bottom: 0.5rem; }
-        .feature-card p { color: var(--text-gray); font-size: 0.9rem; }
 
         /* Modal Styles */
         .modal-overlay {
@@ -250,37 +301,6 @@ FRONTEND_HTML = '''<!DOCTYPE html>
             justify-content: center;
         }
         .modal-overlay.active { display: flex; }
-        .modal {
-            background: white;
-            border-radius: 16px;
-            padding: 2rem;
-            max-width: 600px;
-            width: 90%;
-            max-height: 90vh;
-            overflow-y: auto;
-        }
-        .modal-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem; }
-        .modal-close { background: none; border: none; font-size: 1.5rem; cursor: pointer; color: var(--text-gray); }
-        .modal-section { margin-bottom: 1.5rem; padding-bottom: 1.5rem; border-bottom: 1px solid #e2e8f0; }
-        .modal-section:last-of-type { border-bottom: none; margin-bottom: 0; padding-bottom: 0; }
-        .modal-section h4 { margin-bottom: 1rem; color: var(--text-gray); font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.05em; }
-        .report-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; }
-        .report-item { background: var(--bg-light); padding: 1rem; border-radius: 8px; }
-        .report-item-label { font-size: 0.8rem; color: var(--text-gray); margin-bottom: 0.25rem; }
-        .report-item-value { font-weight: 600; font-size: 1.1rem; }
-        .ai-notes { background: var(--secondary); color: white; padding: 1.5rem; border-radius: 8px; }
-        .ai-notes h5 { margin-bottom: 0.75rem; display: flex; align-items: center; gap: 0.5rem; }
-        .ai-notes-content { white-space: pre-wrap; line-height: 1.6; opacity: 0.9; }
-        .risk-summary { text-align: center; padding: 1.5rem; background: var(--bg-light); border-radius: 12px; margin-bottom: 1.5rem; }
-        .risk-score-display { font-size: 3rem; font-weight: 700; }
-        .risk-category { font-size: 1.1rem; font-weight: 600; }
-        .recommendation-badge { display: inline-block; margin-top: 1rem; padding: 0.5rem 1rem; border-radius: 20px; font-weight: 600; }
-        .breakdown-item { display: flex; justify-content: space-between; padding: 0.75rem; background: var(--bg-light); border-radius: 8px; margin-bottom: 0.5rem; }
-        .breakdown-item span:last-child { font-weight: 600; }
-        .loading { display: inline-block; width: 20px; height: 20px; border: 2px solid rgba(255,255,255,0.3); border-radius: 50%; border-top-color: white; animation: spin 1s linear infinite; }
-        @keyframes spin { to { transform: rotate(360deg); } }
-        footer { background: var(--secondary); color: white; padding: 2rem; text-align: center; }
-        footer p { opacity: 0.7; }
         @media (max-width: 1024px) { .main-content { grid-template-columns: 1fr; } }
         @media (max-width: 768px) {
             .hero h1 { font-size: 2rem; }
@@ -288,11 +308,20 @@ FRONTEND_HTML = '''<!DOCTYPE html>
             .nav-links { display: none; }
             .applications { grid-template-columns: 1fr; }
             .form-row { grid-template-columns: 1fr; }
-            .report-grid { grid-template-columns: 1fr 1fr; }
         }
     </style>
+    <!--app-css-->
+    <!--app-js-->
 </head>
 <body>
+    <svg width="0" height="0" style="position: absolute" aria-hidden="true">
+        <defs>
+            <symbol id="icon-pin" viewBox="0 0 24 24">
+                <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0118 0z"/>
+                <circle cx="12" cy="10" r="3"/>
+            </symbol>
+        </defs>
+    </svg>
     <nav>
         <div class="logo">
             <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
@@ -306,7 +335,7 @@ FRONTEND_HTML = '''<!DOCTYPE html>
             <li><a href="#">Applications</a></li>
             <li><a href="#">Settings</a></li>
         </ul>
-        <button class="nav-btn" onclick="openModal()">+ New Loan Application</button>
+        <button class="nav-btn" data-action="open-app">+ New Loan Application</button>
     </nav>
 
     <section class="hero">
@@ -334,141 +363,7 @@ FRONTEND_HTML = '''<!DOCTYPE html>
                 Recent Loan Applications
             </h2>
             <div class="applications">
-                <div class="app-card">
-                    <img src="https://images.unsplash.com/photo-1564013799919-ab600027ffc6?w=400&h=300&fit=crop" alt="Property" class="app-card-image">
-                    <div class="app-card-content">
-                        <div class="app-header">
-                            <div>
-                                <div class="app-id">LN-2024-08472</div>
-                                <div class="app-type">30-Year Fixed Conventional</div>
-                            </div>
-                            <span class="status-badge status-approved">Approved</span>
-                        </div>
-                        <div class="app-address">
-                            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0118 0z"/>
-                                <circle cx="12" cy="10" r="3"/>
-                            </svg>
-                            1847 Oak Valley Dr, Austin, TX
-                        </div>
-                        <div class="app-details">
-                            <div class="detail-item"><div class="detail-label">Borrower</div><div class="detail-value">James Morrison</div></div>
-                            <div class="detail-item"><div class="detail-label">Loan Amount</div><div class="detail-value">$1,420,000</div></div>
-                            <div class="detail-item"><div class="detail-label">Property Value</div><div class="detail-value">$1,775,000</div></div>
-                            <div class="detail-item"><div class="detail-label">LTV</div><div class="detail-value">80.0%</div></div>
-                        </div>
-                        <div class="risk-score">
-                            <span class="detail-label">Risk: 18</span>
-                            <div class="risk-bar"><div class="risk-fill risk-low" style="width: 18%"></div></div>
-                        </div>
-                        <div class="card-actions">
-                            <button class="card-btn btn-details" onclick="showDetails('LN-2024-08472')">View Details</button>
-                            <button class="card-btn btn-report" onclick="viewReport('LN-2024-08472')">View Report</button>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="app-card">
-                    <img src="https://images.unsplash.com/photo-1600596542815-ffad4c1539a9?w=400&h=300&fit=crop" alt="Property" class="app-card-image">
-                    <div class="app-card-content">
-                        <div class="app-header">
-                            <div>
-                                <div class="app-id">LN-2024-08471</div>
-                                <div class="app-type">15-Year Fixed Conventional</div>
-                            </div>
-                            <span class="status-badge status-pending">Pending Docs</span>
-                        </div>
-                        <div class="app-address">
-                            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0118 0z"/>
-                                <circle cx="12" cy="10" r="3"/>
-                            </svg>
-                            2234 Maple Creek Ln, Denver, CO
-                        </div>
-                        <div class="app-details">
-                            <div class="detail-item"><div class="detail-label">Borrower</div><div class="detail-value">Sarah Chen</div></div>
-                            <div class="detail-item"><div class="detail-label">Loan Amount</div><div class="detail-value">$960,000</div></div>
-                            <div class="detail-item"><div class="detail-label">Property Value</div><div class="detail-value">$1,280,000</div></div>
-                            <div class="detail-item"><div class="detail-label">LTV</div><div class="detail-value">75.0%</div></div>
-                        </div>
-                        <div class="risk-score">
-                            <span class="detail-label">Risk: 32</span>
-                            <div class="risk-bar"><div class="risk-fill risk-low" style="width: 32%"></div></div>
-                        </div>
-                        <div class="card-actions">
-                            <button class="card-btn btn-details" onclick="showDetails('LN-2024-08471')">View Details</button>
-                            <button class="card-btn btn-report" onclick="viewReport('LN-2024-08471')">View Report</button>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="app-card">
-                    <img src="https://images.unsplash.com/photo-1600585154340-be6161a56a0c?w=400&h=300&fit=crop" alt="Property" class="app-card-image">
-                    <div class="app-card-content">
-                        <div class="app-header">
-                            <div>
-                                <div class="app-id">LN-2024-08470</div>
-                                <div class="app-type">30-Year Fixed FHA</div>
-                            </div>
-                            <span class="status-badge status-review">Under Review</span>
-                        </div>
-                        <div class="app-address">
-                            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0118 0z"/>
-                                <circle cx="12" cy="10" r="3"/>
-                            </svg>
-                            789 Sunset Blvd, Phoenix, AZ
-                        </div>
-                        <div class="app-details">
-                            <div class="detail-item"><div class="detail-label">Borrower</div><div class="detail-value">Michael Torres</div></div>
-                            <div class="detail-item"><div class="detail-label">Loan Amount</div><div class="detail-value">$825,000</div></div>
-                            <div class="detail-item"><div class="detail-label">Property Value</div><div class="detail-value">$865,000</div></div>
-                            <div class="detail-item"><div class="detail-label">LTV</div><div class="detail-value">95.4%</div></div>
-                        </div>
-                        <div class="risk-score">
-                            <span class="detail-label">Risk: 58</span>
-                            <div class="risk-bar"><div class="risk-fill risk-medium" style="width: 58%"></div></div>
-                        </div>
-                        <div class="card-actions">
-                            <button class="card-btn btn-details" onclick="showDetails('LN-2024-08470')">View Details</button>
-                            <button class="card-btn btn-report" onclick="viewReport('LN-2024-08470')">View Report</button>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="app-card">
-                    <img src="https://images.unsplash.com/photo-1605276374104-dee2a0ed3cd6?w=400&h=300&fit=crop" alt="Property" class="app-card-image">
-                    <div class="app-card-content">
-                        <div class="app-header">
-                            <div>
-                                <div class="app-id">LN-2024-08469</div>
-                                <div class="app-type">30-Year Fixed Conventional</div>
-                            </div>
-                            <span class="status-badge status-declined">Declined</span>
-                        </div>
-                        <div class="app-address">
-                            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0118 0z"/>
-                                <circle cx="12" cy="10" r="3"/>
-                            </svg>
-                            456 Pine Ridge Way, Seattle, WA
-                        </div>
-                        <div class="app-details">
-                            <div class="detail-item"><div class="detail-label">Borrower</div><div class="detail-value">Robert Blake</div></div>
-                            <div class="detail-item"><div class="detail-label">Loan Amount</div><div class="detail-value">$2,150,000</div></div>
-                            <div class="detail-item"><div class="detail-label">Property Value</div><div class="detail-value">$2,250,000</div></div>
-                            <div class="detail-item"><div class="detail-label">LTV</div><div class="detail-value">95.6%</div></div>
-                        </div>
-                        <div class="risk-score">
-                            <span class="detail-label">Risk: 84</span>
-                            <div class="risk-bar"><div class="risk-fill risk-high" style="width: 84%"></div></div>
-                        </div>
-                        <div class="card-actions">
-                            <button class="card-btn btn-details" onclick="showDetails('LN-2024-08469')">View Details</button>
-                            <button class="card-btn btn-report" onclick="viewReport('LN-2024-08469')">View Report</button>
-                        </div>
-                    </div>
-                </div>
+                <!--app-cards-->
             </div>
         </div>
 
@@ -481,7 +376,7 @@ FRONTEND_HTML = '''<!DOCTYPE html>
                     </svg>
                     Quick Pre-Qualification
                 </h3>
-                <form id="quickForm" onsubmit="runQuickAssessment(event)">
+                <form id="quickForm" data-submit="quick-assess">
                     <div class="form-group">
                         <label>Credit Score</label>
                         <input type="number" id="qf_credit" placeholder="e.g., 720" min="300" max="850" required>
@@ -560,14 +455,25 @@ FRONTEND_HTML = '''<!DOCTYPE html>
         </div>
     </section>
 
+    <footer>
+        <p>&copy; 2026 Sherlock Homes. Single Family Home Loan Underwriting Platform.</p>
+    </footer>
+    <!--app-css-apply-->
+</body>
+</html>'''
+
+# Markup for the application and report modals. Neither is visible until the
+# user opens it, so it is fetched by the page script instead of parsed with
+# the initial HTML
+APP_MODALS_HTML = '''
     <!-- New Application Modal -->
     <div class="modal-overlay" id="appModal">
         <div class="modal">
             <div class="modal-header">
                 <h3>New Loan Application</h3>
-                <button class="modal-close" onclick="closeModal()">&times;</button>
+                <button class="modal-close" data-action="close-app">&times;</button>
             </div>
-            <form id="appForm" onsubmit="submitApplication(event)">
+            <form id="appForm" data-submit="submit-app">
                 <div class="modal-section">
                     <h4>Borrower Information</h4>
                     <div class="form-group">
@@ -649,7 +555,7 @@ FRONTEND_HTML = '''<!DOCTYPE html>
         <div class="modal" style="max-width: 700px;">
             <div class="modal-header">
                 <h3>AI Underwriting Report - <span id="reportAppId"></span></h3>
-                <button class="modal-close" onclick="closeReportModal()">&times;</button>
+                <button class="modal-close" data-action="close-report">&times;</button>
             </div>
 
             <div class="risk-summary">
@@ -690,150 +596,555 @@ FRONTEND_HTML = '''<!DOCTYPE html>
             </div>
 
             <div style="text-align: center; margin-top: 1rem;">
-                <button class="submit-btn" style="width: auto; padding: 0.75rem 2rem;" onclick="window.print()">Print Report</button>
+                <button class="submit-btn" style="width: auto; padding: 0.75rem 2rem;" data-action="print">Print Report</button>
             </div>
         </div>
     </div>
-
-    <footer>
-        <p>&copy; 2026 Sherlock Homes. Single Family Home Loan Underwriting Platform.</p>
-    </footer>
-
-    <script>
-        function openModal() { document.getElementById('appModal').classList.add('active'); }
-        function closeModal() { document.getElementById('appModal').classList.remove('active'); }
-        function closeReportModal() { document.getElementById('reportModal').classList.remove('active'); }
-
-        function showDetails(appId) { alert('Viewing details for ' + appId); }
-
-        async function viewReport(appId) {
-            document.getElementById('reportAppId').textContent = appId;
-            try {
-                const response = await fetch('/api/test-cases/' + appId);
-                const result = await response.json();
-                if (result.status === 'success') {
-                    displayReport(result.report, result.case);
-                }
-            } catch (e) { console.log('Using static data'); }
-            document.getElementById('reportModal').classList.add('active');
-        }
-
-        function runQuickAssessment(e) {
-            e.preventDefault();
-            const credit = parseInt(document.getElementById('qf_credit').value);
-            const loan = parseFloat(document.getElementById('qf_loan').value);
-            const value = parseFloat(document.getElementById('qf_value').value);
-            const income = parseFloat(document.getElementById('qf_income').value);
-            const ltv = (loan / value * 100).toFixed(1);
-            const dti = ((loan * 0.006 + 500) / (income / 12) * 100).toFixed(1);
-            let risk = 'Low';
-            if (credit < 680 || ltv > 90 || dti > 43) risk = 'High';
-            else if (credit < 720 || ltv > 80 || dti > 36) risk = 'Medium';
-            alert('Quick Assessment Results:\\n\\nLTV: ' + ltv + '%\\nEst. DTI: ' + dti + '%\\nRisk Level: ' + risk);
-        }
-
-        async function submitApplication(e) {
-            e.preventDefault();
-            const btn = document.getElementById('submit_btn');
-            btn.innerHTML = '<div class="loading"></div> Processing...';
-            btn.disabled = true;
-
-            const formData = {
-                borrower_name: document.getElementById('borrower_name').value,
-                credit_score: parseInt(document.getElementById('credit_score').value),
-                annual_income: parseFloat(document.getElementById('annual_income').value),
-                monthly_debts: parseFloat(document.getElementById('monthly_debts').value),
-                employment_years: parseInt(document.getElementById('employment_years').value),
-                loan_amount: parseFloat(document.getElementById('loan_amount').value),
-                property_value: parseFloat(document.getElementById('property_value').value),
-                loan_type: document.getElementById('loan_type').value,
-                reserves_months: parseInt(document.getElementById('reserves_months').value),
-                property_address: document.getElementById('property_address').value,
-                linkedin_url: document.getElementById('linkedin_url').value || null
-            };
-
-            try {
-                const response = await fetch('/api/score', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(formData)
-                });
-                const result = await response.json();
-                if (result.status === 'success') {
-                    closeModal();
-                    displayReport(result.report, formData);
-                    document.getElementById('reportModal').classList.add('active');
-                } else {
-                    alert('Error: ' + (result.message || 'Failed to process'));
-                }
-            } catch (error) {
-                alert('Failed to connect to server');
-            } finally {
-                btn.innerHTML = 'Submit for AI Underwriting';
-                btn.disabled = false;
-            }
-        }
-
-        function displayReport(report, formData) {
-            document.getElementById('reportAppId').textContent = 'NEW-' + Date.now().toString().slice(-6);
-            const score = report.risk_score;
-            const scoreEl = document.getElementById('riskScoreDisplay');
-            const catEl = document.getElementById('riskCategory');
-            const recEl = document.getElementById('recommendation');
-
-            scoreEl.textContent = score;
-            catEl.textContent = report.risk_category;
-
-            if (score <= 30) { scoreEl.style.color = 'var(--accent)'; recEl.style.background = '#d1fae5'; recEl.style.color = '#065f46'; recEl.textContent = 'APPROVE'; }
-            else if (score <= 50) { scoreEl.style.color = 'var(--warning)'; recEl.style.background = '#fef3c7'; recEl.style.color = '#92400e'; recEl.textContent = 'CONDITIONAL'; }
-            else if (score <= 70) { scoreEl.style.color = '#f97316'; recEl.style.background = '#ffedd5'; recEl.style.color = '#9a3412'; recEl.textContent = 'REVIEW'; }
-            else { scoreEl.style.color = 'var(--danger)'; recEl.style.background = '#fee2e2'; recEl.style.color = '#991b1b'; recEl.textContent = 'DECLINE'; }
-
-            document.getElementById('rptBorrower').textContent = formData.borrower_name || formData.borrower || '--';
-            document.getElementById('rptLoanAmount').textContent = formatCurrency(formData.loan_amount);
-            document.getElementById('rptPropertyValue').textContent = formatCurrency(formData.property_value);
-            document.getElementById('rptLTV').textContent = (report.ltv || 0).toFixed(1) + '%';
-            document.getElementById('rptDTI').textContent = (report.dti || 0).toFixed(1) + '%';
-            document.getElementById('rptLoanType').textContent = formData.loan_type;
-
-            if (report.score_breakdown) {
-                const bd = report.score_breakdown;
-                document.getElementById('bdCredit').textContent = bd.credit_risk.toFixed(1) + ' pts';
-                document.getElementById('bdDTI').textContent = bd.dti_risk.toFixed(1) + ' pts';
-                document.getElementById('bdLTV').textContent = bd.ltv_risk.toFixed(1) + ' pts';
-                document.getElementById('bdEmployment').textContent = bd.employment_risk.toFixed(1) + ' pts';
-                document.getElementById('bdReserves').textContent = bd.reserves_risk.toFixed(1) + ' pts';
-                const mod = bd.feature_modifiers || 0;
-                document.getElementById('bdModifiers').textContent = (mod >= 0 ? '+' : '') + mod.toFixed(1) + ' pts';
-            }
-
-            const analysisEl = document.getElementById('rptAnalysis');
-            if (report.ai_analysis && !report.ai_analysis.includes('not configured')) {
-                analysisEl.textContent = report.ai_analysis;
-            } else {
-                let notes = [];
-                const cs = formData.credit_score || report.credit_score;
-                if (cs >= 740) notes.push('Excellent credit score indicates strong repayment history.');
-                else if (cs >= 680) notes.push('Good credit score meets conventional loan requirements.');
-                else notes.push('Credit score below optimal range.');
-                if (report.dti <= 36) notes.push('DTI ratio within healthy limits.');
-                else if (report.dti <= 43) notes.push('DTI ratio approaching upper limits.');
-                else notes.push('High DTI ratio presents risk.');
-                if (report.ltv <= 80) notes.push('Strong LTV - no PMI required.');
-                analysisEl.textContent = notes.join('\\n\\n');
+'''
+
+# Rules not needed for the first paint (features section, modal contents,
+# footer); served as a separate stylesheet that loads without blocking render
+APP_CSS = '''
+.features { background: white; padding: 4rem 2rem; }
+.features-container { max-width: 1200px; margin: 0 auto; }
+.features-title { text-align: center; font-size: 2rem; margin-bottom: 3rem; }
+.features-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 2rem; }
+.feature-card { padding: 2rem; border-radius: 12px; background: var(--bg-light); text-align: center; }
+.feature-icon { width: 60px; height: 60px; background: var(--primary); border-radius: 12px; display: flex; align-items: center; justify-content: center; margin: 0 auto 1rem; }
+.feature-icon svg { width: 30px; height: 30px; color: white; stroke: white; }
+.feature-card h3 { margin-bottom: 0.5rem; }
+.feature-card p { color: var(--text-gray); font-size: 0.9rem; }
+
+.modal {
+    background: white;
+    border-radius: 16px;
+    padding: 2rem;
+    max-width: 600px;
+    width: 90%;
+    max-height: 90vh;
+    overflow-y: auto;
+}
+.modal-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem; }
+.modal-close { background: none; border: none; font-size: 1.5rem; cursor: pointer; color: var(--text-gray); }
+.modal-section { margin-bottom: 1.5rem; padding-bottom: 1.5rem; border-bottom: 1px solid #e2e8f0; }
+.modal-section:last-of-type { border-bottom: none; margin-bottom: 0; padding-bottom: 0; }
+.modal-section h4 { margin-bottom: 1rem; color: var(--text-gray); font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.05em; }
+.report-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; }
+.report-item { background: var(--bg-light); padding: 1rem; border-radius: 8px; }
+.report-item-label { font-size: 0.8rem; color: var(--text-gray); margin-bottom: 0.25rem; }
+.report-item-value { font-weight: 600; font-size: 1.1rem; }
+.ai-notes { background: var(--secondary); color: white; padding: 1.5rem; border-radius: 8px; }
+.ai-notes h5 { margin-bottom: 0.75rem; display: flex; align-items: center; gap: 0.5rem; }
+.ai-notes-content { white-space: pre-wrap; line-height: 1.6; opacity: 0.9; }
+.risk-summary { text-align: center; padding: 1.5rem; background: var(--bg-light); border-radius: 12px; margin-bottom: 1.5rem; }
+.risk-score-display { font-size: 3rem; font-weight: 700; }
+.risk-category { font-size: 1.1rem; font-weight: 600; }
+.recommendation-badge { display: inline-block; margin-top: 1rem; padding: 0.5rem 1rem; border-radius: 20px; font-weight: 600; }
+.status-caution { background: #ffedd5; color: #9a3412; }
+.breakdown-item { display: flex; justify-content: space-between; padding: 0.75rem; background: var(--bg-light); border-radius: 8px; margin-bottom: 0.5rem; }
+.breakdown-item span:last-child { font-weight: 600; }
+.loading { display: inline-block; width: 20px; height: 20px; border: 2px solid rgba(255,255,255,0.3); border-radius: 50%; border-top-color: white; animation: spin 1s linear infinite; }
+@keyframes spin { to { transform: rotate(360deg); } }
+footer { background: var(--secondary); color: white; padding: 2rem; text-align: center; }
+footer p { opacity: 0.7; }
+@media (max-width: 768px) {
+    .report-grid { grid-template-columns: 1fr 1fr; }
+}
+'''
+
+# Page behaviour, served as a deferred, cacheable script (no inline handlers)
+APP_JS = '''
+// Elements are looked up by id once and reused: the quick assessment form is
+// in the page, the modal elements are added once their markup is inserted
+const QUICK_EL = {
+    credit: document.getElementById('qf_credit'),
+    loan: document.getElementById('qf_loan'),
+    value: document.getElementById('qf_value'),
+    income: document.getElementById('qf_income')
+};
+const MODAL_EL = {};
+
+// The modals are not part of the initial page; fetch their markup once, on
+// first use or after the page has loaded, whichever comes first
+let modalsLoaded = null;
+function loadModals() {
+    if (!modalsLoaded) {
+        modalsLoaded = fetch('<!--app-modals-->')
+            .then(function(response) { return response.text(); })
+            .then(function(html) {
+                document.body.insertAdjacentHTML('beforeend', html);
+                document.querySelectorAll('.modal-overlay, .modal-overlay [id]').forEach(function(el) { MODAL_EL[el.id] = el; });
+            })
+            .catch(function(error) { modalsLoaded = null; throw error; });
+    }
+    return modalsLoaded;
+}
+function hideModal(id) {
+    const modal = MODAL_EL[id];
+    if (modal) modal.classList.remove('active');
+}
+
+async function openModal() {
+    await loadModals();
+    MODAL_EL.appModal.classList.add('active');
+}
+function closeModal() { hideModal('appModal'); }
+function closeReportModal() { hideModal('reportModal'); }
+
+function showDetails(appId) { alert('Viewing details for ' + appId); }
+
+// Recently viewed test-case reports, oldest first, so reopening one skips the request
+const REPORT_CACHE = new Map();
+const REPORT_CACHE_SIZE = 20;
+
+async function viewReport(appId) {
+    await loadModals();
+    MODAL_EL.reportAppId.textContent = appId;
+    let result = REPORT_CACHE.get(appId);
+    if (!result) {
+        try {
+            const response = await fetch('/api/test-cases/' + appId);
+            result = await response.json();
+            if (result.status === 'success') {
+                if (REPORT_CACHE.size >= REPORT_CACHE_SIZE) REPORT_CACHE.delete(REPORT_CACHE.keys().next().value);
+                REPORT_CACHE.set(appId, result);
             }
+        } catch (e) { console.log('Using static data'); }
+    }
+    if (result && result.status === 'success') {
+        displayReport(result.report, result.case);
+    }
+    MODAL_EL.reportModal.classList.add('active');
+}
+
+function runQuickAssessment(e) {
+    e.preventDefault();
+    const credit = parseInt(QUICK_EL.credit.value);
+    const loan = parseFloat(QUICK_EL.loan.value);
+    const value = parseFloat(QUICK_EL.value.value);
+    const income = parseFloat(QUICK_EL.income.value);
+    const ltv = (loan / value * 100).toFixed(1);
+    const dti = ((loan * 0.006 + 500) / (income / 12) * 100).toFixed(1);
+    let risk = 'Low';
+    if (credit < 680 || ltv > 90 || dti > 43) risk = 'High';
+    else if (credit < 720 || ltv > 80 || dti > 36) risk = 'Medium';
+    alert('Quick Assessment Results:\\n\\nLTV: ' + ltv + '%\\nEst. DTI: ' + dti + '%\\nRisk Level: ' + risk);
+}
+
+// Set while a submission is in flight, so repeated submits don't score twice
+let submitting = false;
+
+async function submitApplication(e) {
+    e.preventDefault();
+    if (submitting) return;
+    submitting = true;
+    const btn = MODAL_EL.submit_btn;
+    btn.innerHTML = '<div class="loading"></div> Processing...';
+    btn.disabled = true;
+
+    const formData = {
+        borrower_name: MODAL_EL.borrower_name.value,
+        credit_score: parseInt(MODAL_EL.credit_score.value),
+        annual_income: parseFloat(MODAL_EL.annual_income.value),
+        monthly_debts: parseFloat(MODAL_EL.monthly_debts.value),
+        employment_years: parseInt(MODAL_EL.employment_years.value),
+        loan_amount: parseFloat(MODAL_EL.loan_amount.value),
+        property_value: parseFloat(MODAL_EL.property_value.value),
+        loan_type: MODAL_EL.loan_type.value,
+        reserves_months: parseInt(MODAL_EL.reserves_months.value),
+        property_address: MODAL_EL.property_address.value,
+        linkedin_url: MODAL_EL.linkedin_url.value || null
+    };
+
+    try {
+        const response = await fetch('/api/score', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(formData)
+        });
+        const result = await response.json();
+        if (result.status === 'success') {
+            closeModal();
+            displayReport(result.report, formData);
+            MODAL_EL.reportModal.classList.add('active');
+        } else {
+            alert('Error: ' + (result.message || 'Failed to process'));
         }
-
-        function formatCurrency(amount) {
-            return new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD', minimumFractionDigits: 0, maximumFractionDigits: 0 }).format(amount);
-        }
-
-        document.getElementById('appModal').addEventListener('click', function(e) { if (e.target === this) closeModal(); });
-        document.getElementById('reportModal').addEventListener('click', function(e) { if (e.target === this) closeReportModal(); });
-        document.addEventListener('keydown', function(e) { if (e.key === 'Escape') { closeModal(); closeReportModal(); } });
-    </script>
-</body>
-</html>'''
+    } catch (error) {
+        alert('Failed to connect to server');
+    } finally {
+        btn.innerHTML = 'Submit for AI Underwriting';
+        btn.disabled = false;
+        submitting = false;
+    }
+}
+
+// Recommendation tiers, in order of their upper risk-score bound: [max score, score colour, badge class, label]
+const RISK_TIERS = [
+    [30, 'var(--accent)', 'status-approved', 'APPROVE'],
+    [50, 'var(--warning)', 'status-pending', 'CONDITIONAL'],
+    [70, '#f97316', 'status-caution', 'REVIEW'],
+    [Infinity, 'var(--danger)', 'status-declined', 'DECLINE']
+];
+
+// Sequence number for the reference shown on each displayed report
+let reportSeq = 0;
+
+function displayReport(report, formData) {
+    MODAL_EL.reportAppId.textContent = 'NEW-' + String(++reportSeq).padStart(6, '0');
+    const score = report.risk_score;
+    const scoreEl = MODAL_EL.riskScoreDisplay;
+    const catEl = MODAL_EL.riskCategory;
+    const recEl = MODAL_EL.recommendation;
+
+    scoreEl.textContent = score;
+    catEl.textContent = report.risk_category;
+
+    const tier = RISK_TIERS.find(function(t) { return score <= t[0]; });
+    scoreEl.style.color = tier[1];
+    recEl.className = 'recommendation-badge ' + tier[2];
+    recEl.textContent = tier[3];
+
+    MODAL_EL.rptBorrower.textContent = formData.borrower_name || formData.borrower || '--';
+    MODAL_EL.rptLoanAmount.textContent = formatCurrency(formData.loan_amount);
+    MODAL_EL.rptPropertyValue.textContent = formatCurrency(formData.property_value);
+    MODAL_EL.rptLTV.textContent = (report.ltv || 0).toFixed(1) + '%';
+    MODAL_EL.rptDTI.textContent = (report.dti || 0).toFixed(1) + '%';
+    MODAL_EL.rptLoanType.textContent = formData.loan_type;
+
+    if (report.score_breakdown) {
+        const bd = report.score_breakdown;
+        MODAL_EL.bdCredit.textContent = bd.credit_risk.toFixed(1) + ' pts';
+        MODAL_EL.bdDTI.textContent = bd.dti_risk.toFixed(1) + ' pts';
+        MODAL_EL.bdLTV.textContent = bd.ltv_risk.toFixed(1) + ' pts';
+        MODAL_EL.bdEmployment.textContent = bd.employment_risk.toFixed(1) + ' pts';
+        MODAL_EL.bdReserves.textContent = bd.reserves_risk.toFixed(1) + ' pts';
+        const mod = bd.feature_modifiers || 0;
+        MODAL_EL.bdModifiers.textContent = (mod >= 0 ? '+' : '') + mod.toFixed(1) + ' pts';
+    }
+
+    const analysisEl = MODAL_EL.rptAnalysis;
+    if (report.ai_analysis && !report.ai_analysis.includes('not configured')) {
+        analysisEl.textContent = report.ai_analysis;
+    } else {
+        let notes = [];
+        const cs = formData.credit_score || report.credit_score;
+        if (cs >= 740) notes.push('Excellent credit score indicates strong repayment history.');
+        else if (cs >= 680) notes.push('Good credit score meets conventional loan requirements.');
+        else notes.push('Credit score below optimal range.');
+        if (report.dti <= 36) notes.push('DTI ratio within healthy limits.');
+        else if (report.dti <= 43) notes.push('DTI ratio approaching upper limits.');
+        else notes.push('High DTI ratio presents risk.');
+        if (report.ltv <= 80) notes.push('Strong LTV - no PMI required.');
+        analysisEl.textContent = notes.join('\\n\\n');
+    }
+}
+
+const USD_FORMAT = new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD', minimumFractionDigits: 0, maximumFractionDigits: 0 });
+function formatCurrency(amount) {
+    return USD_FORMAT.format(amount);
+}
+
+// One delegated listener per event type instead of inline handlers on each element
+const CLICK_ACTIONS = {
+    'open-app': openModal,
+    'close-app': closeModal,
+    'close-report': closeReportModal,
+    'details': showDetails,
+    'report': viewReport,
+    'print': function() { window.print(); }
+};
+const SUBMIT_ACTIONS = {
+    'quick-assess': runQuickAssessment,
+    'submit-app': submitApplication
+};
+// Click and keydown handlers never cancel the event, so they are registered
+// passive; the submit handlers call preventDefault() and cannot be
+document.addEventListener('click', function(e) {
+    // A click on a modal's backdrop, outside the dialog itself, closes it
+    if (e.target.classList.contains('modal-overlay')) { hideModal(e.target.id); return; }
+    const el = e.target.closest('[data-action]');
+    if (el && CLICK_ACTIONS[el.dataset.action]) CLICK_ACTIONS[el.dataset.action](el.dataset.id);
+}, { passive: true });
+document.addEventListener('submit', function(e) {
+    const handler = SUBMIT_ACTIONS[e.target.dataset.submit];
+    if (handler) handler(e);
+});
+
+document.addEventListener('keydown', function(e) { if (e.key === 'Escape') { closeModal(); closeReportModal(); } }, { passive: true });
+window.addEventListener('load', function() { loadModals().catch(function() {}); }, { once: true });
+'''
+
+
+# Dashboard cards, keyed like risk_scorer.TEST_CASES so "View Report" can find
+# each one; rendered into FRONTEND_HTML once at import
+SEED_APPS = [
+    {
+        "id": "LN-2024-08472",
+        "borrower": "James Morrison",
+        "loan_type": "30-Year Fixed Conventional",
+        "loan_amount": 1420000,
+        "property_value": 1775000,
+        "ltv": 80.0,
+        "property_address": "1847 Oak Valley Dr, Austin, TX",
+        "status": "Approved",
+        "current_risk_score": 18,
+        "risk_level": "low",
+        "photo": "1564013799919-ab600027ffc6",
+    },
+    {
+        "id": "LN-2024-08471",
+        "borrower": "Sarah Chen",
+        "loan_type": "15-Year Fixed Conventional",
+        "loan_amount": 960000,
+        "property_value": 1280000,
+        "ltv": 75.0,
+        "property_address": "2234 Maple Creek Ln, Denver, CO",
+        "status": "Pending Docs",
+        "current_risk_score": 32,
+        "risk_level": "low",
+        "photo": "1600596542815-ffad4c1539a9",
+    },
+    {
+        "id": "LN-2024-08470",
+        "borrower": "Michael Torres",
+        "loan_type": "30-Year Fixed FHA",
+        "loan_amount": 825000,
+        "property_value": 865000,
+        "ltv": 95.4,
+        "property_address": "789 Sunset Blvd, Phoenix, AZ",
+        "status": "Under Review",
+        "current_risk_score": 58,
+        "risk_level": "medium",
+        "photo": "1600585154340-be6161a56a0c",
+    },
+    {
+        "id": "LN-2024-08469",
+        "borrower": "Robert Blake",
+        "loan_type": "30-Year Fixed Conventional",
+        "loan_amount": 2150000,
+        "property_value": 2250000,
+        "ltv": 95.6,
+        "property_address": "456 Pine Ridge Way, Seattle, WA",
+        "status": "Declined",
+        "current_risk_score": 84,
+        "risk_level": "high",
+        "photo": "1605276374104-dee2a0ed3cd6",
+    },
+]
+
+# CSS modifier for each application status badge
+STATUS_CLASSES = {
+    "Approved": "approved",
+    "Pending Docs": "pending",
+    "Under Review": "review",
+    "Declined": "declined",
+}
+
+# Card photos are cropped by Unsplash to the card's 5:2 box, at 1x and 2x
+_CARD_IMAGE_WIDTHS = (400, 800)
+_CARD_IMAGE_SIZES = '(max-width: 768px) 100vw, 400px'
+
+
+def _card_image_url(photo, width):
+    """Unsplash URL for a card photo at the given width."""
+    return f'https://images.unsplash.com/photo-{photo}?w={width}&h={width * 2 // 5}&fit=crop&auto=format'
+
+
+def _card_image_srcset(photo):
+    """srcset listing a card photo at every width in _CARD_IMAGE_WIDTHS."""
+    return ', '.join(f'{_card_image_url(photo, width)} {width}w' for width in _CARD_IMAGE_WIDTHS)
+
+
+_APP_CARDS_TEMPLATE = Environment(autoescape=True).from_string(
+    '''{% for app in apps %}{% if not loop.first %}
+{% endif %}                <div class="app-card">
+                    <img src="{{ card_image_url(app.photo, 400) }}"
+                         srcset="{{ card_image_srcset(app.photo) }}"
+                         sizes="{{ card_image_sizes }}"
+                         alt="Property" class="app-card-image" width="400" height="160"
+                         {% if loop.first %}fetchpriority="high"{% else %}loading="lazy" fetchpriority="low"{% endif %}
+                         decoding="async">
+                    <div class="app-card-content">
+                        <div class="app-header">
+                            <div>
+                                <div class="app-id">{{ app.id }}</div>
+                                <div class="app-type">{{ app.loan_type }}</div>
+                            </div>
+                            <span class="status-badge status-{{ status_classes[app.status] }}">{{ app.status }}</span>
+                        </div>
+                        <div class="app-address">
+                            <svg width="14" height="14" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-pin"/></svg>
+                            {{ app.property_address }}
+                        </div>
+                        <div class="app-details">
+                            <div class="detail-item"><div class="detail-label">Borrower</div><div class="detail-value">{{ app.borrower }}</div></div>
+                            <div class="detail-item"><div class="detail-label">Loan Amount</div><div class="detail-value">${{ "{:,}".format(app.loan_amount) }}</div></div>
+                            <div class="detail-item"><div class="detail-label">Property Value</div><div class="detail-value">${{ "{:,}".format(app.property_value) }}</div></div>
+                            <div class="detail-item"><div class="detail-label">LTV</div><div class="detail-value">{{ app.ltv }}%</div></div>
+                        </div>
+                        <div class="risk-score">
+                            <span class="detail-label">Risk: {{ app.current_risk_score }}</span>
+                            <div class="risk-bar"><div class="risk-fill risk-{{ app.risk_level }}" style="width: {{ app.current_risk_score }}%"></div></div>
+                        </div>
+                        <div class="card-actions">
+                            <button class="card-btn btn-details" data-action="details" data-id="{{ app.id }}">View Details</button>
+                            <button class="card-btn btn-report" data-action="report" data-id="{{ app.id }}">View Report</button>
+                        </div>
+                    </div>
+                </div>
+{% endfor %}''',
+    globals={
+        'card_image_url': _card_image_url,
+        'card_image_srcset': _card_image_srcset,
+        'card_image_sizes': _CARD_IMAGE_SIZES,
+    }
+)
+
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from the embedded stylesheet."""
+    if cssmin is not None:
+        return cssmin(css)
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+def _minify_html(html):
+    """
+    Drop comments and indentation from the page markup.
+
+    Each run of whitespace spanning a line break becomes a single newline, so
+    inline content keeps the separating whitespace it renders with.
+    """
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.S)
+    return re.sub(r'\s*\n\s*', '\n', html).strip()
+
+
+FRONTEND_HTML = FRONTEND_HTML.replace(
+    '                <!--app-cards-->\n',
+    _APP_CARDS_TEMPLATE.render(apps=SEED_APPS, status_classes=STATUS_CLASSES),
+    1
+)
+
+# Minify the <style> block once at import; it is shipped on every page load
+_style_start = FRONTEND_HTML.index('<style>') + len('<style>')
+_style_end = FRONTEND_HTML.index('</style>')
+FRONTEND_HTML = (
+    FRONTEND_HTML[:_style_start]
+    + _minify_css(FRONTEND_HTML[_style_start:_style_end])
+    + FRONTEND_HTML[_style_end:]
+)
+
+
+def _precompress(body, headers):
+    """
+    Encoded variants of a static body, best first and ending with identity.
+
+    Each entry is (encoding, bytes, complete response headers), so serving a
+    variant needs no per-request header assembly.
+    """
+    encoded = [('gzip', gzip.compress(body, compresslevel=9))]
+    if brotli is not None:
+        encoded.insert(0, ('br', brotli.compress(body, quality=11, mode=brotli.MODE_TEXT)))
+    encoded.append((None, body))
+
+    variants = []
+    for encoding, data in encoded:
+        variant_headers = dict(headers, Vary='Accept-Encoding')
+        if encoding:
+            variant_headers['Content-Encoding'] = encoding
+        variants.append((encoding, data, variant_headers))
+    return variants
+
+
+# Static assets, keyed by file name under /static/. Each URL carries its
+# content hash, so browsers can cache it indefinitely
+_STATIC_ASSETS = {}
+
+
+def _add_static_asset(extension, body, content_type):
+    """Register a hashed static asset and return its URL."""
+    digest = hashlib.blake2b(body, digest_size=6).hexdigest()
+    filename = f'app.{digest}.{extension}'
+    _STATIC_ASSETS[filename] = _precompress(body, {
+        'Content-Type': content_type,
+        'Cache-Control': 'public, max-age=31536000, immutable',
+    })
+    return f'/static/{filename}'
+
+
+# The deferred stylesheet is preloaded from <head> and applied by a <link> at
+# the end of <body>, which does not block rendering of the content above it
+# and needs no inline onload handler; the script is deferred, so it runs
+# after parsing just like the inline script it replaced. The modal markup URL
+# is baked into the script before it is hashed, so both stay cache-safe
+_APP_CSS_HREF = _add_static_asset('css', _minify_css(APP_CSS).encode('utf-8'), 'text/css; charset=utf-8')
+_APP_MODALS_HREF = _add_static_asset('html', _minify_html(APP_MODALS_HTML).encode('utf-8'), 'text/html; charset=utf-8')
+APP_JS = APP_JS.replace('<!--app-modals-->', _APP_MODALS_HREF, 1)
+_APP_JS_SRC = _add_static_asset('js', APP_JS.encode('utf-8'), 'text/javascript; charset=utf-8')
+FRONTEND_HTML = (
+    FRONTEND_HTML
+    .replace('<!--app-css-->', f'<link rel="preload" href="{_APP_CSS_HREF}" as="style">', 1)
+    .replace('<!--app-css-apply-->', f'<link rel="stylesheet" href="{_APP_CSS_HREF}">', 1)
+    .replace('<!--app-js-->', f'<script src="{_APP_JS_SRC}" defer></script>', 1)
+)
+FRONTEND_HTML = _minify_html(FRONTEND_HTML)
+
+# With no inline scripts or handlers left, scripts can be restricted to this
+# origin; inline styles are still used by the critical CSS and style attributes
+_CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "img-src 'self' https://images.unsplash.com; "
+    "style-src 'self' 'unsafe-inline'; "
+    "script-src 'self'"
+)
+
+# Preload hints repeated as a Link header, so proxies and CDNs that support
+# early hints can start these fetches before the page body arrives. The first
+# card image is the likely LCP element; its srcset/sizes come from the same
+# helpers as the <img> tag so the preloaded response is reused rather than
+# fetched twice.
+_LCP_PHOTO = SEED_APPS[0]["photo"]
+_FRONTEND_LINK = (
+    f'<{_APP_CSS_HREF}>; rel=preload; as=style; nopush, '
+    f'<{_card_image_url(_LCP_PHOTO, 400)}>; rel=preload; as=image; fetchpriority=high; '
+    f'imagesrcset="{_card_image_srcset(_LCP_PHOTO)}"; '
+    f'imagesizes="{_CARD_IMAGE_SIZES}"; nopush, '
+    '<https://images.unsplash.com>; rel=preconnect'
+)
+
+# The page is static, so encode, compress and build its headers once at
+# import instead of per request; index() serves the first variant the client
+# accepts, or a bodiless 304 when its cached copy is current
+_FRONTEND_BODY = FRONTEND_HTML.encode('utf-8')
+_FRONTEND_ETAG = hashlib.blake2b(_FRONTEND_BODY, digest_size=16).hexdigest()
+_FRONTEND_MODIFIED = datetime.fromtimestamp(int(os.path.getmtime(__file__)), timezone.utc)
+_FRONTEND_CACHE_HEADERS = {
+    'ETag': f'W/"{_FRONTEND_ETAG}"',
+    'Last-Modified': http_date(_FRONTEND_MODIFIED),
+    'Cache-Control': 'public, max-age=3600',
+}
+_FRONTEND_VARIANTS = _precompress(_FRONTEND_BODY, {
+    **_FRONTEND_CACHE_HEADERS,
+    'Content-Type': 'text/html; charset=utf-8',
+    'Content-Security-Policy': _CONTENT_SECURITY_POLICY,
+    'Link': _FRONTEND_LINK,
+})
+_FRONTEND_NOT_MODIFIED_HEADERS = dict(_FRONTEND_CACHE_HEADERS, Vary='Accept-Encoding')
+
+# Only the encoded bytes are served from here on; drop the source strings
+del FRONTEND_HTML, APP_MODALS_HTML, APP_CSS, APP_JS
+
+
+def _send_precompressed(variants):
+    """Respond with the first precompressed variant the client accepts."""
+    for encoding, data, headers in variants:
+        if encoding is None or request.accept_encodings[encoding]:
+            return Response(data, headers=headers)
 
 
 # =============================================================================
@@ -843,17 +1154,36 @@ FRONTEND_HTML = '''<!DOCTYPE html>
 @app.route('/')
 def index():
     """Serve the frontend."""
-    return Response(FRONTEND_HTML, mimetype='text/html')
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(_FRONTEND_ETAG)
+    else:
+        not_modified = request.if_modified_since is not None and request.if_modified_since >= _FRONTEND_MODIFIED
+    if not_modified:
+        return Response(status=304, headers=_FRONTEND_NOT_MODIFIED_HEADERS)
+    return _send_precompressed(_FRONTEND_VARIANTS)
+
+
+@app.route('/static/<filename>')
+def static_asset(filename):
+    """Serve a precompressed asset under its content-hashed URL."""
+    variants = _STATIC_ASSETS.get(filename)
+    if variants is None:
+        return Response(status=404)
+    return _send_precompressed(variants)
+
+
+# The health payload never changes; encode it once instead of on every probe
+_HEALTH_BODY = app.json.dumps({
+    "status": "ok",
+    "service": "Sherlock Homes API",
+    "scorer_available": SCORER_AVAILABLE
+}).encode('utf-8')
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        "status": "ok",
-        "service": "Sherlock Homes API",
-        "scorer_available": SCORER_AVAILABLE
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 @app.route('/api/score', methods=['POST'])
@@ -882,6 +1212,22 @@ def score_application():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+def _cacheable(response, reports):
+    """
+    Let clients cache a scored test-case response.
+
+    Reports for the static test cases are cached per process, so the body
+    only changes with the scorer; browsers revalidate with the ETag. A
+    response with a failed AI analysis is left uncacheable so it is retried.
+    """
+    if any(analysis_failed(report) for report in reports):
+        return response
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
+
+
 @app.route('/api/test-cases', methods=['GET'])
 def get_test_cases():
     """Get all test cases with their scores."""
@@ -889,12 +1235,13 @@ def get_test_cases():
         return jsonify({"status": "error", "message": "Scorer not available"}), 500
 
     try:
-        scorer = RiskScorer()
-        results = []
-        for case in TEST_CASES:
-            report = scorer.score_application(case)
-            results.append({"case": case, "report": report.to_dict()})
-        return jsonify({"status": "success", "results": results})
+        scorer = get_scorer()
+        reports = scorer.score_all_test_cases()
+        results = [
+            {"case": case, "report": report}
+            for case, report in zip(TEST_CASES, reports)
+        ]
+        return _cacheable(jsonify({"status": "success", "results": results}), reports)
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
@@ -910,9 +1257,9 @@ def get_test_case(case_id):
         if not case:
             return jsonify({"status": "error", "message": f"Case {case_id} not found"}), 404
 
-        scorer = RiskScorer()
-        report = scorer.score_application(case)
-        return jsonify({"status": "success", "case": case, "report": report.to_dict()})
+        scorer = get_scorer()
+        report = scorer.score_test_case(case)
+        return _cacheable(jsonify({"status": "success", "case": case, "report": report}), [report])
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
@@ -944,8 +1291,12 @@ if __name__ == '__main__':
         # Open browser in background thread
         threading.Thread(target=open_browser, daemon=True).start()
 
-        # Run Flask server
-        app.run(debug=False, port=5000, host='0.0.0.0')
+        # Serve with waitress when it is installed: a pool of worker threads
+        # and HTTP/1.1 keep-alive. Otherwise fall back to Flask's dev server
+        if serve is not None:
+            serve(app, host='0.0.0.0', port=5000, threads=8)
+        else:
+            app.run(debug=False, port=5000, host='0.0.0.0')
 
     except Exception as e:
         print()
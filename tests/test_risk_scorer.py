@@ -0,0 +1,102 @@
+"""
+Test the root risk scorer's report cache
+"""
+
+import time
+
+import pytest
+
+import risk_scorer
+from risk_scorer import AI_ANALYSIS_ERROR_PREFIX, RiskScorer, TEST_CASES
+
+
+class _FailingClient:
+    """Keywords AI client whose completions always fail"""
+
+    def complete(self, **kwargs):
+        raise ConnectionError("upstream unavailable")
+
+
+class _WorkingClient:
+    """Keywords AI client returning a fixed narrative"""
+
+    def complete(self, **kwargs):
+        return "Strong application."
+
+
+class _SlowClient:
+    """Keywords AI client that answers after the analysis timeout"""
+
+    def complete(self, **kwargs):
+        time.sleep(0.5)
+        return "Too late."
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    """Scorer with an empty report cache"""
+    monkeypatch.setattr(risk_scorer, "_SCORE_CACHE", {})
+    return RiskScorer()
+
+
+def test_failed_analysis_is_retried(scorer):
+    """A report whose AI analysis failed is not cached"""
+    case = TEST_CASES[0]
+
+    scorer.client = _FailingClient()
+    report = scorer.score_test_case(case)
+    assert report["ai_analysis"].startswith(AI_ANALYSIS_ERROR_PREFIX)
+    assert risk_scorer._SCORE_CACHE == {}
+
+    scorer.client = _WorkingClient()
+    assert scorer.score_test_case(case)["ai_analysis"] == "Strong application."
+    assert scorer.score_all_test_cases()[0]["ai_analysis"] == "Strong application."
+
+
+def test_failed_analysis_is_retried_in_batch(scorer):
+    """score_all_test_cases re-scores every case whose analysis failed"""
+    scorer.client = _FailingClient()
+    assert all(
+        report["ai_analysis"].startswith(AI_ANALYSIS_ERROR_PREFIX)
+        for report in scorer.score_all_test_cases()
+    )
+
+    scorer.client = _WorkingClient()
+    assert all(
+        report["ai_analysis"] == "Strong application."
+        for report in scorer.score_all_test_cases()
+    )
+
+
+def test_cached_reports_are_not_shared(scorer):
+    """Mutating a returned report's nested fields leaves the cache intact"""
+    case = TEST_CASES[0]
+
+    first = scorer.score_test_case(case)
+    credit_risk = first["score_breakdown"]["credit_risk"]
+    risk_factors = list(first["risk_factors"])
+    first["score_breakdown"]["credit_risk"] = 999
+    first["risk_factors"].append("INJECTED")
+
+    second = scorer.score_test_case(case)
+    assert second["score_breakdown"]["credit_risk"] == credit_risk
+    assert second["risk_factors"] == risk_factors
+
+    batch = scorer.score_all_test_cases()
+    batch[0]["modifier_breakdown"]["INJECTED"] = 1.0
+    batch[0]["positive_factors"].append("INJECTED")
+
+    third = scorer.score_all_test_cases()[0]
+    assert "INJECTED" not in third["modifier_breakdown"]
+    assert "INJECTED" not in third["positive_factors"]
+    assert third["score_breakdown"]["credit_risk"] == credit_risk
+
+
+def test_slow_analysis_times_out(scorer, monkeypatch):
+    """Serializing a report waits a bounded time and does not cache the timeout"""
+    monkeypatch.setattr(risk_scorer, "ANALYSIS_TIMEOUT_SECONDS", 0.05)
+    scorer.client = _SlowClient()
+
+    report = scorer.score_test_case(TEST_CASES[0])
+    assert report["ai_analysis"].startswith(AI_ANALYSIS_ERROR_PREFIX)
+    assert risk_scorer._SCORE_CACHE == {}